@@ -0,0 +1,341 @@
+"""
+AI Toolkit tasks, independent of Streamlit.
+
+The AI Toolkit page (sections/ai.py) and the offline load-test driver
+(load_test.py) both call these functions, so caching, streaming and
+concurrency behave the same in both. Functions take the shared client
+bundle from llm_clients and an optional on_text callback that receives the
+text so far while a response streams in. Every upstream call goes through
+the process-wide llm_gateway, and calls with a cache key are coalesced with
+identical calls already in flight. With hedge=True, slow calls are hedged
+with a duplicate request (see llm_hedging). Callers that pass similar=
+(section, text) also get answers from the semantic cache for reworded
+prompts; translations never are, as a near match translates different text.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from response_cache import get_response_cache, make_cache_key
+from llm_streaming import StreamResult, stream_text, timed_call, chunk_text, iter_langchain_text, iter_gemini_text
+from llm_metrics import get_metrics, measure, record_result, record_cache_hit
+from llm_gateway import get_llm_gateway
+from llm_hedging import hedged_stream, record_first_token, HEDGE_MODEL
+from llm_clients import get_client_pool
+from translation_memory import get_translation_memory
+from semantic_cache import get_semantic_cache, ENABLED as SEMANTIC_CACHE_ENABLED
+from conversation_context import ConversationCompactor
+from language_detect import needs_translation, get_skip_counter
+from batch_translate import TRANSLATION_PROMPT
+
+# Ideation prompts, keyed by the heading their section is rendered under
+IDEATION_PROMPTS = {
+    "Refined Idea": """
+Refine the following startup idea into a clear and compelling Problem-Solution format.
+Use Markdown for formatting with clear headings.
+
+**Idea:** "{idea}"
+
+**Output Format:**
+- **Problem:** Clearly define the specific problem the startup is solving.
+- **Solution:** Describe the innovative solution your startup provides.
+""",
+    "Market Research": """
+Perform a concise market research analysis for the following startup idea.
+Format the output using Markdown headings.
+
+**Idea:** "{idea}"
+
+**Include the following sections:**
+- **Market Size & Opportunity:** Estimated market size (TAM, SAM, SOM) and growth potential.
+- **Target Audience:** A detailed description of the ideal customer profile.
+- **Competition:** Key competitors and their strengths/weaknesses.
+- **Feasibility:** A brief analysis of the technical and operational feasibility.
+""",
+    "Business Model Canvas": """
+Generate a Business Model Canvas for the startup idea below.
+Format the output as a Markdown table with two columns: 'Component' and 'Details'.
+Include all 9 standard components of the canvas.
+
+**Idea:** "{idea}"
+""",
+}
+
+TRANSLATE_TEXT_PROMPT = "Translate this to {language}: {text}"
+
+SYMPTOM_SYSTEM_PROMPT = """
+You are a professional and empathetic virtual health assistant. Your primary goal is to help users understand their health concerns better.
+
+Follow this process strictly:
+1. Start by introducing yourself and asking the user about their symptoms or health concerns.
+2. Based on the user's initial input, ask relevant and necessary follow-up questions to gather more specific information. Ask one question at a time. Do not overwhelm the user.
+3. Continue this questioning process until you have sufficient information to form a preliminary assessment.
+4. Once you have gathered enough details, provide a structured response with the following sections:
+    - **Probable Diagnosis:** List 1-3 possible conditions that might align with the symptoms. Use clear, simple language.
+    - **Recommendation:** Clearly state whether a doctor's visit is necessary (e.g., "Immediate visit recommended," "Consult a doctor soon," or "Monitor symptoms at home for now").
+    - **Lifestyle & Dietary Tips:** Provide actionable advice related to lifestyle (e.g., rest, exercise) and diet that could help alleviate the symptoms.
+    - **Ayurvedic & Home Remedies:** Suggest simple, safe, and widely known Ayurvedic or home remedies that could offer relief.
+
+**Crucial Safety Instructions:**
+- **Always include a disclaimer:** Start and end every single response with a clear disclaimer: "I am an AI assistant and not a medical professional. This is not a substitute for professional medical advice. Please consult a doctor for an accurate diagnosis."
+- **Never pretend to be a doctor.**
+- **If symptoms sound severe (e.g., chest pain, difficulty breathing, severe bleeding), immediately advise the user to seek emergency medical help.**
+"""
+
+SYMPTOM_GREETING = "I am an AI assistant and not a medical professional. This is not a substitute for professional medical advice. Please consult a doctor for an accurate diagnosis. \n\nHello! I'm your virtual health assistant. How are you feeling today? Please tell me about your symptoms."
+
+
+def run_llm(tool, stream_fn, invoke_fn, prompt="", on_text=None, stream=True, key=None, hedge_fns=None):
+    """
+    Run one LLM call, streaming or blocking, and record its metrics.
+
+    With a key, callers sharing an identical in-flight call get its result
+    (and its streamed text) instead of making their own. hedge_fns is an
+    optional (stream_fn, invoke_fn) pair used for a duplicate request when
+    the primary is slow to produce its first token.
+    """
+    gateway = get_llm_gateway()
+
+    def call(progress):
+        if hedge_fns is not None:
+            if stream:
+                primary, backup = stream_fn, hedge_fns[0]
+            else:
+                # A blocking call's whole response is its "first token"
+                primary, backup = (lambda: [invoke_fn()]), (lambda: [hedge_fns[1]()])
+            # Hedge only when the global rate limit has a token to spare
+            return hedged_stream(tool, primary, backup, on_text=progress,
+                                 may_hedge=gateway.bucket.try_acquire, streaming=stream)
+        if stream:
+            result = stream_text(stream_fn(), on_text=progress)
+            record_first_token(tool, result.first_token_latency)
+            return result
+        return timed_call(invoke_fn)
+
+    start = time.perf_counter()
+    try:
+        if key is None:
+            result, shared = gateway.limited(lambda: call(on_text)), False
+        else:
+            # Namespaced: invoke_text() callers with the same key share text, not StreamResults
+            result, shared = gateway.coalesce(("result", key), call, on_text)
+    except Exception:
+        get_metrics().record(tool, latency=time.perf_counter() - start, error=True)
+        raise
+    if shared:
+        # Served by another caller's upstream call
+        record_cache_hit(tool)
+    else:
+        record_result(tool, result, prompt)
+    return result
+
+
+def invoke_text(tool, llm, prompt, key=None):
+    """Blocking llm.invoke through the gateway, coalesced when key is given"""
+    gateway = get_llm_gateway()
+
+    def call(progress=None):
+        return measure(tool, lambda: chunk_text(llm.invoke(prompt).content), prompt)
+
+    if key is None:
+        return gateway.limited(call)
+    text, shared = gateway.coalesce(("text", key), call)
+    if shared:
+        record_cache_hit(tool)
+    return text
+
+
+def hedge_clients(clients):
+    """Clients for hedge requests: the LLM_HEDGE_MODEL bundle if configured, else the same"""
+    if HEDGE_MODEL and HEDGE_MODEL != clients.model_name:
+        return get_client_pool().get(clients.key[0], HEDGE_MODEL)
+    return clients
+
+
+def langchain_fns(llm, prompt):
+    """(stream_fn, invoke_fn) for one prompt on a LangChain chat model"""
+    return (lambda: iter_langchain_text(llm, prompt),
+            lambda: chunk_text(llm.invoke(prompt).content))
+
+
+def semantic_key(tool, clients, similar):
+    """(scope, text) for the semantic cache; scope keeps tools, sections and models apart"""
+    section, text = similar
+    return f"{tool}|{section}|{clients.model_name}|{getattr(clients.llm, 'temperature', None)}", text
+
+
+def cached_response(tool, clients, key, similar=None):
+    """Exact-cache, then semantic-cache lookup; returns a cached StreamResult or None"""
+    cached = get_response_cache().get(key)
+    if cached is not None:
+        record_cache_hit(tool)
+        return StreamResult(cached, 0.0, 0.0, cached=True)
+    if similar is not None and SEMANTIC_CACHE_ENABLED:
+        found = get_semantic_cache().lookup(*semantic_key(tool, clients, similar))
+        if found is not None:
+            record_cache_hit(tool)
+            return StreamResult(found[1], 0.0, 0.0, cached=True, similarity=found[0])
+    return None
+
+
+def remember_response(tool, clients, key, text, similar=None):
+    get_response_cache().put(key, text)
+    if similar is not None and SEMANTIC_CACHE_ENABLED:
+        get_semantic_cache().put(*semantic_key(tool, clients, similar), text)
+
+
+def generate(tool, clients, prompt, on_text=None, stream=True, hedge=False, similar=None):
+    """
+    Generate a response for prompt, reusing cached responses.
+
+    similar is an optional (section, text) pair naming the variable part of
+    the prompt (e.g. the idea) for semantic-cache lookups.
+    """
+    llm = clients.llm
+    key = make_cache_key(prompt, clients.model_name, getattr(llm, "temperature", None))
+
+    cached = cached_response(tool, clients, key, similar)
+    if cached is not None:
+        return cached
+
+    result = run_llm(
+        tool, *langchain_fns(llm, prompt), prompt, on_text, stream, key=key,
+        hedge_fns=langchain_fns(hedge_clients(clients).llm, prompt) if hedge else None
+    )
+    remember_response(tool, clients, key, result.text, similar)
+    return result
+
+
+def ideation_prompt(title, idea):
+    return IDEATION_PROMPTS[title].format(idea=idea)
+
+
+def full_analysis(clients, idea):
+    """
+    Run every ideation prompt concurrently.
+
+    Yields (title, text, cached, error) in completion order: cache hits
+    first, then each upstream call as soon as it finishes.
+    """
+    llm = clients.llm
+    temperature = getattr(llm, "temperature", None)
+
+    pending = {}
+    with ThreadPoolExecutor(max_workers=len(IDEATION_PROMPTS)) as executor:
+        for title in IDEATION_PROMPTS:
+            prompt = ideation_prompt(title, idea)
+            key = make_cache_key(prompt, clients.model_name, temperature)
+            cached = cached_response("ideation", clients, key, (title, idea))
+            if cached is not None:
+                yield title, cached.text, True, None
+                continue
+            future = executor.submit(invoke_text, "ideation", llm, prompt, key)
+            pending[future] = (title, key)
+
+        for future in as_completed(pending):
+            title, key = pending[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                yield title, None, False, e
+                continue
+            remember_response("ideation", clients, key, text, (title, idea))
+            yield title, text, False, None
+
+
+def translate(clients, text, language, on_text=None, stream=True, hedge=False):
+    """Translate text, serving only identical requests from the translation memory"""
+    # Text already in the target language, or with nothing to translate, is returned as is
+    needed, reason = needs_translation(text, language)
+    get_skip_counter().record(reason)
+    if not needed:
+        return StreamResult(text, 0.0, 0.0, cached=True, skipped=reason)
+
+    memory = get_translation_memory()
+    remembered = memory.lookup(text, language)
+    if remembered is not None:
+        record_cache_hit("translator")
+        return StreamResult(remembered, 0.0, 0.0, cached=True)
+
+    # No semantic-cache lookup: a near match is a translation of different text. The
+    # page offers translation-memory near matches as labelled suggestions instead.
+    llm = clients.llm
+    prompt = TRANSLATE_TEXT_PROMPT.format(language=language, text=text)
+    result = run_llm(
+        "translator", *langchain_fns(llm, prompt), prompt, on_text, stream,
+        key=make_cache_key(prompt, clients.model_name, getattr(llm, "temperature", None)),
+        hedge_fns=langchain_fns(hedge_clients(clients).llm, prompt) if hedge else None
+    )
+    memory.put(text, language, result.text)
+    return result
+
+
+def segment_translator(clients, language):
+    """
+    Build the callbacks batch_translate.translate_document() needs.
+
+    Returns (translate_fn, memory, passthrough) where memory is the
+    (lookup, store) pair backed by the translation memory and passthrough
+    tells which segments need no translation.
+    """
+    llm = clients.llm
+    memory = get_translation_memory()
+    temperature = getattr(llm, "temperature", None)
+
+    def translate_segment(text):
+        prompt = TRANSLATION_PROMPT.format(language=language, text=text)
+        return invoke_text("translator", llm, prompt, make_cache_key(prompt, clients.model_name, temperature))
+
+    def remembered_segment(text):
+        translation = memory.lookup_segment(text, language)
+        if translation is not None:
+            record_cache_hit("translator")
+        return translation
+
+    def remember_segment(text, translated):
+        memory.put(text, language, translated)
+
+    def passthrough_segment(text):
+        needed, reason = needs_translation(text, language)
+        get_skip_counter().record(reason)
+        return not needed
+
+    return translate_segment, (remembered_segment, remember_segment), passthrough_segment
+
+
+def symptom_reply(clients, history, context, prompt, on_text=None, stream=True, hedge=False):
+    """
+    Answer the latest symptom message with a bounded context.
+
+    history holds the earlier messages (not including prompt); context is the
+    rolling-summary state dict, updated in place. Returns (result, context
+    size in tokens).
+    """
+    llm = clients.llm
+    compactor = ConversationCompactor(lambda p: invoke_text("symptom_summary", llm, p))
+
+    # Older turns are folded into a rolling summary; only recent ones go verbatim
+    recent = compactor.compact(context, history)
+    chat_history = [
+        {"role": "user", "parts": [SYMPTOM_SYSTEM_PROMPT]},
+        {"role": "model", "parts": [SYMPTOM_GREETING]}
+    ]
+    if context["summary"]:
+        chat_history += [
+            {"role": "user", "parts": [f"Summary of our conversation so far:\n{context['summary']}"]},
+            {"role": "model", "parts": ["Thank you, I will continue from this summary."]}
+        ]
+    chat_history += [
+        {"role": "model" if message["role"] == "assistant" else "user", "parts": [message["content"]]}
+        for message in recent
+    ]
+
+    def gemini_fns(gemini_model):
+        # A fresh chat per attempt, so a hedge does not share the primary's session
+        return (lambda: iter_gemini_text(gemini_model.start_chat(history=chat_history).send_message(prompt, stream=True)),
+                lambda: gemini_model.start_chat(history=chat_history).send_message(prompt).text)
+
+    result = run_llm(
+        "symptom", *gemini_fns(clients.gemini_model), prompt, on_text, stream,
+        hedge_fns=gemini_fns(hedge_clients(clients).gemini_model) if hedge else None
+    )
+    return result, compactor.context_tokens(context, recent, SYMPTOM_SYSTEM_PROMPT)
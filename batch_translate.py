@@ -0,0 +1,212 @@
+"""
+Bulk document translation.
+
+A document is read line by line and grouped into segments that fit a token
+budget. Segments are translated by a bounded pool of worker threads behind a
+rate limiter, retried with exponential backoff, and written to the output
+file in their original order. Only a small window of segments is in flight
+at any time, so documents with tens of thousands of lines never have every
+response held in memory at once.
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from llm_metrics import estimate_tokens
+
+DEFAULT_SEGMENT_TOKENS = 800
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 3
+
+TRANSLATION_PROMPT = (
+    "Translate the following text to {language}. Preserve line breaks, Markdown "
+    "formatting and CSV delimiters exactly. Return only the translation.\n\n{text}"
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+
+
+def _split_long_line(line, max_tokens):
+    """
+    Break a line that exceeds the budget at sentence ends, then hard-wrap.
+
+    Returns (piece, separator) pairs; separator rejoins the piece to the one
+    before it (a space after a sentence end, nothing after a hard wrap).
+    """
+    max_chars = max_tokens * 4
+    pieces, current, joiner = [], "", "\n"
+    for sentence in _SENTENCE_END.split(line):
+        candidate = f"{current} {sentence}" if current else sentence
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            pieces.append((current, joiner))
+            joiner = " "
+        while len(sentence) > max_chars:
+            pieces.append((sentence[:max_chars], joiner))
+            sentence = sentence[max_chars:]
+            joiner = ""
+        current = sentence
+    if current:
+        pieces.append((current, joiner))
+    return pieces
+
+
+def split_segments(lines, max_tokens=DEFAULT_SEGMENT_TOKENS):
+    """
+    Group lines into segments under max_tokens.
+
+    Yields (text, line_count, separator) where separator is what joins the
+    segment to the previous one: a newline between lines, or a space or
+    nothing between the pieces of a single over-long line.
+    """
+    buffer, buffer_tokens = [], 0
+    for line in lines:
+        line = line.rstrip("\r\n")
+        tokens = estimate_tokens(line)
+
+        if tokens > max_tokens:
+            if buffer:
+                yield "\n".join(buffer), len(buffer), "\n"
+                buffer, buffer_tokens = [], 0
+            pieces = _split_long_line(line, max_tokens)
+            # The pieces of one line together count as a single line
+            for i, (piece, separator) in enumerate(pieces):
+                yield piece, 1 if i == len(pieces) - 1 else 0, separator
+            continue
+
+        if buffer and buffer_tokens + tokens > max_tokens:
+            yield "\n".join(buffer), len(buffer), "\n"
+            buffer, buffer_tokens = [], 0
+        buffer.append(line)
+        buffer_tokens += tokens
+
+    if buffer:
+        yield "\n".join(buffer), len(buffer), "\n"
+
+
+class BatchStats:
+    """Progress counters for one document translation"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.segments_done = 0
+        self.lines_done = 0
+        self.retries = 0
+        self.failed_segments = 0
+        self.memory_hits = 0
+        self.skipped = 0
+        # retries is bumped from worker threads; the other counters only by the writer
+        self._lock = threading.Lock()
+
+    def add_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    @property
+    def segments_per_second(self):
+        return self.segments_done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _translate_with_retry(translate_fn, text, rate_limiter, retries, stats):
+    delay = 1.0
+    for attempt in range(retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return translate_fn(text), True
+        except Exception:
+            if attempt == retries:
+                return text, False
+            stats.add_retry()
+            time.sleep(delay)
+            delay *= 2
+
+
+def translate_document(lines, translate_fn, out_file, max_workers=DEFAULT_WORKERS,
+                       max_tokens=DEFAULT_SEGMENT_TOKENS, rate_limiter=None,
+                       retries=DEFAULT_RETRIES, on_progress=None, memory=None, passthrough=None):
+    """
+    Translate an iterable of lines into out_file, preserving segment order.
+
+    translate_fn(text) returns the translated text for one segment. Segments
+    that still fail after `retries` attempts are written untranslated and
+    counted in stats.failed_segments. on_progress(stats) is called from this
+    thread after every segment is written.
+
+    memory is an optional (lookup, store) pair: lookup(text) returns a known
+    translation or None and is checked before a segment is sent to a worker;
+    store(text, translated) is called for every successful translation.
+
+    passthrough(text) optionally returns True for segments that need no
+    translation (already in the target language, code, numbers); they are
+    written unchanged and counted in stats.skipped.
+    """
+    stats = BatchStats()
+    window = max_workers * 2
+    segments = enumerate(split_segments(lines, max_tokens))
+    in_flight = {}
+    done = {}
+    next_to_write = 0
+    exhausted = False
+
+    def write_ready():
+        nonlocal next_to_write
+        while next_to_write in done:
+            translated, line_count, separator, ok = done.pop(next_to_write)
+            if next_to_write:
+                out_file.write(separator)
+            out_file.write(translated)
+            stats.segments_done += 1
+            stats.lines_done += line_count
+            if not ok:
+                stats.failed_segments += 1
+            next_to_write += 1
+            if on_progress is not None:
+                on_progress(stats)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # Keep at most `window` segments running or waiting to be written
+            while not exhausted and len(in_flight) + len(done) < window:
+                try:
+                    index, (text, line_count, separator) = next(segments)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if passthrough is not None and passthrough(text):
+                    stats.skipped += 1
+                    done[index] = (text, line_count, separator, True)
+                    continue
+                if memory is not None:
+                    known = memory[0](text)
+                    if known is not None:
+                        stats.memory_hits += 1
+                        done[index] = (known, line_count, separator, True)
+                        continue
+                future = executor.submit(_translate_with_retry, translate_fn, text,
+                                         rate_limiter, retries, stats)
+                in_flight[future] = (index, line_count, separator, text)
+
+            write_ready()
+            if not in_flight:
+                if exhausted:
+                    break
+                continue
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, line_count, separator, text = in_flight.pop(future)
+                translated, ok = future.result()
+                if ok and memory is not None:
+                    memory[1](text, translated)
+                done[index] = (translated, line_count, separator, ok)
+            write_ready()
+
+    return stats
@@ -0,0 +1,114 @@
+"""
+Benchmark for the semantic response cache.
+
+Grows a SemanticCache to each requested size with synthetic startup-idea
+prompts and reports insert rate, lookup latency percentiles (for reworded
+near-duplicates and for unrelated prompts), hit rate, index memory and the
+time to reload the persisted index.
+
+Examples:
+    python bench_semantic_cache.py
+    python bench_semantic_cache.py --sizes 1000,10000,100000 --queries 500
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from llm_metrics import percentile
+from semantic_cache import SemanticCache, DEFAULT_THRESHOLD
+
+SUBJECTS = ("app", "marketplace", "platform", "subscription service", "tool", "network", "kit", "service")
+ACTIONS = ("renting", "sharing", "repairing", "tracking", "booking", "learning", "recycling", "delivering",
+           "insuring", "scheduling", "financing", "inspecting", "cooking", "teaching", "cleaning", "trading")
+OBJECTS = ("camera gear", "office furniture", "solar panels", "bicycles", "textbooks", "garden tools",
+           "electric scooters", "kitchen appliances", "board games", "hiking equipment", "pet supplies",
+           "musical instruments", "wedding dresses", "power tools", "baby clothes", "3D printers",
+           "fishing boats", "vintage watches", "sports courts", "coworking desks")
+AUDIENCES = ("hobbyists", "students", "small farms", "freelancers", "retirees", "restaurants", "landlords",
+             "remote teams", "parents", "clinics", "gyms", "schools", "tourists", "artists", "nurses")
+PLACES = ("in rural towns", "across Europe", "in college campuses", "for apartment buildings",
+          "in coastal cities", "near airports", "in developing markets", "for suburban neighbourhoods")
+
+
+def make_prompt(rng):
+    return (f"A {rng.choice(SUBJECTS)} for {rng.choice(ACTIONS)} {rng.choice(OBJECTS)} "
+            f"between {rng.choice(AUDIENCES)} {rng.choice(PLACES)} #{rng.randrange(10 ** 6)}")
+
+
+def reword(prompt, rng):
+    """A near-duplicate: different case, stop words and punctuation"""
+    variants = (
+        lambda p: p.lower() + ".",
+        lambda p: p.replace("between", "among"),
+        lambda p: p[2:] if p.startswith("A ") else p,
+        lambda p: p.replace(" for ", " for the ", 1),
+    )
+    return rng.choice(variants)(prompt)
+
+
+def run(sizes, queries, dim, threshold, seed):
+    rng = random.Random(seed)
+    workdir = tempfile.mkdtemp(prefix="semantic-cache-bench-")
+    path = os.path.join(workdir, "semantic_cache.sqlite3")
+    cache = SemanticCache(path, threshold=threshold, max_entries=max(sizes), dim=dim)
+    scope = "ideation|Refined Idea|bench"
+    stored = []
+
+    print(f"dim={dim} threshold={threshold} queries={queries} db={path}")
+    header = (f"{'entries':>9}{'insert/s':>10}{'hit p50':>10}{'hit p99':>10}{'miss p50':>10}{'miss p99':>10}"
+              f"{'hit rate':>10}{'false hit':>10}{'index MB':>10}")
+    print(header)
+    print("-" * len(header))
+
+    for size in sizes:
+        start = time.perf_counter()
+        added = size - len(stored)
+        for _ in range(added):
+            prompt = make_prompt(rng)
+            cache.put(scope, prompt, f"response to {prompt}")
+            stored.append(prompt)
+        insert_rate = added / (time.perf_counter() - start) if added else float("nan")
+
+        hit_times, miss_times = [], []
+        hits = false_hits = 0
+        for _ in range(queries):
+            original = rng.choice(stored)
+            began = time.perf_counter()
+            found = cache.lookup(scope, reword(original, rng))
+            hit_times.append(time.perf_counter() - began)
+            if found is not None:
+                hits += 1
+                if found[1] != f"response to {original}":
+                    false_hits += 1
+
+            began = time.perf_counter()
+            cache.lookup(scope, make_prompt(rng))
+            miss_times.append(time.perf_counter() - began)
+
+        ms = lambda values, q: percentile(values, q) * 1000
+        print(f"{size:>9}{insert_rate:>10.0f}{ms(hit_times, 0.5):>9.2f}m{ms(hit_times, 0.99):>9.2f}m"
+              f"{ms(miss_times, 0.5):>9.2f}m{ms(miss_times, 0.99):>9.2f}m"
+              f"{hits / queries:>10.1%}{false_hits / queries:>10.1%}{cache.stats()['index_bytes'] / 2 ** 20:>10.1f}")
+
+    start = time.perf_counter()
+    reloaded = SemanticCache(path, threshold=threshold, max_entries=max(sizes), dim=dim)
+    print(f"\nReloaded {len(reloaded)} entries from disk in {time.perf_counter() - start:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the semantic response cache")
+    parser.add_argument("--sizes", default="1000,10000,50000,100000",
+                        help="comma-separated index sizes to measure at")
+    parser.add_argument("--queries", type=int, default=300, help="lookups per size and kind")
+    parser.add_argument("--dim", type=int, default=256, help="vector dimensions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    run(sizes, args.queries, args.dim, args.threshold, args.seed)
+
+
+if __name__ == "__main__":
+    main()
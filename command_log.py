@@ -0,0 +1,297 @@
+"""
+Append-only audit log of executed Docker, SSH and shell commands.
+
+Every command run by the Docker and Linux pages (over SSH, as a local
+process, through the Docker Engine API or as a live stream) is recorded
+with its host, exit status, duration and output size. Recording never
+blocks the caller: entries are queued and a background thread writes them
+in batches, one transaction per batch.
+
+The log is a SQLite table indexed by time and by (host, time, duration):
+recent commands per host are an index walk, and the slowest commands of a
+host in a time window are picked from the covering index alone, even with
+millions of rows. Each batch also updates a small rollup table with counts
+per host, hour and latency bucket. Histograms and per-host summaries read
+only that table, never the log itself. Entries older than
+COMMAND_LOG_RETENTION_DAYS are pruned from both tables. If SQLite fails,
+entries stay queued (at most MAX_PENDING, oldest dropped first) and the
+writer keeps retrying.
+"""
+import atexit
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, deque
+
+CACHE_DIR = os.getenv("DASHBOARD_CACHE_DIR",
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+LOG_PATH = os.getenv("COMMAND_LOG_PATH", os.path.join(CACHE_DIR, "command_log.sqlite3"))
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH = 500
+# Entries kept queued while the database cannot be written
+MAX_PENDING = 100_000
+RETENTION_DAYS = float(os.getenv("COMMAND_LOG_RETENTION_DAYS", "30"))
+PRUNE_INTERVAL = 3600.0
+PRUNE_BATCH = 10_000
+MAX_COMMAND_CHARS = 1000
+# Latency buckets double from 1 ms: bucket 0 is < 1 ms, bucket n covers [2^(n-1), 2^n) ms
+LATENCY_BUCKETS = 22
+
+
+def latency_bucket(seconds):
+    milliseconds = seconds * 1000.0
+    if milliseconds < 1:
+        return 0
+    return min(LATENCY_BUCKETS - 1, int(math.log2(milliseconds)) + 1)
+
+
+def bucket_label(bucket):
+    """Sortable label of a latency bucket, e.g. '08 · 128-256 ms'"""
+    def fmt(milliseconds):
+        if milliseconds < 1000:
+            return f"{milliseconds:.0f} ms"
+        if milliseconds < 100_000:
+            return f"{milliseconds / 1000:.2g} s"
+        return f"{milliseconds / 60_000:.0f} min"
+    if bucket == 0:
+        text = "< 1 ms"
+    elif bucket == LATENCY_BUCKETS - 1:
+        text = f"≥ {fmt(2 ** (bucket - 1))}"
+    else:
+        text = f"{fmt(2 ** (bucket - 1))}-{fmt(2 ** bucket)}"
+    return f"{bucket:02d} · {text}"
+
+
+def status_for(exit_code):
+    return "ok" if exit_code == 0 else "error"
+
+
+class CommandLog:
+    """SQLite command log with batched background writes and an hourly latency rollup"""
+
+    def __init__(self, path=LOG_PATH, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending = deque(maxlen=MAX_PENDING)
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.pruned = 0
+        self.last_error = None
+        self._pruned_at = 0.0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync stays consistent on a crash; at worst the last batches are lost
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS commands ("
+            " id INTEGER PRIMARY KEY, ts REAL NOT NULL, host TEXT NOT NULL, source TEXT NOT NULL,"
+            " command TEXT NOT NULL, status TEXT NOT NULL, exit_code INTEGER,"
+            " duration REAL NOT NULL, output_bytes INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS commands_ts ON commands (ts);"
+            # Covers both recent-per-host and slowest-per-host-in-a-window lookups
+            "CREATE INDEX IF NOT EXISTS commands_host_ts_duration ON commands (host, ts, duration);"
+            "DROP INDEX IF EXISTS commands_host_ts;"
+            "DROP INDEX IF EXISTS commands_host_duration;"
+            "CREATE TABLE IF NOT EXISTS latency_rollup ("
+            " host TEXT NOT NULL, hour INTEGER NOT NULL, bucket INTEGER NOT NULL,"
+            " count INTEGER NOT NULL, errors INTEGER NOT NULL, total REAL NOT NULL,"
+            " PRIMARY KEY (host, hour, bucket)) WITHOUT ROWID;"
+        )
+        self._db.commit()
+        self._writer = threading.Thread(target=self._write_loop, name="command-log", daemon=True)
+        self._writer.start()
+
+    def record(self, host, source, command, exit_code, duration, output_bytes=0, status=None):
+        """Queue one executed command; status defaults to ok/error from exit_code"""
+        entry = (time.time(), host or "local", source, str(command)[:MAX_COMMAND_CHARS],
+                 status or status_for(exit_code), exit_code, float(duration), int(output_bytes or 0))
+        with self._lock:
+            self.dropped += len(self._pending) == MAX_PENDING
+            self._pending.append(entry)
+            self.recorded += 1
+            full = len(self._pending) >= FLUSH_BATCH
+        if full:
+            self._wakeup.set()
+
+    def _write_loop(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+                if time.time() - self._pruned_at > PRUNE_INTERVAL:
+                    self.prune()
+            except Exception as e:
+                # The writer must outlive any error, or every later entry would be lost
+                self.last_error = f"{type(e).__name__}: {e}"
+
+    def flush(self):
+        """Write every queued entry now; on a database error they stay queued"""
+        with self._db_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                entries = list(self._pending)
+                self._pending.clear()
+            try:
+                self._write(entries)
+            except sqlite3.Error as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                with self._lock:
+                    # Back in front of anything recorded meanwhile; the oldest go if over MAX_PENDING
+                    queued = entries + list(self._pending)
+                    self.dropped += max(0, len(queued) - MAX_PENDING)
+                    self._pending.clear()
+                    self._pending.extend(queued)
+                return
+            self.written += len(entries)
+            self.last_error = None
+
+    def _write(self, entries):
+        """Insert entries and fold them into the rollup, in one transaction"""
+        rollup = Counter()
+        totals = Counter()
+        errors = Counter()
+        for ts, host, _, _, status, _, duration, _ in entries:
+            key = (host, int(ts // 3600), latency_bucket(duration))
+            rollup[key] += 1
+            totals[key] += duration
+            errors[key] += status != "ok"
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO commands (ts, host, source, command, status, exit_code, duration, output_bytes)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", entries
+            )
+            self._db.executemany(
+                "INSERT INTO latency_rollup (host, hour, bucket, count, errors, total) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (host, hour, bucket) DO UPDATE SET count = count + excluded.count,"
+                " errors = errors + excluded.errors, total = total + excluded.total",
+                [(*key, count, errors[key], totals[key]) for key, count in rollup.items()]
+            )
+
+    def prune(self, retention_days=RETENTION_DAYS):
+        """Delete commands and rollup hours older than the retention period"""
+        cutoff = time.time() - retention_days * 86400
+        self._pruned_at = time.time()
+        while True:
+            # In batches, so writers and readers are not locked out for long
+            with self._db_lock, self._db:
+                deleted = self._db.execute(
+                    "DELETE FROM commands WHERE id IN (SELECT id FROM commands WHERE ts < ? ORDER BY ts LIMIT ?)",
+                    (cutoff, PRUNE_BATCH)
+                ).rowcount
+            self.pruned += deleted
+            if deleted < PRUNE_BATCH:
+                break
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM latency_rollup WHERE hour < ?", (int(cutoff // 3600),))
+
+    def _query(self, sql, params=()):
+        self.flush()
+        with self._db_lock:
+            cursor = self._db.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def hosts(self):
+        return [row["host"] for row in self._query("SELECT DISTINCT host FROM latency_rollup ORDER BY host")]
+
+    def recent(self, host=None, limit=20):
+        """Newest commands, optionally for one host"""
+        if host:
+            return self._query("SELECT * FROM commands WHERE host = ? ORDER BY ts DESC LIMIT ?", (host, limit))
+        return self._query("SELECT * FROM commands ORDER BY ts DESC LIMIT ?", (limit,))
+
+    def slowest(self, host, since=0.0, limit=10):
+        """The longest-running commands of one host since a timestamp"""
+        # The top ids come from the (host, ts, duration) index alone; only those rows are read
+        return self._query(
+            "SELECT commands.* FROM (SELECT id FROM commands INDEXED BY commands_host_ts_duration"
+            " WHERE host = ? AND ts >= ? ORDER BY duration DESC LIMIT ?) AS top"
+            " JOIN commands ON commands.id = top.id ORDER BY commands.duration DESC", (host, since, limit)
+        )
+
+    def slowest_per_host(self, since=0.0, limit=10):
+        return {host: self.slowest(host, since, limit) for host in self.hosts()}
+
+    def histogram(self, host=None, since=0.0):
+        """{bucket: count} of command latencies, from the rollup"""
+        sql = "SELECT bucket, SUM(count) AS count FROM latency_rollup WHERE hour >= ?"
+        params = [int(since // 3600)]
+        if host:
+            sql += " AND host = ?"
+            params.append(host)
+        rows = self._query(sql + " GROUP BY bucket ORDER BY bucket", params)
+        return {row["bucket"]: row["count"] for row in rows}
+
+    def host_summary(self, since=0.0):
+        """Per host: command and error counts, mean and approximate p50/p95 latency"""
+        rows = self._query(
+            "SELECT host, bucket, SUM(count) AS count, SUM(errors) AS errors, SUM(total) AS total"
+            " FROM latency_rollup WHERE hour >= ? GROUP BY host, bucket ORDER BY host, bucket",
+            (int(since // 3600),)
+        )
+        summary = {}
+        for row in rows:
+            host = summary.setdefault(row["host"], {"host": row["host"], "commands": 0, "errors": 0,
+                                                    "total": 0.0, "buckets": []})
+            host["commands"] += row["count"]
+            host["errors"] += row["errors"]
+            host["total"] += row["total"]
+            host["buckets"].append((row["bucket"], row["count"]))
+        results = []
+        for host in summary.values():
+            results.append({
+                "host": host["host"], "commands": host["commands"], "errors": host["errors"],
+                "mean_s": round(host["total"] / host["commands"], 3),
+                "p50_s": _bucket_quantile(host["buckets"], host["commands"], 0.5),
+                "p95_s": _bucket_quantile(host["buckets"], host["commands"], 0.95),
+            })
+        return results
+
+    def stats(self):
+        total = self._query("SELECT COALESCE(SUM(count), 0) AS total FROM latency_rollup")[0]["total"]
+        return {"path": self.path, "rows": total, "recorded": self.recorded, "written": self.written,
+                "pending": len(self._pending), "dropped": self.dropped, "pruned": self.pruned,
+                "retention_days": RETENTION_DAYS, "error": self.last_error}
+
+
+def _bucket_quantile(buckets, total, quantile):
+    """Upper bound in seconds of the latency bucket holding the quantile"""
+    seen = 0
+    for bucket, count in buckets:
+        seen += count
+        if seen >= quantile * total:
+            return 2 ** bucket / 1000.0
+    return None
+
+
+_command_log = None
+_command_log_lock = threading.Lock()
+
+
+def get_command_log():
+    """Return the process-wide command log"""
+    global _command_log
+    with _command_log_lock:
+        if _command_log is None:
+            _command_log = CommandLog()
+            atexit.register(_command_log.flush)
+        return _command_log
+
+
+def log_command(host, source, command, exit_code, duration, output_bytes=0, status=None):
+    """Record an executed command in the shared log; never raises"""
+    try:
+        get_command_log().record(host, source, command, exit_code, duration, output_bytes, status)
+    except (sqlite3.Error, OSError):
+        pass
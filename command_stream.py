@@ -0,0 +1,169 @@
+"""
+Streaming execution of long-running shell, Docker and SSH commands.
+
+CommandStream starts a process in the background and reads its stdout and
+stderr line by line as they are written, instead of buffering everything
+until exit. Only the last STREAM_MAX_LINES lines are kept (a ring buffer),
+so a chatty `journalctl` or `grep -r` cannot grow memory without bound;
+older lines are counted as dropped. The process runs in its own session so
+cancel() (or the optional timeout) stops it together with its children.
+"""
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+
+from command_log import log_command
+
+STREAM_MAX_LINES = int(os.getenv("STREAM_MAX_LINES", "1000"))
+# Streams outlive the 30 s limit of buffered commands, but not forever
+STREAM_TIMEOUT = float(os.getenv("STREAM_TIMEOUT", "3600"))
+# Seconds between SIGTERM and SIGKILL when cancelling
+CANCEL_GRACE = 3.0
+
+
+class CommandStream:
+    """A running command whose latest output lines can be read at any time"""
+
+    def __init__(self, args, label=None, timeout=STREAM_TIMEOUT, max_lines=STREAM_MAX_LINES, on_line=None,
+                 host="local", command=None, on_exit=None):
+        self.args = args
+        self.label = label or " ".join(args)
+        # Host and command text recorded in the command log when the stream ends
+        self.host = host
+        self.command = command or self.label
+        self.timeout = timeout
+        # on_line(stream_name, line) is called from a reader thread for every line
+        self.on_line = on_line
+        # on_exit(stream) is called once the command has ended and its output is read
+        self.on_exit = on_exit
+        self._lines = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._process = None
+        self._readers = []
+        self.total_lines = 0
+        self.total_bytes = 0
+        self.started = None
+        self.finished = None
+        self.returncode = None
+        self.stop_reason = None
+
+    def start(self):
+        self.started = time.monotonic()
+        try:
+            self._process = subprocess.Popen(
+                self.args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                start_new_session=os.name != "nt"
+            )
+        except OSError as e:
+            self._append("stderr", f"{e}\n".encode("utf-8"))
+            self.returncode = 127
+            self.finished = time.monotonic()
+            self._log()
+            self._exited()
+            return self
+        for name, pipe in (("stdout", self._process.stdout), ("stderr", self._process.stderr)):
+            reader = threading.Thread(target=self._read, args=(name, pipe), daemon=True)
+            reader.start()
+            self._readers.append(reader)
+        threading.Thread(target=self._wait, daemon=True).start()
+        return self
+
+    def _append(self, name, raw):
+        line = raw.decode("utf-8", "replace").rstrip("\r\n")
+        # Progress bars redraw with carriage returns; keep the latest state only
+        line = line.rsplit("\r", 1)[-1]
+        with self._lock:
+            self._lines.append((name, line))
+            self.total_lines += 1
+            self.total_bytes += len(raw)
+        if self.on_line is not None:
+            self.on_line(name, line)
+
+    def _read(self, name, pipe):
+        with pipe:
+            for raw in iter(pipe.readline, b""):
+                self._append(name, raw)
+
+    def _wait(self):
+        try:
+            self._process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.cancel(reason="timed out")
+            self._process.wait()
+        for reader in self._readers:
+            reader.join()
+        self.returncode = self._process.returncode
+        self.finished = time.monotonic()
+        self._log()
+        self._exited()
+
+    def _exited(self):
+        if self.on_exit is not None:
+            self.on_exit(self)
+
+    def _log(self):
+        log_command(self.host, "stream", self.command, self.returncode, self.elapsed, self.total_bytes,
+                    status=self.stop_reason.replace("timed out", "timeout") if self.stop_reason else None)
+
+    def _signal(self, sig):
+        try:
+            if os.name == "nt":
+                self._process.terminate()
+            else:
+                os.killpg(self._process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def cancel(self, reason="cancelled"):
+        """Stop the command: SIGTERM, then SIGKILL after CANCEL_GRACE seconds"""
+        if self._process is None or self._process.poll() is not None:
+            return
+        self.stop_reason = reason
+        self._signal(signal.SIGTERM)
+        try:
+            self._process.wait(timeout=CANCEL_GRACE)
+        except subprocess.TimeoutExpired:
+            self._signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    def wait(self, timeout=None):
+        """Block until the command and its output readers are done; True if finished"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.running:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    @property
+    def running(self):
+        return self.finished is None
+
+    @property
+    def status(self):
+        if self.running:
+            return "running"
+        if self.stop_reason:
+            return self.stop_reason
+        return "succeeded" if self.returncode == 0 else f"failed (exit {self.returncode})"
+
+    @property
+    def elapsed(self):
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started if self.started is not None else 0.0
+
+    @property
+    def dropped_lines(self):
+        with self._lock:
+            return self.total_lines - len(self._lines)
+
+    def lines(self):
+        """Snapshot of the buffered (stream name, line) pairs, oldest first"""
+        with self._lock:
+            return list(self._lines)
+
+    def text(self, mark_stderr=True):
+        return "\n".join(f"! {line}" if mark_stderr and name == "stderr" else line
+                         for name, line in self.lines())
@@ -0,0 +1,335 @@
+"""
+Live container resource monitor backed by fixed-size NumPy ring buffers.
+
+A StatsMonitor follows one Docker host. It reads `docker stats` as a single
+streaming process for all containers (locally or over the pooled SSH
+connection), or polls the Engine API stats endpoint when no CLI is used.
+Samples go into a StatsStore: preallocated arrays of
+(containers x samples x metrics) with one write position per container. The
+store never grows, so memory and per-sample cost stay constant however long
+the monitor runs. Slots of containers that stop reporting are recycled.
+Network and block I/O are stored as cumulative byte counters and turned
+into rates when read. Monitors that have stopped for lack of viewers are
+dropped from the registry, with their store, on the next lookup.
+"""
+import functools
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from command_stream import CommandStream
+
+METRICS = ("cpu_percent", "memory_bytes", "memory_percent", "net_rx", "net_tx", "block_read", "block_write")
+CUMULATIVE = ("net_rx", "net_tx", "block_read", "block_write")
+SAMPLES = int(os.getenv("STATS_SAMPLES", "300"))
+MAX_CONTAINERS = int(os.getenv("STATS_MAX_CONTAINERS", "500"))
+STATS_COMMAND = "docker stats --no-trunc --format '{{json .}}'"
+POLL_INTERVAL = 2.0
+# Containers silent for this long give up their slot
+STALE_AFTER = 30.0
+# Monitors nobody has looked at for this long stop their feed
+IDLE_STOP = 120.0
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_SIZE = re.compile(r"([\d.]+)\s*([kKMGTP]?i?B)")
+_UNITS = {"B": 1, "kB": 1e3, "KB": 1e3, "MB": 1e6, "GB": 1e9, "TB": 1e12, "PB": 1e15,
+          "KiB": 2 ** 10, "MiB": 2 ** 20, "GiB": 2 ** 30, "TiB": 2 ** 40, "PiB": 2 ** 50}
+
+
+def _bytes(text):
+    match = _SIZE.match(text.strip())
+    if not match:
+        return 0.0
+    return float(match.group(1)) * _UNITS.get(match.group(2), 1)
+
+
+def _pair(text):
+    first, _, second = text.partition("/")
+    return _bytes(first), _bytes(second)
+
+
+def parse_cli_stats(line):
+    """(name, metrics) from one `docker stats --format '{{json .}}'` line, or None"""
+    line = _ANSI.sub("", line).strip()
+    if not line.startswith("{"):
+        return None
+    data = json.loads(line)
+    memory, _ = _pair(data.get("MemUsage", ""))
+    net_rx, net_tx = _pair(data.get("NetIO", ""))
+    block_read, block_write = _pair(data.get("BlockIO", ""))
+    values = (float(data.get("CPUPerc", "0%").rstrip("%") or 0), memory,
+              float(data.get("MemPerc", "0%").rstrip("%") or 0), net_rx, net_tx, block_read, block_write)
+    return data.get("Name") or data.get("Container"), values
+
+
+def parse_engine_stats(data, previous=None):
+    """
+    (metrics, cpu counters) from one Engine API stats object. CPU percent is
+    computed against previous counters of the same container, as one-shot
+    samples carry no precpu_stats.
+    """
+    cpu = data.get("cpu_stats", {})
+    total = cpu.get("cpu_usage", {}).get("total_usage", 0)
+    system = cpu.get("system_cpu_usage", 0)
+    cpus = cpu.get("online_cpus") or len(cpu.get("cpu_usage", {}).get("percpu_usage") or [1])
+    cpu_percent = 0.0
+    if previous is not None and system > previous[1]:
+        cpu_percent = (total - previous[0]) / (system - previous[1]) * cpus * 100.0
+    memory = data.get("memory_stats", {})
+    usage, limit = memory.get("usage", 0), memory.get("limit", 0)
+    networks = (data.get("networks") or {}).values()
+    blkio = data.get("blkio_stats", {}).get("io_service_bytes_recursive") or []
+    values = (
+        max(0.0, cpu_percent), usage, usage / limit * 100.0 if limit else 0.0,
+        sum(network.get("rx_bytes", 0) for network in networks),
+        sum(network.get("tx_bytes", 0) for network in networks),
+        sum(entry.get("value", 0) for entry in blkio if entry.get("op", "").lower() == "read"),
+        sum(entry.get("value", 0) for entry in blkio if entry.get("op", "").lower() == "write"),
+    )
+    return values, (total, system)
+
+
+class StatsStore:
+    """Preallocated ring buffers of samples for up to max_containers containers"""
+
+    def __init__(self, samples=SAMPLES, max_containers=MAX_CONTAINERS):
+        self.samples = samples
+        self.max_containers = max_containers
+        self.times = np.zeros((max_containers, samples), dtype=np.float64)
+        # float64: cumulative byte counters of long-running containers exceed float32 precision
+        self.values = np.zeros((max_containers, samples, len(METRICS)), dtype=np.float64)
+        self.heads = np.zeros(max_containers, dtype=np.int64)
+        self.counts = np.zeros(max_containers, dtype=np.int64)
+        self.last_seen = np.zeros(max_containers, dtype=np.float64)
+        self._slots = {}
+        self._free = list(range(max_containers - 1, -1, -1))
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def _slot(self, name):
+        slot = self._slots.get(name)
+        if slot is None and self._free:
+            slot = self._slots[name] = self._free.pop()
+            self.heads[slot] = self.counts[slot] = 0
+        return slot
+
+    def add(self, name, values, now=None):
+        """Append one sample; dropped (and counted) when every slot is taken"""
+        now = time.time() if now is None else now
+        with self._lock:
+            slot = self._slot(name)
+            if slot is None:
+                self.dropped += 1
+                return
+            head = self.heads[slot]
+            self.times[slot, head] = now
+            self.values[slot, head] = values
+            self.heads[slot] = (head + 1) % self.samples
+            self.counts[slot] = min(self.counts[slot] + 1, self.samples)
+            self.last_seen[slot] = now
+
+    def expire(self, now=None):
+        """Free the slots of containers that stopped reporting"""
+        now = time.time() if now is None else now
+        with self._lock:
+            for name, slot in list(self._slots.items()):
+                if now - self.last_seen[slot] > STALE_AFTER:
+                    del self._slots[name]
+                    self._free.append(slot)
+
+    def names(self):
+        with self._lock:
+            return sorted(self._slots)
+
+    def series(self, name):
+        """DataFrame of one container's samples, oldest first, with I/O as bytes per second"""
+        with self._lock:
+            slot = self._slots.get(name)
+            if slot is None or not self.counts[slot]:
+                return pd.DataFrame(columns=METRICS)
+            count, head = self.counts[slot], self.heads[slot]
+            order = (np.arange(count) + (head - count)) % self.samples
+            times = self.times[slot, order]
+            values = self.values[slot, order]
+        frame = pd.DataFrame(values, columns=METRICS, index=pd.to_datetime(times, unit="s"))
+        elapsed = np.diff(times, prepend=np.nan)
+        for metric in CUMULATIVE:
+            # Counter resets (container restarts) show as zero, not negative rates
+            frame[metric] = np.clip(np.diff(frame[metric].to_numpy(), prepend=np.nan) / elapsed, 0, None)
+        return frame
+
+    def history(self, names, metric):
+        """One column of metric per container, aligned on whole seconds"""
+        columns = {}
+        for name in names:
+            series = self.series(name)[metric]
+            if len(series):
+                series.index = series.index.floor("s")
+                columns[name] = series.groupby(level=0).last()
+        return pd.DataFrame(columns)
+
+    def latest(self):
+        """One row per container with its newest sample and current I/O rates"""
+        with self._lock:
+            names = list(self._slots)
+            slots = np.fromiter(self._slots.values(), dtype=np.int64, count=len(names))
+            last = (self.heads[slots] - 1) % self.samples
+            before = (self.heads[slots] - 2) % self.samples
+            current = self.values[slots, last]
+            previous = self.values[slots, before]
+            elapsed = self.times[slots, last] - self.times[slots, before]
+            has_rate = (self.counts[slots] > 1) & (elapsed > 0)
+        indices = [METRICS.index(metric) for metric in CUMULATIVE]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(has_rate[:, None],
+                             np.clip((current[:, indices] - previous[:, indices]) / elapsed[:, None], 0, None), 0.0)
+        return pd.DataFrame({
+            "Container": names,
+            "CPU %": current[:, 0].round(1),
+            "Memory (MB)": (current[:, 1] / 1e6).round(1),
+            "Memory %": current[:, 2].round(1),
+            "Net in (KB/s)": (rates[:, 0] / 1e3).round(1),
+            "Net out (KB/s)": (rates[:, 1] / 1e3).round(1),
+            "Disk read (KB/s)": (rates[:, 2] / 1e3).round(1),
+            "Disk write (KB/s)": (rates[:, 3] / 1e3).round(1),
+        })
+
+    @property
+    def nbytes(self):
+        return self.times.nbytes + self.values.nbytes
+
+
+class StatsMonitor:
+    """Feeds a StatsStore from one host until nobody has watched it for IDLE_STOP seconds"""
+
+    def __init__(self, name, cli_args=None, engine=None, store=None, interval=POLL_INTERVAL, open_stream=None):
+        self.name = name
+        self.cli_args = cli_args
+        # open_stream(**options) returns an unstarted CommandStream of STATS_COMMAND (e.g. over SSH)
+        self.open_stream = open_stream
+        if open_stream is None and cli_args:
+            self.open_stream = functools.partial(CommandStream, cli_args, host=name, command=STATS_COMMAND)
+        self.engine = engine
+        self.interval = interval
+        self.store = store or StatsStore()
+        self.samples_received = 0
+        self.error = None
+        self._stream = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._watched = time.monotonic()
+
+    @property
+    def source(self):
+        return "docker stats" if self.open_stream else "Engine API"
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def touch(self):
+        """Mark the monitor as watched (start it if it is not running)"""
+        self._watched = time.monotonic()
+        if not self.running:
+            self.start()
+
+    def start(self):
+        self._stop.clear()
+        self.error = None
+        target = self._run_cli if self.open_stream else self._run_engine
+        self._thread = threading.Thread(target=target, name=f"stats-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._stream is not None:
+            self._stream.cancel()
+
+    def _idle(self):
+        return time.monotonic() - self._watched > IDLE_STOP
+
+    def _on_line(self, stream_name, line):
+        if stream_name != "stdout":
+            self.error = line
+            return
+        try:
+            parsed = parse_cli_stats(line)
+        except ValueError:
+            return
+        if parsed is not None:
+            self.store.add(*parsed)
+            self.samples_received += 1
+
+    def _run_cli(self):
+        # One process streams every container; the ring buffer of CommandStream itself stays tiny
+        try:
+            self._stream = self.open_stream(label=f"docker stats on {self.name}", timeout=None, max_lines=10,
+                                            on_line=self._on_line).start()
+        except (OSError, subprocess.SubprocessError) as e:
+            self.error = f"Could not start docker stats: {e}"
+            return
+        while self._stream.running and not self._stop.wait(self.interval):
+            self.store.expire()
+            if self._idle():
+                self._stream.cancel(reason="idle")
+        if self._stream.returncode not in (0, None) and self._stream.stop_reason is None:
+            self.error = self.error or f"docker stats exited with {self._stream.returncode}"
+
+    def _run_engine(self):
+        previous = {}
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            while not self._stop.is_set() and not self._idle():
+                started = time.monotonic()
+                try:
+                    containers = self.engine.containers(all=False)
+                    samples = executor.map(
+                        lambda container: (container, self.engine.container_stats(container.id)),
+                        containers
+                    )
+                    now = time.time()
+                    for container, data in samples:
+                        values, previous[container.id] = parse_engine_stats(data, previous.get(container.id))
+                        self.store.add(container.name, values, now)
+                        self.samples_received += 1
+                    self.error = None
+                except Exception as e:
+                    self.error = str(e)
+                self.store.expire()
+                self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stats(self):
+        return {"host": self.name, "source": self.source, "running": self.running,
+                "containers": len(self.store.names()), "samples": self.samples_received,
+                "dropped": self.store.dropped, "buffer_mb": round(self.store.nbytes / 2 ** 20, 1),
+                "error": self.error}
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_stats_monitor(name, cli_args=None, engine=None, open_stream=None):
+    """Return the shared monitor for a host, reading engine stats or else cli_args (or open_stream)"""
+    key = (name, engine is not None)
+    with _monitors_lock:
+        # Each store holds its preallocated arrays: drop monitors nobody watches any more
+        for stale_key, stale in list(_monitors.items()):
+            if stale_key != key and stale._idle() and not stale.running:
+                del _monitors[stale_key]
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = _monitors[key] = StatsMonitor(name, cli_args=None if engine else cli_args, engine=engine,
+                                                    open_stream=None if engine else open_stream)
+        return monitor
+
+
+def monitor_stats():
+    with _monitors_lock:
+        return [monitor.stats() for monitor in _monitors.values()]
@@ -0,0 +1,83 @@
+"""
+Token-budgeted conversation context.
+
+Long chats are kept at a flat prompt size: the system prompt and the most
+recent turns are sent verbatim, and everything older is folded into a
+rolling summary. The summary is updated incrementally, only with the
+messages that just fell out of the verbatim window, and only once a small
+batch of them has accumulated, so most turns make no extra LLM call.
+"""
+from llm_metrics import estimate_tokens
+
+DEFAULT_KEEP_TURNS = 3
+DEFAULT_TOKEN_BUDGET = 1500
+DEFAULT_FOLD_BATCH = 4
+MAX_SUMMARY_CHARS = 2000
+
+SUMMARY_PROMPT = """
+You maintain a running summary of a conversation between a user and a virtual health assistant.
+Update the summary with the new messages below. Keep every symptom, its duration and severity,
+relevant history, answers to the assistant's questions and any advice already given.
+Write at most 150 words in plain sentences. Return only the updated summary.
+
+Current summary:
+{summary}
+
+New messages:
+{messages}
+"""
+
+
+def format_messages(messages):
+    return "\n".join(f"{message['role'].capitalize()}: {message['content']}" for message in messages)
+
+
+class ConversationCompactor:
+    """Splits a chat into a rolling summary plus a bounded window of recent messages"""
+
+    def __init__(self, summarize_fn, keep_turns=DEFAULT_KEEP_TURNS,
+                 token_budget=DEFAULT_TOKEN_BUDGET, fold_batch=DEFAULT_FOLD_BATCH):
+        self.summarize_fn = summarize_fn
+        self.keep_messages = keep_turns * 2
+        self.token_budget = token_budget
+        self.fold_batch = fold_batch
+
+    def compact(self, state, messages):
+        """
+        Return the recent messages to send verbatim, folding older ones first.
+
+        state is a dict holding "summary" and "folded" (how many leading
+        messages are already in the summary); it is updated in place.
+        messages is the full history, excluding the message being sent now.
+        """
+        state.setdefault("summary", "")
+        state.setdefault("folded", 0)
+        recent = messages[state["folded"]:]
+
+        # Fold in batches so the summary is not rewritten on every turn
+        overflow = len(recent) - self.keep_messages
+        fold_count = overflow if overflow >= self.fold_batch else 0
+
+        # Never exceed the token budget, even with fewer than keep_turns turns
+        while len(recent) - fold_count > 1 and self._tokens(recent[fold_count:]) > self.token_budget:
+            fold_count += 1
+
+        if fold_count:
+            to_fold = recent[:fold_count]
+            summary = self.summarize_fn(SUMMARY_PROMPT.format(
+                summary=state["summary"] or "(none yet)",
+                messages=format_messages(to_fold)
+            ))
+            state["summary"] = summary.strip()[:MAX_SUMMARY_CHARS]
+            state["folded"] += fold_count
+            recent = recent[fold_count:]
+
+        return recent
+
+    def context_tokens(self, state, recent, system_prompt=""):
+        """Approximate size of the prompt that will be sent"""
+        return estimate_tokens(system_prompt) + estimate_tokens(state.get("summary", "")) + self._tokens(recent)
+
+    @staticmethod
+    def _tokens(messages):
+        return sum(estimate_tokens(message["content"]) for message in messages)
@@ -0,0 +1,124 @@
+"""
+Batch container actions: stop, start, restart or remove many containers at once.
+
+Containers are selected from a host's inventory by name (glob pattern such
+as `test-*`), by label (`env` or `env=test`) and by state. run_batch() then
+applies one action to every selected container concurrently, at most
+max_workers at a time, through the Engine API when available or else the
+docker CLI (over the pooled SSH connection for remote hosts, which
+multiplexes the calls instead of paying one handshake each). Every
+container gets its own outcome and timing.
+"""
+import fnmatch
+import os
+import shlex
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from command_log import log_command
+from docker_engine import DockerEngineError
+
+DEFAULT_BATCH_PARALLELISM = int(os.getenv("DOCKER_BATCH_PARALLELISM", "8"))
+DEFAULT_BATCH_TIMEOUT = 60
+# Action -> (docker CLI subcommand, DockerEngine method)
+ACTIONS = {
+    "stop": ("stop", "stop"),
+    "start": ("start", "start"),
+    "restart": ("restart", "restart"),
+    "remove": ("rm -f", "remove"),
+}
+
+
+def _has_label(labels, wanted):
+    """True if a 'k=v, k2=v2' labels string has key wanted or the exact pair wanted"""
+    pairs = [pair.strip() for pair in str(labels).split(",") if pair.strip()]
+    if "=" in wanted:
+        return wanted in pairs
+    return any(pair.split("=", 1)[0] == wanted for pair in pairs)
+
+
+def select_containers(frame, pattern="", label="", states=()):
+    """Rows of a container inventory frame matching a name glob, a label and states"""
+    mask = frame["Name"].notna()
+    if pattern:
+        mask &= frame["Name"].map(lambda name: fnmatch.fnmatchcase(str(name), pattern))
+    if label:
+        mask &= frame["Labels"].map(lambda labels: _has_label(labels, label.strip()))
+    if states:
+        mask &= frame["State"].isin(states)
+    return frame[mask]
+
+
+class BatchResult:
+    """Outcome of one action on one container"""
+
+    def __init__(self, container, action, status, message, duration):
+        self.container = container
+        self.action = action
+        self.status = status
+        self.message = message
+        self.duration = duration
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+    def row(self):
+        return {
+            "Container": self.container,
+            "Action": self.action,
+            "Status": {"ok": "✅ ok", "error": "❌ error", "timeout": "⏰ timeout"}.get(self.status, "⚠️ failed"),
+            "Duration (s)": round(self.duration, 3),
+            "Message": self.message,
+        }
+
+
+def _apply(container, action, engine=None, cli=None):
+    subcommand, method = ACTIONS[action]
+    start = time.perf_counter()
+    try:
+        if engine is not None:
+            getattr(engine, method)(container)
+            message = ""
+        else:
+            message = cli(f"docker {subcommand} {shlex.quote(container)}").strip()
+    except subprocess.TimeoutExpired:
+        return BatchResult(container, action, "timeout", "", time.perf_counter() - start)
+    except DockerEngineError as e:
+        return BatchResult(container, action, "error", str(e), time.perf_counter() - start)
+    except Exception as e:
+        return BatchResult(container, action, "failed", str(e), time.perf_counter() - start)
+    return BatchResult(container, action, "ok", message, time.perf_counter() - start)
+
+
+def run_action(container, action, engine=None, cli=None):
+    """Apply action to one container and return a BatchResult; never raises"""
+    result = _apply(container, action, engine, cli)
+    if engine is not None:
+        # CLI commands are logged where they run; Engine API calls are logged here
+        log_command(engine.name, "engine", f"docker {ACTIONS[action][0]} {container}",
+                    0 if result.ok else None, result.duration, status=result.status)
+    return result
+
+
+def run_batch(containers, action, engine=None, cli=None, max_workers=DEFAULT_BATCH_PARALLELISM,
+              on_result=None):
+    """
+    Apply action to every container concurrently, at most max_workers at a time.
+
+    Returns BatchResults in the given order. on_result(result) is called from
+    the calling thread as each container finishes, for progress display.
+    """
+    if not containers:
+        return []
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(containers)))) as executor:
+        futures = {executor.submit(run_action, container, action, engine, cli): container
+                   for container in containers}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[container] for container in containers]
@@ -0,0 +1,347 @@
+"""
+Docker Engine API backend.
+
+Talks to the Docker daemon's HTTP API over its unix socket instead of
+forking `docker` CLI processes, and returns parsed objects instead of text.
+Remote hosts are reached by forwarding their /var/run/docker.sock to a local
+socket over the pooled SSH master connection (ssh -O forward), so no extra
+TCP or SSH handshake is paid per call. HTTP/1.1 connections are kept alive
+and reused from a small per-engine pool. Whether a daemon answers /_ping is
+cached for AVAILABILITY_TTL seconds.
+
+DOCKER_SOCKET overrides the local socket path, e.g. to point the dashboard
+at the stub daemon in docker_stub.py.
+"""
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from urllib.parse import urlencode, quote
+
+LOCAL_SOCKET = os.getenv("DOCKER_SOCKET", "/var/run/docker.sock")
+REMOTE_SOCKET = os.getenv("DOCKER_REMOTE_SOCKET", "/var/run/docker.sock")
+AVAILABILITY_TTL = float(os.getenv("DOCKER_AVAILABILITY_TTL", "30"))
+DEFAULT_TIMEOUT = 30
+MAX_IDLE_CONNECTIONS = 4
+# Requests safe to send twice when a kept-alive connection turns out to be closed
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+
+
+class DockerEngineError(Exception):
+    """The daemon rejected a request or could not be reached"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def image_params(image):
+    """
+    /images/create parameters for an image reference. The tag follows the
+    last ':' after the last '/', so a registry port (localhost:5000/app) is
+    not taken for a tag; digest references (app@sha256:...) pass unchanged.
+    """
+    if "@" in image:
+        return {"fromImage": image}
+    slash = image.rfind("/")
+    colon = image.rfind(":")
+    if colon > slash:
+        return {"fromImage": image[:colon], "tag": image[colon + 1:]}
+    return {"fromImage": image, "tag": "latest"}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a unix domain socket"""
+
+    def __init__(self, socket_path, timeout=DEFAULT_TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class Container:
+    """One row of /containers/json"""
+
+    def __init__(self, data):
+        self.id = data.get("Id", "")
+        self.name = (data.get("Names") or ["/"])[0].lstrip("/")
+        self.image = data.get("Image", "")
+        self.state = data.get("State", "")
+        self.status = data.get("Status", "")
+        self.created = data.get("Created", 0)
+        self.labels = data.get("Labels") or {}
+        self.ports = ", ".join(
+            f"{port.get('PublicPort')}->{port.get('PrivatePort')}/{port.get('Type')}" if port.get("PublicPort")
+            else f"{port.get('PrivatePort')}/{port.get('Type')}"
+            for port in data.get("Ports") or []
+        )
+
+    def row(self):
+        return {"ID": self.id[:12], "Name": self.name, "Image": self.image, "State": self.state,
+                "Status": self.status, "Ports": self.ports,
+                "Labels": ", ".join(f"{key}={value}" for key, value in sorted(self.labels.items())),
+                "Created": time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))}
+
+
+class Image:
+    """One row of /images/json"""
+
+    def __init__(self, data):
+        self.id = data.get("Id", "").split(":")[-1]
+        self.tags = [tag for tag in data.get("RepoTags") or [] if tag != "<none>:<none>"]
+        self.size = data.get("Size", 0)
+        self.created = data.get("Created", 0)
+        self.containers = data.get("Containers", -1)
+
+    def row(self):
+        return {"ID": self.id[:12], "Tags": ", ".join(self.tags) or "<none>",
+                "Size (MB)": round(self.size / 1e6, 1),
+                "Created": time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))}
+
+
+class DockerEngine:
+    """Client for one daemon socket with keep-alive connection reuse"""
+
+    def __init__(self, socket_path=LOCAL_SOCKET, timeout=DEFAULT_TIMEOUT, name="local"):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.name = name
+        self._idle = []
+        self._lock = threading.Lock()
+        self._available = None
+        self._checked_at = 0.0
+        self.requests = 0
+        self.connections_opened = 0
+
+    def _connection(self, reuse=True):
+        with self._lock:
+            if reuse and self._idle:
+                return self._idle.pop()
+            self.connections_opened += 1
+        return UnixHTTPConnection(self.socket_path, self.timeout)
+
+    def _release(self, connection):
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_CONNECTIONS:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def _send(self, method, path, params=None, body=None, stream=False):
+        if params:
+            path = f"{path}?{urlencode(params)}"
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        # A kept-alive connection the daemon has closed fails once. Only idempotent requests are
+        # retried on a fresh connection; others (start, create, pull) always get a fresh one,
+        # which over a unix socket costs no handshake, so they are never sent twice.
+        idempotent = method in IDEMPOTENT_METHODS
+        for attempt in range(2 if idempotent else 1):
+            connection = self._connection(reuse=idempotent)
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                break
+            except (ConnectionError, http.client.HTTPException) as e:
+                connection.close()
+                if attempt or not idempotent:
+                    raise DockerEngineError(f"Docker daemon connection failed: {e}") from e
+            except OSError as e:
+                connection.close()
+                raise DockerEngineError(f"Docker daemon not reachable at {self.socket_path}: {e}") from e
+        self.requests += 1
+        if stream and response.status < 400:
+            return connection, response
+        try:
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise DockerEngineError(f"Docker daemon connection failed: {e}") from e
+        self._release(connection)
+        if response.status >= 400:
+            try:
+                message = json.loads(data).get("message", "")
+            except ValueError:
+                message = data.decode("utf-8", "replace")
+            raise DockerEngineError(message or f"HTTP {response.status}", response.status)
+        return json.loads(data) if data else None
+
+    def request(self, method, path, params=None, body=None):
+        """Send one API request and return the decoded JSON body (or None)"""
+        return self._send(method, path, params, body)
+
+    def stream(self, method, path, params=None, body=None):
+        """Yield decoded JSON objects from a streaming endpoint, one per line"""
+        connection, response = self._send(method, path, params, body, stream=True)
+        try:
+            buffer = b""
+            while True:
+                try:
+                    chunk = response.read1(65536) if hasattr(response, "read1") else response.read(65536)
+                except (OSError, http.client.HTTPException) as e:
+                    raise DockerEngineError(f"Docker daemon connection failed: {e}") from e
+                if not chunk:
+                    break
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+            if buffer.strip():
+                yield json.loads(buffer)
+        finally:
+            # An abandoned stream leaves unread data on the connection, so it is not reused
+            if response.isclosed():
+                self._release(connection)
+            else:
+                connection.close()
+
+    def is_available(self, refresh=False):
+        """True if the daemon answers /_ping; cached for AVAILABILITY_TTL seconds"""
+        now = time.monotonic()
+        if not refresh and self._available is not None and now - self._checked_at < AVAILABILITY_TTL:
+            return self._available
+        try:
+            connection, response = self._send("GET", "/_ping", stream=True)
+            response.read()
+            self._release(connection)
+            self._available = True
+        except DockerEngineError:
+            self._available = False
+        self._checked_at = now
+        return self._available
+
+    def version(self):
+        return self.request("GET", "/version")
+
+    def containers(self, all=True, filters=None):
+        params = {"all": int(all)}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return [Container(data) for data in self.request("GET", "/containers/json", params)]
+
+    def images(self):
+        return [Image(data) for data in self.request("GET", "/images/json")]
+
+    def run(self, name, image, env=None, ports=(), labels=None, command=None):
+        """
+        Create and start a detached container with a TTY (docker run -dit).
+
+        env and labels are dicts, ports are "host:container" strings as for -p.
+        """
+        body = {"Image": image, "Tty": True, "OpenStdin": True, "Labels": labels or {},
+                "Env": [f"{key}={value}" for key, value in (env or {}).items()]}
+        if command:
+            body["Cmd"] = ["sh", "-c", command]
+        if ports:
+            bindings = {}
+            for mapping in ports:
+                host_port, _, container_port = str(mapping).rpartition(":")
+                port = container_port if "/" in container_port else f"{container_port}/tcp"
+                bindings.setdefault(port, []).append({"HostPort": host_port})
+            body["ExposedPorts"] = {port: {} for port in bindings}
+            body["HostConfig"] = {"PortBindings": bindings}
+        created = self.request("POST", "/containers/create", {"name": name}, body)
+        self.start(created["Id"])
+        return created["Id"]
+
+    def has_image(self, image):
+        tag = image if ":" in image.rsplit("/", 1)[-1] else f"{image}:latest"
+        return any(tag in found.tags for found in self.images())
+
+    def exec_run(self, container, command, timeout=30):
+        """Run command in a running container (docker exec) and return its exit code"""
+        created = self.request("POST", f"/containers/{quote(container)}/exec",
+                               body={"Cmd": ["sh", "-c", command], "AttachStdout": False, "AttachStderr": False})
+        self.request("POST", f"/exec/{created['Id']}/start", body={"Detach": True})
+        deadline = time.monotonic() + timeout
+        while True:
+            state = self.request("GET", f"/exec/{created['Id']}/json")
+            if not state.get("Running"):
+                return state.get("ExitCode")
+            if time.monotonic() > deadline:
+                raise DockerEngineError(f"exec in {container} did not finish within {timeout}s")
+            time.sleep(0.1)
+
+    def is_running(self, container):
+        return bool(self.request("GET", f"/containers/{quote(container)}/json")["State"]["Running"])
+
+    def start(self, container):
+        self.request("POST", f"/containers/{quote(container)}/start")
+
+    def stop(self, container, timeout=10):
+        self.request("POST", f"/containers/{quote(container)}/stop", {"t": timeout})
+
+    def restart(self, container, timeout=10):
+        self.request("POST", f"/containers/{quote(container)}/restart", {"t": timeout})
+
+    def remove(self, container, force=True):
+        self.request("DELETE", f"/containers/{quote(container)}", {"force": int(force)})
+
+    def container_stats(self, container):
+        """One resource usage sample of a running container"""
+        return self.request("GET", f"/containers/{quote(container)}/stats", {"stream": 0, "one-shot": 1})
+
+    def pull(self, image, on_progress=None):
+        """Pull image; on_progress(event) sees each progress message. Returns the last status"""
+        last = {}
+        for event in self.stream("POST", "/images/create", image_params(image)):
+            if "error" in event:
+                raise DockerEngineError(event["error"])
+            last = event
+            if on_progress is not None:
+                on_progress(event)
+        return last.get("status", "")
+
+    def close(self):
+        with self._lock:
+            for connection in self._idle:
+                connection.close()
+            self._idle.clear()
+
+    def stats(self):
+        return {"name": self.name, "socket": self.socket_path, "available": self._available,
+                "requests": self.requests, "connections_opened": self.connections_opened}
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(username=None, host=None):
+    """
+    Return the shared engine for the local daemon, or for username@host.
+
+    A remote engine forwards the host's Docker socket through its pooled SSH
+    connection; DockerEngineError is raised if the forward cannot be set up.
+    """
+    key = f"{username}@{host}" if host else "local"
+    with _engines_lock:
+        engine = _engines.get(key)
+        # A forwarded socket disappears when its SSH master is closed; forward again
+        if engine is not None and (not host or os.path.exists(engine.socket_path)):
+            return engine
+        _engines.pop(key, None)
+    if host:
+        from ssh_pool import get_ssh_pool
+        try:
+            socket_path = get_ssh_pool().forward_socket(username, host, REMOTE_SOCKET)
+        except Exception as e:
+            raise DockerEngineError(f"Could not forward the Docker socket of {key}: {e}") from e
+        engine = DockerEngine(socket_path, name=key)
+    else:
+        engine = DockerEngine(LOCAL_SOCKET)
+    with _engines_lock:
+        return _engines.setdefault(key, engine)
+
+
+def engine_stats():
+    with _engines_lock:
+        return [engine.stats() for engine in _engines.values()]
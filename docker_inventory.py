@@ -0,0 +1,309 @@
+"""
+Cached, event-driven container and image inventory per Docker host.
+
+The first listing of a host fetches every container and image and parses
+them into DataFrames. After that, with the Engine API available, a
+background thread follows the daemon's /events stream and refreshes only
+the containers an event names, so a host with thousands of containers is
+not re-listed on every rerun. A burst of events (e.g. a stack coming up)
+triggers one full re-list instead of hundreds of single lookups. Without
+the Engine API the CLI is used (`docker ps -a --format '{{json .}}'`) and
+listings are simply cached for DOCKER_INVENTORY_TTL seconds. Inventories
+nobody has read for IDLE_STOP seconds stop their watcher and are dropped
+from the registry; the next read lists the host afresh.
+"""
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+
+import pandas as pd
+
+from command_log import log_command
+from docker_engine import DockerEngine, DockerEngineError
+
+INVENTORY_TTL = float(os.getenv("DOCKER_INVENTORY_TTL", "30"))
+# Each /events request covers this many seconds, then reconnects with `since`
+EVENT_WINDOW = 5.0
+# More container events than this in one window cause a full re-list
+BURST_LIMIT = 25
+# Inventories nobody has read for this long stop following events
+IDLE_STOP = 120.0
+CONTAINER_COLUMNS = ["ID", "Name", "Image", "State", "Status", "Ports", "Labels", "Created"]
+IMAGE_COLUMNS = ["ID", "Tags", "Size (MB)", "Created"]
+SEARCH_COLUMNS = ("ID", "Name", "Image", "Status", "Labels", "Tags")
+
+
+def _size_mb(text):
+    units = {"B": 1e-6, "KB": 1e-3, "MB": 1, "GB": 1e3, "TB": 1e6}
+    for unit in sorted(units, key=len, reverse=True):
+        if text.upper().endswith(unit):
+            try:
+                return round(float(text[:-len(unit)]) * units[unit], 1)
+            except ValueError:
+                return None
+    return None
+
+
+def parse_cli_containers(text):
+    """Rows from `docker ps -a --no-trunc --format '{{json .}}'` output"""
+    rows = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        rows[data["ID"]] = {
+            "ID": data["ID"][:12], "Name": data.get("Names", ""), "Image": data.get("Image", ""),
+            "State": data.get("State", ""), "Status": data.get("Status", ""), "Ports": data.get("Ports", ""),
+            "Labels": ", ".join(sorted(label for label in data.get("Labels", "").split(",") if label)),
+            "Created": data.get("CreatedAt", "")[:16],
+        }
+    return rows
+
+
+def parse_cli_images(text):
+    """Rows from `docker images --format '{{json .}}'` output"""
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        tag = f"{data.get('Repository')}:{data.get('Tag')}"
+        rows.append({"ID": data.get("ID", "")[:12], "Tags": "<none>" if "<none>" in tag else tag,
+                     "Size (MB)": _size_mb(data.get("Size", "")), "Created": data.get("CreatedAt", "")[:16]})
+    return rows
+
+
+def cli_runner(username=None, host=None, timeout=60):
+    """A run(command) -> stdout callable for the docker CLI, local or over pooled SSH"""
+    def run(command):
+        if host:
+            from ssh_pool import get_ssh_pool
+            result = get_ssh_pool().run(username, host, command, timeout=timeout)
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+        else:
+            start = time.perf_counter()
+            try:
+                completed = subprocess.run(shlex.split(command), capture_output=True, text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                log_command("local", "shell", command, None, time.perf_counter() - start, status="timeout")
+                raise
+            returncode, stdout, stderr = completed.returncode, completed.stdout, completed.stderr
+            log_command("local", "shell", command, returncode, time.perf_counter() - start, len(stdout) + len(stderr))
+        if returncode != 0:
+            raise DockerEngineError(stderr.strip() or f"{command} exited with {returncode}")
+        return stdout
+    return run
+
+
+def filter_frame(frame, search="", states=(), images=()):
+    """Rows matching a free-text search (any text column) and state/image filters"""
+    mask = pd.Series(True, index=frame.index)
+    if search:
+        text_mask = pd.Series(False, index=frame.index)
+        for column in SEARCH_COLUMNS:
+            if column in frame:
+                text_mask |= frame[column].astype(str).str.contains(search, case=False, regex=False)
+        mask &= text_mask
+    if states and "State" in frame:
+        mask &= frame["State"].isin(states)
+    if images and "Image" in frame:
+        mask &= frame["Image"].isin(images)
+    return frame[mask]
+
+
+class DockerInventory:
+    """Containers and images of one host, kept current by events or a TTL"""
+
+    def __init__(self, name, engine=None, cli=None, ttl=INVENTORY_TTL, watch=True):
+        self.name = name
+        self.engine = engine
+        self.cli = cli
+        self.ttl = ttl
+        self.watch = watch and engine is not None
+        self._lock = threading.Lock()
+        self._containers = {}
+        self._images = []
+        self._listed_at = {"containers": 0.0, "images": 0.0}
+        self._version = 0
+        self._frames = {}
+        self._watcher = None
+        self._stop = threading.Event()
+        self._read = time.monotonic()
+        self.live = False
+        self.full_lists = 0
+        self.events_applied = 0
+        self.last_event = None
+
+    @property
+    def source(self):
+        return "Engine API" if self.engine is not None else "CLI"
+
+    def _stale(self, kind):
+        age = time.monotonic() - self._listed_at[kind]
+        # While the event stream is live, container listings stay current without re-listing
+        if kind == "containers" and self.live:
+            return not self._listed_at[kind]
+        return not self._listed_at[kind] or age > self.ttl
+
+    def _list_containers(self):
+        if self.engine is not None:
+            return {container.id: container.row() for container in self.engine.containers(all=True)}
+        return parse_cli_containers(self.cli("docker ps -a --no-trunc --format '{{json .}}'"))
+
+    def _list_images(self):
+        if self.engine is not None:
+            return [image.row() for image in self.engine.images()]
+        return parse_cli_images(self.cli("docker images --format '{{json .}}'"))
+
+    def refresh(self, kind="containers"):
+        """Re-list containers or images from scratch"""
+        # Events from this moment on are replayed by the watcher, so none are lost while listing
+        listed_from = time.time()
+        rows = self._list_containers() if kind == "containers" else self._list_images()
+        with self._lock:
+            if kind == "containers":
+                self._containers = rows
+            else:
+                self._images = rows
+            self._listed_at[kind] = time.monotonic()
+            self._version += 1
+            self.full_lists += 1
+        if kind == "containers" and self.watch:
+            self._start_watcher(listed_from)
+
+    def invalidate(self, kind="containers"):
+        """Re-list on next access, e.g. after actions the event stream does not cover"""
+        self._listed_at[kind] = 0.0
+
+    def _frame(self, kind, columns):
+        with self._lock:
+            cached = self._frames.get(kind)
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+            rows = list(self._containers.values()) if kind == "containers" else list(self._images)
+            version = self._version
+        frame = pd.DataFrame(rows, columns=columns)
+        with self._lock:
+            self._frames[kind] = (version, frame)
+        return frame
+
+    @property
+    def idle(self):
+        return time.monotonic() - self._read > IDLE_STOP
+
+    def containers(self, refresh=False):
+        """DataFrame of every container; re-listed only when stale"""
+        self._read = time.monotonic()
+        if refresh or self._stale("containers"):
+            self.refresh("containers")
+        return self._frame("containers", CONTAINER_COLUMNS)
+
+    def images(self, refresh=False):
+        self._read = time.monotonic()
+        if refresh or self._stale("images"):
+            self.refresh("images")
+        return self._frame("images", IMAGE_COLUMNS)
+
+    def _start_watcher(self, since):
+        with self._lock:
+            if self._watcher is not None:
+                return
+            self._stop.clear()
+            self._watcher = threading.Thread(target=self._watch_events, args=(since,),
+                                             name=f"docker-events-{self.name}", daemon=True)
+        self._watcher.start()
+
+    def _update_container(self, container_id):
+        found = self.engine.containers(all=True, filters={"id": [container_id]})
+        with self._lock:
+            if found:
+                self._containers[found[0].id] = found[0].row()
+            else:
+                self._containers.pop(container_id, None)
+            self._version += 1
+
+    def _watch_events(self, since):
+        # A separate client, so the long-lived stream never holds a pooled connection
+        events = DockerEngine(self.engine.socket_path, timeout=EVENT_WINDOW + 10, name=f"{self.name} events")
+        while not self._stop.is_set() and not self.idle:
+            until = time.time() + EVENT_WINDOW
+            burst = 0
+            try:
+                for event in events.stream("GET", "/events", {
+                    "since": f"{since:.9f}", "until": f"{until:.9f}",
+                    "filters": json.dumps({"type": ["container", "image"]}),
+                }):
+                    self.live = True
+                    since = max(since, event.get("timeNano", 0) / 1e9 + 1e-9)
+                    self.events_applied += 1
+                    self.last_event = f"{event.get('Type')} {event.get('Action')}"
+                    if event.get("Type") == "image":
+                        self._listed_at["images"] = 0.0
+                    elif event.get("Action") == "destroy":
+                        with self._lock:
+                            self._containers.pop(event["Actor"]["ID"], None)
+                            self._version += 1
+                    else:
+                        burst += 1
+                        if burst <= BURST_LIMIT:
+                            self._update_container(event["Actor"]["ID"])
+                self.live = True
+                since = max(since, until)
+                if burst > BURST_LIMIT:
+                    self.refresh("containers")
+            except (DockerEngineError, OSError, ValueError, KeyError):
+                # Missed events cannot be replayed reliably: fall back to TTL listing and retry
+                self.live = False
+                self._listed_at["containers"] = 0.0
+                self._stop.wait(EVENT_WINDOW)
+                since = time.time()
+        events.close()
+        with self._lock:
+            # Without the event stream the listing is no longer known to be current
+            self.live = False
+            self._listed_at["containers"] = 0.0
+            self._watcher = None
+
+    def stop(self):
+        self._stop.set()
+        self.live = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "host": self.name,
+                "source": self.source,
+                "live_events": self.live,
+                "watching": self._watcher is not None,
+                "containers": len(self._containers),
+                "images": len(self._images),
+                "full_lists": self.full_lists,
+                "events_applied": self.events_applied,
+                "last_event": self.last_event,
+            }
+
+
+_inventories = {}
+_inventories_lock = threading.Lock()
+
+
+def get_docker_inventory(name, engine=None, cli=None):
+    """Return the shared inventory for a host, read through engine or else cli"""
+    key = (name, engine is not None)
+    with _inventories_lock:
+        for stale_key, stale in list(_inventories.items()):
+            if stale_key != key and stale.idle:
+                stale.stop()
+                del _inventories[stale_key]
+        inventory = _inventories.get(key)
+        if inventory is None:
+            inventory = _inventories[key] = DockerInventory(name, engine=engine, cli=cli)
+        return inventory
+
+
+def inventory_stats():
+    with _inventories_lock:
+        return [inventory.stats() for inventory in _inventories.values()]
@@ -0,0 +1,392 @@
+"""
+Stub Docker daemon for offline testing.
+
+Serves the subset of the Docker Engine API that docker_engine.py uses over
+a unix socket, with in-memory containers and images. Point the dashboard at
+it with DOCKER_SOCKET:
+
+    python docker_stub.py --socket /tmp/docker-stub.sock --containers 2000 &
+    DOCKER_SOCKET=/tmp/docker-stub.sock streamlit run app.py
+
+It can also be started in-process with start_stub_daemon(path).
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+
+API_VERSION = "1.43"
+SEED_IMAGES = ("nginx:latest", "redis:7", "postgres:16", "python:3.12-slim", "ubuntu:latest", "alpine:3.20")
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class StubState:
+    """Containers and images held by the stub daemon"""
+
+    def __init__(self, containers=0, images=SEED_IMAGES, pull_delay=0.05, seed=0):
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.events = []
+        self.pull_delay = pull_delay
+        self.images = {}
+        self.containers = {}
+        self.execs = {}
+        rng = random.Random(seed)
+        with self.lock:
+            for tag in images:
+                self.add_image(tag)
+            for index in range(containers):
+                image = rng.choice(list(images)) if images else "scratch"
+                self.create(f"stub-{index:05d}", image, running=rng.random() < 0.7,
+                            labels={"env": rng.choice(("test", "staging", "prod"))})
+
+    def add_image(self, tag):
+        image_id = f"sha256:{_digest(tag)}"
+        self.images[image_id] = {"Id": image_id, "RepoTags": [tag], "Created": int(time.time()),
+                                 "Size": len(tag) * 7_340_033, "Containers": 0}
+        self.emit("image", "pull", image_id, tag)
+        return image_id
+
+    def emit(self, kind, action, actor_id, name):
+        """Record an event for /events; callers hold the lock"""
+        now = time.time()
+        self.events.append({"Type": kind, "Action": action, "Actor": {"ID": actor_id, "Attributes": {"name": name}},
+                            "time": int(now), "timeNano": int(now * 1e9)})
+        self.changed.notify_all()
+
+    def create(self, name, image, running=False, labels=None):
+        if any(container["Names"][0] == f"/{name}" for container in self.containers.values()):
+            raise ValueError(f'Conflict. The container name "/{name}" is already in use')
+        container_id = _digest(f"{name}-{time.time_ns()}")
+        self.containers[container_id] = {
+            "Id": container_id, "Names": [f"/{name}"], "Image": image, "Created": int(time.time()),
+            "State": "running" if running else "created", "Status": "Up" if running else "Created",
+            "Labels": labels or {}, "Ports": [], "StartedAt": time.time() if running else None,
+        }
+        self.emit("container", "create", container_id, name)
+        if running:
+            self.emit("container", "start", container_id, name)
+        return container_id
+
+    def find(self, ref):
+        for container_id, container in self.containers.items():
+            if container_id.startswith(ref) or container["Names"][0] == f"/{ref}":
+                return container
+        return None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client hung up (e.g. after a 204 or a cancelled stream); nothing to answer
+            pass
+
+    def _json(self, status, body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Api-Version", API_VERSION)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _error(self, status, message):
+        self._json(status, {"message": message})
+
+    def _start_chunked(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _chunk(self, body):
+        data = json.dumps(body).encode("utf-8") + b"\n"
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_chunked(self):
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _route(self, method):
+        url = urlsplit(self.path)
+        # Versioned paths (/v1.43/containers/json) are served like unversioned ones
+        path = re.sub(r"^/v[\d.]+", "", unquote(url.path))
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        for pattern, handler_method, handler in ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and handler_method == method:
+                return handler(self, query, body, *match.groups())
+        self._error(404, f"page not found: {method} {path}")
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_DELETE(self):
+        self._route("DELETE")
+
+    def ping(self, query, body):
+        data = b"OK"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def version(self, query, body):
+        self._json(200, {"Version": "stub", "ApiVersion": API_VERSION, "Os": "linux"})
+
+    def list_containers(self, query, body):
+        show_all = query.get("all") in ("1", "true")
+        ids = json.loads(query.get("filters") or "{}").get("id")
+        with self.state.lock:
+            containers = [dict(container) for container in self.state.containers.values()
+                          if (show_all or container["State"] == "running")
+                          and (not ids or any(container["Id"].startswith(ref) for ref in ids))]
+        self._json(200, containers)
+
+    def list_images(self, query, body):
+        with self.state.lock:
+            self._json(200, list(self.state.images.values()))
+
+    def create_container(self, query, body):
+        image = (body or {}).get("Image", "")
+        with self.state.lock:
+            if not any(image in found["RepoTags"] or image.split(":")[0] + ":latest" in found["RepoTags"]
+                       for found in self.state.images.values()):
+                return self._error(404, f"No such image: {image}")
+            try:
+                container_id = self.state.create(query.get("name") or image.replace(":", "-"), image,
+                                                 labels=(body or {}).get("Labels"))
+            except ValueError as e:
+                return self._error(409, str(e))
+        self._json(201, {"Id": container_id, "Warnings": []})
+
+    def _set_state(self, ref, running):
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            if (container["State"] == "running") == running:
+                return self._json(304)
+            container["State"] = "running" if running else "exited"
+            container["StartedAt"] = time.time() if running else None
+            container["Status"] = "Up Less than a second" if running else "Exited (0) Less than a second ago"
+            self.state.emit("container", "start" if running else "die", container["Id"], container["Names"][0][1:])
+        self._json(204)
+
+    def start_container(self, query, body, ref):
+        self._set_state(ref, True)
+
+    def stop_container(self, query, body, ref):
+        self._set_state(ref, False)
+
+    def inspect_container(self, query, body, ref):
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            self._json(200, {**container, "Name": container["Names"][0],
+                             "State": {"Status": container["State"], "Running": container["State"] == "running"}})
+
+    def create_exec(self, query, body, ref):
+        """
+        Exec commands are not run. They fail while the container is younger
+        than its stub.ready_after label (seconds), `exit N` returns N and
+        anything else succeeds.
+        """
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            if container["State"] != "running":
+                return self._error(409, f"Container {ref} is not running")
+            command = " ".join((body or {}).get("Cmd") or [])
+            requested = re.search(r"exit (\d+)", command)
+            exit_code = int(requested.group(1)) if requested else 0
+            ready_after = float(container["Labels"].get("stub.ready_after", 0))
+            if time.time() - (container["StartedAt"] or 0) < ready_after:
+                exit_code = 1
+            exec_id = _digest(f"exec-{ref}-{time.time_ns()}")
+            self.state.execs[exec_id] = {"ID": exec_id, "Running": False, "ExitCode": exit_code}
+        self._json(201, {"Id": exec_id})
+
+    def start_exec(self, query, body, exec_id):
+        if exec_id not in self.state.execs:
+            return self._error(404, f"No such exec instance: {exec_id}")
+        self._json(200)
+
+    def inspect_exec(self, query, body, exec_id):
+        with self.state.lock:
+            found = self.state.execs.pop(exec_id, None)
+        if found is None:
+            return self._error(404, f"No such exec instance: {exec_id}")
+        self._json(200, found)
+
+    def restart_container(self, query, body, ref):
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            container["State"], container["Status"] = "running", "Up Less than a second"
+            container["StartedAt"] = time.time()
+            self.state.emit("container", "restart", container["Id"], container["Names"][0][1:])
+        self._json(204)
+
+    def remove_container(self, query, body, ref):
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            if container["State"] == "running" and query.get("force") not in ("1", "true"):
+                return self._error(409, f"You cannot remove a running container {ref[:12]}. "
+                                        "Stop the container before attempting removal or force remove")
+            del self.state.containers[container["Id"]]
+            self.state.emit("container", "destroy", container["Id"], container["Names"][0][1:])
+        self._json(204)
+
+    def container_stats(self, query, body, ref):
+        """A synthetic sample whose counters grow with the container's uptime"""
+        with self.state.lock:
+            container = self.state.find(ref)
+            if container is None:
+                return self._error(404, f"No such container: {ref}")
+            container_id, uptime = container["Id"], time.time() - container["Created"]
+        now = time.time()
+        weight = int(container_id[:4], 16) / 0xFFFF
+        cpu = int(uptime * 1e9 * (0.02 + 0.3 * weight) + 2e8 * math.sin(uptime))
+        self._json(200, {
+            "read": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
+            "cpu_stats": {"cpu_usage": {"total_usage": cpu}, "system_cpu_usage": int(now * 1e9 * 4),
+                          "online_cpus": 4},
+            "memory_stats": {"usage": int((50 + 400 * weight) * 2 ** 20 * (1 + 0.1 * random.random())),
+                             "limit": 8 * 2 ** 30},
+            "networks": {"eth0": {"rx_bytes": int(uptime * 20_000 * weight), "tx_bytes": int(uptime * 8_000 * weight)}},
+            "blkio_stats": {"io_service_bytes_recursive": [
+                {"op": "read", "value": int(uptime * 1_000 * weight)}, {"op": "write", "value": int(uptime * 3_000 * weight)},
+            ]},
+        })
+
+    def pull_image(self, query, body):
+        image = query.get("fromImage", "")
+        # Digest references carry no tag
+        tag = image if "@" in image else f"{image}:{query.get('tag') or 'latest'}"
+        self._start_chunked()
+        self._chunk({"status": f"Pulling from {image}", "id": query.get("tag") or image.rsplit("@", 1)[-1]})
+        for layer in range(3):
+            time.sleep(self.state.pull_delay)
+            self._chunk({"status": "Pull complete", "id": f"layer{layer}"})
+        with self.state.lock:
+            self.state.add_image(tag)
+        self._chunk({"status": f"Status: Downloaded newer image for {tag}"})
+        self._end_chunked()
+
+
+    def events(self, query, body):
+        """Stream events from `since` until `until` (or forever), waiting for new ones"""
+        since = float(query.get("since") or time.time())
+        until = float(query["until"]) if query.get("until") else None
+        types = json.loads(query.get("filters") or "{}").get("type")
+        self._start_chunked()
+        sent = 0
+        while True:
+            with self.state.lock:
+                pending = self.state.events[sent:]
+                sent = len(self.state.events)
+                if not pending:
+                    timeout = None if until is None else until - time.time()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self.state.changed.wait(timeout=min(timeout or 1.0, 1.0))
+                    continue
+            for event in pending:
+                if event["timeNano"] / 1e9 >= since and (until is None or event["time"] < until) \
+                        and (not types or event["Type"] in types):
+                    self._chunk(event)
+        self._end_chunked()
+
+
+ROUTES = [
+    (r"/_ping", "GET", StubHandler.ping),
+    (r"/version", "GET", StubHandler.version),
+    (r"/containers/json", "GET", StubHandler.list_containers),
+    (r"/images/json", "GET", StubHandler.list_images),
+    (r"/containers/create", "POST", StubHandler.create_container),
+    (r"/containers/([^/]+)/start", "POST", StubHandler.start_container),
+    (r"/containers/([^/]+)/stop", "POST", StubHandler.stop_container),
+    (r"/containers/([^/]+)/restart", "POST", StubHandler.restart_container),
+    (r"/containers/([^/]+)/json", "GET", StubHandler.inspect_container),
+    (r"/containers/([^/]+)/exec", "POST", StubHandler.create_exec),
+    (r"/exec/([^/]+)/start", "POST", StubHandler.start_exec),
+    (r"/exec/([^/]+)/json", "GET", StubHandler.inspect_exec),
+    (r"/containers/([^/]+)/stats", "GET", StubHandler.container_stats),
+    (r"/containers/([^/]+)", "DELETE", StubHandler.remove_container),
+    (r"/images/create", "POST", StubHandler.pull_image),
+    (r"/events", "GET", StubHandler.events),
+]
+
+
+class StubDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    # Non-idempotent requests each open a connection; the default backlog of 5 refuses bursts
+    request_queue_size = 128
+
+    def __init__(self, path, state):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, StubHandler)
+        self.state = state
+
+
+def start_stub_daemon(path, state=None):
+    """Serve the stub API on path from a background thread and return the server"""
+    server = StubDaemon(path, state or StubState())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a stub Docker Engine API on a unix socket")
+    parser.add_argument("--socket", default="/tmp/docker-stub.sock")
+    parser.add_argument("--containers", type=int, default=20, help="containers to seed")
+    parser.add_argument("--pull-delay", type=float, default=0.5, help="seconds per pulled layer")
+    args = parser.parse_args()
+    server = StubDaemon(args.socket, StubState(args.containers, pull_delay=args.pull_delay))
+    print(f"Stub Docker daemon on {args.socket} ({args.containers} containers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Deterministic local stand-ins for the Gemini and LangChain clients.
+
+Selected with LLM_BACKEND=fake, these let the AI Toolkit and load_test.py
+run without network access or an API key. Responses are derived from the
+prompt, so identical prompts give identical text. Latency follows a
+log-normal time-to-first-token distribution with optional stalls, tokens
+are emitted at a fixed rate, and a configurable share of calls fail with a
+simulated rate-limit error before the first token.
+
+Settings (environment variables):
+    FAKE_LLM_FIRST_TOKEN_MS   median time to first token (default 400)
+    FAKE_LLM_SIGMA            log-normal shape of that latency (default 0.5)
+    FAKE_LLM_TOKENS_PER_SEC   output token rate (default 80)
+    FAKE_LLM_OUTPUT_TOKENS    tokens per response (default 120)
+    FAKE_LLM_FAILURE_RATE     share of calls that fail (default 0)
+    FAKE_LLM_STALL_RATE       share of calls that stall before the first token (default 0)
+    FAKE_LLM_STALL_MS         extra delay of a stalled call (default 5000)
+    FAKE_LLM_SEED             seed for the latency draws (default 0)
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+
+CHUNK_TOKENS = 8
+# Distinct prompts whose call counts are remembered (least recently used forgotten first)
+MAX_TRACKED_PROMPTS = 4096
+
+_VOCABULARY = (
+    "market customer product value growth revenue problem solution team data "
+    "platform users cost channel partner risk feedback launch pricing segment "
+    "health symptom rest water doctor sleep pain fever mild advice "
+    "the a of and to in for with on is are this that it will can"
+).split()
+
+
+class FakeLLMError(Exception):
+    """Simulated upstream failure (shaped like a provider rate-limit error)"""
+
+
+class FakeLLMConfig:
+    """Latency, throughput and failure settings shared by the fake clients"""
+
+    def __init__(self, first_token_ms=None, sigma=None, tokens_per_second=None,
+                 output_tokens=None, failure_rate=None, stall_rate=None, stall_ms=None, seed=None):
+        env = os.getenv
+        self.first_token_ms = first_token_ms if first_token_ms is not None else float(env("FAKE_LLM_FIRST_TOKEN_MS", "400"))
+        self.sigma = sigma if sigma is not None else float(env("FAKE_LLM_SIGMA", "0.5"))
+        self.tokens_per_second = tokens_per_second if tokens_per_second is not None else float(env("FAKE_LLM_TOKENS_PER_SEC", "80"))
+        self.output_tokens = output_tokens if output_tokens is not None else int(env("FAKE_LLM_OUTPUT_TOKENS", "120"))
+        self.failure_rate = failure_rate if failure_rate is not None else float(env("FAKE_LLM_FAILURE_RATE", "0"))
+        self.stall_rate = stall_rate if stall_rate is not None else float(env("FAKE_LLM_STALL_RATE", "0"))
+        self.stall_ms = stall_ms if stall_ms is not None else float(env("FAKE_LLM_STALL_MS", "5000"))
+        self.seed = seed if seed is not None else int(env("FAKE_LLM_SEED", "0"))
+
+
+class _FakeEngine:
+    """Produces deterministic text and simulated timing for a prompt"""
+
+    def __init__(self, config):
+        self.config = config
+        # sha256(prompt) -> calls so far, so long prompts are not kept alive
+        self._calls = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _rng(self, prompt):
+        # Seeded per (seed, prompt, n-th call of that prompt): reproducible
+        # regardless of how threads interleave. A prompt evicted from the LRU
+        # starts counting again from zero.
+        key = hashlib.sha256(prompt.encode("utf-8")).digest()
+        with self._lock:
+            count = self._calls.pop(key, 0)
+            self._calls[key] = count + 1
+            if len(self._calls) > MAX_TRACKED_PROMPTS:
+                self._calls.popitem(last=False)
+        digest = hashlib.sha256(f"{self.config.seed}\x00{count}\x00{prompt}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def text_for(self, prompt):
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+        words = random.Random(int.from_bytes(digest[:8], "big"))
+        tokens = [words.choice(_VOCABULARY) for _ in range(self.config.output_tokens)]
+        return f"[simulated {digest[:4].hex()}] " + " ".join(tokens)
+
+    def stream(self, prompt):
+        """Yield text chunks with simulated first-token delay and token rate"""
+        config = self.config
+        rng = self._rng(prompt)
+        first_token = rng.lognormvariate(0.0, config.sigma) * config.first_token_ms / 1000.0
+        if rng.random() < config.stall_rate:
+            first_token += config.stall_ms / 1000.0
+        fails = rng.random() < config.failure_rate
+
+        time.sleep(first_token)
+        if fails:
+            raise FakeLLMError("429 Resource has been exhausted (simulated)")
+
+        words = self.text_for(prompt).split(" ")
+        per_token = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        for start in range(0, len(words), CHUNK_TOKENS):
+            if start:
+                time.sleep(per_token * CHUNK_TOKENS)
+            chunk = " ".join(words[start:start + CHUNK_TOKENS])
+            yield chunk if start == 0 else " " + chunk
+
+    def complete(self, prompt):
+        return "".join(self.stream(prompt))
+
+
+class FakeMessage:
+    """Shaped like a LangChain AIMessage / AIMessageChunk"""
+
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeChatModel:
+    """LangChain-style chat model: invoke() and stream()"""
+
+    def __init__(self, model_name, engine, temperature=0.7):
+        self.model = model_name
+        self.temperature = temperature
+        self._engine = engine
+
+    def invoke(self, prompt):
+        return FakeMessage(self._engine.complete(_prompt_text(prompt)))
+
+    def stream(self, prompt):
+        for text in self._engine.stream(_prompt_text(prompt)):
+            yield FakeMessage(text)
+
+
+class FakeResponseChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeChatSession:
+    """google.generativeai ChatSession stand-in"""
+
+    def __init__(self, engine, history):
+        self._engine = engine
+        self.history = list(history or [])
+
+    def send_message(self, prompt, stream=False):
+        context = "\n".join(part for message in self.history for part in message.get("parts", []))
+        full_prompt = f"{context}\n{prompt}"
+        self.history.append({"role": "user", "parts": [prompt]})
+        if stream:
+            return (FakeResponseChunk(text) for text in self._engine.stream(full_prompt))
+        return FakeResponse(self._engine.complete(full_prompt))
+
+
+class FakeGenerativeModel:
+    """google.generativeai GenerativeModel stand-in"""
+
+    def __init__(self, model_name, engine):
+        self.model_name = model_name
+        self._engine = engine
+
+    def start_chat(self, history=None):
+        return FakeChatSession(self._engine, history)
+
+    def generate_content(self, prompt, stream=False):
+        return FakeChatSession(self._engine, []).send_message(_prompt_text(prompt), stream=stream)
+
+
+def _prompt_text(prompt):
+    if isinstance(prompt, str):
+        return prompt
+    return str(prompt)
+
+
+def build_fake_clients(model_name, temperature=0.7, config=None):
+    """Return (gemini_model, llm) stand-ins sharing one simulated engine"""
+    engine = _FakeEngine(config or FakeLLMConfig())
+    return FakeGenerativeModel(model_name, engine), FakeChatModel(model_name, engine, temperature)
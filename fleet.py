@@ -0,0 +1,178 @@
+"""
+Host inventory and fleet-wide command fan-out.
+
+The inventory is a JSON file (HOST_INVENTORY, default hosts.json next to the
+app) listing the Docker hosts the dashboard manages: a name, SSH user,
+address and free-form tags. run_on_hosts() runs one command on many hosts
+at once with a bounded thread pool. Each host gets its own timeout, so a slow
+or unreachable host delays only its own row. Remote hosts go through the
+pooled SSH connections; a host with address "local" runs on this machine.
+"""
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from command_log import log_command
+from ssh_pool import get_ssh_pool
+
+INVENTORY_PATH = os.getenv("HOST_INVENTORY",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "hosts.json"))
+DEFAULT_PARALLELISM = int(os.getenv("FLEET_PARALLELISM", "16"))
+DEFAULT_HOST_TIMEOUT = 30
+LOCAL_ADDRESSES = ("local", "localhost", "127.0.0.1")
+
+
+class Host:
+    """One inventory entry"""
+
+    def __init__(self, name, address, user="", tags=()):
+        self.name = name
+        self.address = address
+        self.user = user
+        self.tags = sorted(set(tags))
+
+    @property
+    def is_local(self):
+        return self.address in LOCAL_ADDRESSES and not self.user
+
+    @property
+    def target(self):
+        return "local" if self.is_local else f"{self.user}@{self.address}"
+
+    def to_dict(self):
+        return {"name": self.name, "address": self.address, "user": self.user, "tags": self.tags}
+
+    @classmethod
+    def from_dict(cls, data):
+        tags = data.get("tags") or []
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        return cls(data["name"], data["address"], data.get("user", ""), tags)
+
+
+class HostInventory:
+    """Hosts loaded from and saved to a JSON file"""
+
+    def __init__(self, path=INVENTORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.hosts = []
+        self.load()
+
+    def load(self):
+        with self._lock:
+            if not os.path.exists(self.path):
+                self.hosts = []
+                return
+            with open(self.path, encoding="utf-8") as f:
+                self.hosts = [Host.from_dict(entry) for entry in json.load(f)]
+
+    def save(self, hosts):
+        """Replace the inventory; names must be unique"""
+        names = [host.name for host in hosts]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate host names: {', '.join(duplicates)}")
+        with self._lock:
+            # Write then rename, so a crash never leaves a half-written inventory
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump([host.to_dict() for host in hosts], f, indent=2)
+            os.replace(temp_path, self.path)
+            self.hosts = list(hosts)
+
+    def tags(self):
+        return sorted({tag for host in self.hosts for tag in host.tags})
+
+    def select(self, names=(), tags=()):
+        """Hosts with one of the names or carrying one of the tags"""
+        names, tags = set(names), set(tags)
+        return [host for host in self.hosts if host.name in names or tags.intersection(host.tags)]
+
+
+class HostResult:
+    """Outcome of one command on one host"""
+
+    def __init__(self, host, status, returncode, output, latency):
+        self.host = host
+        self.status = status
+        self.returncode = returncode
+        self.output = output
+        self.latency = latency
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+    def row(self):
+        return {
+            "Host": self.host.name,
+            "Target": self.host.target,
+            "Status": {"ok": "✅ ok", "error": "❌ error", "timeout": "⏰ timeout"}.get(self.status, "⚠️ failed"),
+            "Exit code": self.returncode,
+            "Latency (s)": round(self.latency, 3),
+            "Output lines": len(self.output.splitlines()),
+        }
+
+
+def run_on_host(host, command, timeout=DEFAULT_HOST_TIMEOUT):
+    """Run command on one host and return a HostResult; never raises"""
+    start = time.perf_counter()
+    try:
+        if host.is_local:
+            try:
+                completed = subprocess.run(shlex.split(command), capture_output=True, text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                log_command("local", "shell", command, None, time.perf_counter() - start, status="timeout")
+                raise
+            returncode, stdout, stderr = completed.returncode, completed.stdout, completed.stderr
+            log_command("local", "shell", command, returncode, time.perf_counter() - start, len(stdout) + len(stderr))
+        else:
+            result = get_ssh_pool().run(host.user, host.address, command, timeout=timeout)
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+    except subprocess.TimeoutExpired:
+        return HostResult(host, "timeout", None, "", time.perf_counter() - start)
+    except Exception as e:
+        return HostResult(host, "failed", None, str(e), time.perf_counter() - start)
+    status = "ok" if returncode == 0 else "error"
+    return HostResult(host, status, returncode, stdout if returncode == 0 else stderr or stdout,
+                      time.perf_counter() - start)
+
+
+def run_on_hosts(hosts, command, max_workers=DEFAULT_PARALLELISM, timeout=DEFAULT_HOST_TIMEOUT,
+                 on_result=None):
+    """
+    Run command on every host concurrently, at most max_workers at a time.
+
+    Returns HostResults in inventory order. on_result(result) is called from
+    the calling thread as each host finishes, for progress display.
+    """
+    if not hosts:
+        return []
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(hosts)))) as executor:
+        futures = {executor.submit(run_on_host, host, command, timeout): host.name for host in hosts}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[host.name] for host in hosts]
+
+
+_inventory = None
+_inventory_lock = threading.Lock()
+
+
+def get_inventory():
+    """Return the host inventory shared by every session in this process"""
+    global _inventory
+    if _inventory is None:
+        with _inventory_lock:
+            if _inventory is None:
+                _inventory = HostInventory()
+    return _inventory
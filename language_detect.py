@@ -0,0 +1,399 @@
+"""
+Local language identification for the translator.
+
+Decides, without an LLM call, whether a text needs translating into a
+target language. Text that is only numbers, URLs, e-mail addresses,
+punctuation or code (nearly every line structured as code, not merely
+starting with a word like "for") is returned unchanged. Otherwise the writing system is
+checked first: most scripts (Hangul, Thai, Greek, Tamil, ...) identify the
+language on their own. Latin, Cyrillic, Devanagari and Arabic-script text
+is scored against character-trigram and word profiles built from the short
+sample texts below. Translation is skipped only when the detected language
+equals the target with a clear margin in nearly every sentence; anything
+uncertain is translated.
+"""
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Minimum letters before a profile-based guess is trusted
+MIN_LETTERS = 12
+# Best profile score must be this high and beat the runner-up by this ratio
+MIN_SCORE = 0.12
+MIN_RATIO = 1.5
+
+# Languages identified by their script alone (Unicode block ranges)
+SCRIPT_LANGUAGES = [
+    ((0xAC00, 0xD7AF), "Korean"), ((0x1100, 0x11FF), "Korean"), ((0x3130, 0x318F), "Korean"),
+    ((0x3040, 0x309F), "Japanese"), ((0x30A0, 0x30FF), "Japanese"),
+    ((0x0E00, 0x0E7F), "Thai"),
+    ((0x0370, 0x03FF), "Greek"),
+    ((0x0590, 0x05FF), "Hebrew"),
+    ((0x0980, 0x09FF), "Bengali"),
+    ((0x0A00, 0x0A7F), "Punjabi"),
+    ((0x0A80, 0x0AFF), "Gujarati"),
+    ((0x0B80, 0x0BFF), "Tamil"),
+    ((0x0C00, 0x0C7F), "Telugu"),
+    ((0x0C80, 0x0CFF), "Kannada"),
+    ((0x0D00, 0x0D7F), "Malayalam"),
+]
+# Scripts shared by several languages, disambiguated by profiles below
+SHARED_SCRIPTS = [
+    ((0x4E00, 0x9FFF), "Han"),
+    ((0x0400, 0x04FF), "Cyrillic"),
+    ((0x0900, 0x097F), "Devanagari"),
+    ((0x0600, 0x06FF), "Arabic"),
+]
+URDU_LETTERS = set("ٹڈڑںےھۓ")
+# Cyrillic letters Russian does not use (Ukrainian, Belarusian, Serbian, ...)
+NON_RUSSIAN_CYRILLIC = set("іїєґўјљњћђџ")
+
+# Short everyday samples per language; trigram and word profiles are built from these
+SAMPLES = {
+    "Latin": {
+        "English": "The meeting has been moved to Thursday afternoon. Please keep your receipt for any returns "
+                   "and let us know if you have questions about the order. We will send you an email when the "
+                   "package is ready. Thank you for your patience while we fix the issue with the website. "
+                   "It is the best way to learn what the customers really need and how they use the product.",
+        "Spanish": "La reunión se ha cambiado al jueves por la tarde. Por favor guarde su recibo para cualquier "
+                   "devolución y díganos si tiene preguntas sobre el pedido. Le enviaremos un correo cuando el "
+                   "paquete esté listo. Gracias por su paciencia mientras arreglamos el problema con la página. "
+                   "Es la mejor manera de saber lo que los clientes necesitan y cómo usan el producto.",
+        "French": "La réunion a été déplacée à jeudi après-midi. Veuillez conserver votre reçu pour tout retour "
+                  "et dites-nous si vous avez des questions sur la commande. Nous vous enverrons un courriel quand "
+                  "le colis sera prêt. Merci de votre patience pendant que nous réglons le problème du site. "
+                  "C'est la meilleure façon de savoir ce dont les clients ont besoin et comment ils utilisent le produit.",
+        "German": "Das Treffen wurde auf Donnerstagnachmittag verschoben. Bitte bewahren Sie Ihre Quittung für "
+                  "Rücksendungen auf und sagen Sie uns, wenn Sie Fragen zur Bestellung haben. Wir schicken Ihnen "
+                  "eine E-Mail, wenn das Paket bereit ist. Danke für Ihre Geduld, während wir das Problem mit der "
+                  "Webseite beheben. Es ist der beste Weg, um zu lernen, was die Kunden wirklich brauchen und wie "
+                  "sie das Produkt nutzen.",
+        "Italian": "La riunione è stata spostata a giovedì pomeriggio. Per favore conservi la ricevuta per eventuali "
+                   "resi e ci faccia sapere se ha domande sull'ordine. Le invieremo una email quando il pacco sarà "
+                   "pronto. Grazie per la pazienza mentre risolviamo il problema con il sito. È il modo migliore per "
+                   "capire di cosa hanno bisogno i clienti e come usano il prodotto.",
+        "Portuguese": "A reunião foi transferida para quinta-feira à tarde. Por favor guarde o seu recibo para "
+                      "qualquer devolução e diga-nos se tiver perguntas sobre o pedido. Vamos enviar um e-mail "
+                      "quando o pacote estiver pronto. Obrigado pela sua paciência enquanto resolvemos o problema "
+                      "com o site. É a melhor forma de saber o que os clientes precisam e como usam o produto.",
+        "Dutch": "De vergadering is verplaatst naar donderdagmiddag. Bewaar uw bon voor eventuele retouren en laat "
+                 "het ons weten als u vragen heeft over de bestelling. We sturen u een e-mail wanneer het pakket "
+                 "klaar is. Bedankt voor uw geduld terwijl wij het probleem met de website oplossen. Het is de "
+                 "beste manier om te leren wat de klanten echt nodig hebben en hoe zij het product gebruiken.",
+        "Swedish": "Mötet har flyttats till torsdag eftermiddag. Spara ditt kvitto för eventuella returer och hör "
+                   "av dig om du har frågor om beställningen. Vi skickar ett mejl när paketet är klart. Tack för "
+                   "ditt tålamod medan vi åtgärdar problemet med webbplatsen. Det är det bästa sättet att lära sig "
+                   "vad kunderna verkligen behöver och hur de använder produkten.",
+        "Norwegian": "Møtet er flyttet til torsdag ettermiddag. Ta vare på kvitteringen for eventuelle returer og "
+                     "gi oss beskjed hvis du har spørsmål om bestillingen. Vi sender deg en e-post når pakken er "
+                     "klar. Takk for tålmodigheten mens vi løser problemet med nettsiden. Det er den beste måten å "
+                     "lære hva kundene virkelig trenger og hvordan de bruker produktet.",
+        "Danish": "Mødet er blevet flyttet til torsdag eftermiddag. Gem venligst din kvittering til eventuelle "
+                  "returneringer og giv os besked, hvis du har spørgsmål om ordren. Vi sender dig en e-mail, når "
+                  "pakken er klar. Tak for din tålmodighed, mens vi løser problemet med hjemmesiden. Det er den "
+                  "bedste måde at lære, hvad kunderne virkelig har brug for, og hvordan de bruger produktet.",
+        "Finnish": "Kokous on siirretty torstai-iltapäivään. Säilytä kuitti mahdollisia palautuksia varten ja kerro "
+                   "meille, jos sinulla on kysyttävää tilauksesta. Lähetämme sinulle sähköpostin, kun paketti on "
+                   "valmis. Kiitos kärsivällisyydestäsi, kun korjaamme verkkosivuston ongelmaa. Se on paras tapa "
+                   "oppia, mitä asiakkaat todella tarvitsevat ja miten he käyttävät tuotetta.",
+        "Polish": "Spotkanie zostało przeniesione na czwartkowe popołudnie. Prosimy zachować paragon na wypadek "
+                  "zwrotu i dać nam znać, jeśli mają Państwo pytania dotyczące zamówienia. Wyślemy wiadomość e-mail, "
+                  "kiedy paczka będzie gotowa. Dziękujemy za cierpliwość, gdy naprawiamy problem ze stroną. To "
+                  "najlepszy sposób, aby dowiedzieć się, czego klienci naprawdę potrzebują i jak używają produktu.",
+        "Turkish": "Toplantı perşembe öğleden sonraya ertelendi. Lütfen iade için fişinizi saklayın ve sipariş "
+                   "hakkında sorularınız varsa bize bildirin. Paket hazır olduğunda size bir e-posta göndereceğiz. "
+                   "Web sitesindeki sorunu çözerken sabrınız için teşekkür ederiz. Müşterilerin gerçekten neye "
+                   "ihtiyaç duyduğunu ve ürünü nasıl kullandıklarını öğrenmenin en iyi yolu budur.",
+        "Indonesian": "Rapat telah dipindahkan ke hari Kamis sore. Silakan simpan struk Anda untuk pengembalian "
+                      "barang dan beri tahu kami jika Anda memiliki pertanyaan tentang pesanan. Kami akan mengirim "
+                      "email ketika paket sudah siap. Terima kasih atas kesabaran Anda selama kami memperbaiki "
+                      "masalah di situs web. Ini adalah cara terbaik untuk mengetahui apa yang benar-benar "
+                      "dibutuhkan pelanggan dan bagaimana mereka menggunakan produk.",
+        "Malay": "Mesyuarat telah dipindahkan ke petang hari Khamis. Sila simpan resit anda untuk sebarang "
+                 "pemulangan dan maklumkan kepada kami jika anda mempunyai soalan mengenai pesanan. Kami akan "
+                 "menghantar e-mel apabila bungkusan sudah sedia. Terima kasih atas kesabaran anda semasa kami "
+                 "membaiki masalah laman web. Ini ialah cara terbaik untuk mengetahui apa yang sebenarnya "
+                 "diperlukan oleh pelanggan dan bagaimana mereka menggunakan produk.",
+        "Filipino": "Ang pulong ay inilipat sa Huwebes ng hapon. Pakitago ang inyong resibo para sa anumang "
+                    "pagbabalik at ipaalam sa amin kung mayroon kayong mga tanong tungkol sa order. Magpapadala "
+                    "kami ng email kapag handa na ang pakete. Salamat sa inyong pasensya habang inaayos namin ang "
+                    "problema sa website. Ito ang pinakamahusay na paraan upang malaman kung ano talaga ang "
+                    "kailangan ng mga customer at kung paano nila ginagamit ang produkto.",
+        "Vietnamese": "Cuộc họp đã được dời sang chiều thứ Năm. Vui lòng giữ biên lai của bạn để đổi trả và cho "
+                      "chúng tôi biết nếu bạn có câu hỏi về đơn hàng. Chúng tôi sẽ gửi email cho bạn khi gói hàng "
+                      "đã sẵn sàng. Cảm ơn sự kiên nhẫn của bạn trong khi chúng tôi sửa lỗi trên trang web. Đây là "
+                      "cách tốt nhất để hiểu khách hàng thực sự cần gì và họ sử dụng sản phẩm như thế nào.",
+    },
+    "Cyrillic": {
+        "Russian": "Встреча перенесена на вечер четверга. Пожалуйста, сохраните чек для возможного возврата и "
+                   "сообщите нам, если у вас есть вопросы о заказе. Мы отправим вам письмо, когда посылка будет "
+                   "готова. Спасибо за терпение, пока мы исправляем проблему с сайтом. Это лучший способ понять, "
+                   "что действительно нужно клиентам и как они используют продукт.",
+    },
+    "Devanagari": {
+        "Hindi": "बैठक को गुरुवार दोपहर तक के लिए टाल दिया गया है। कृपया किसी भी वापसी के लिए अपनी रसीद रखें और "
+                 "अगर आपके पास ऑर्डर के बारे में कोई सवाल है तो हमें बताएं। जब पैकेज तैयार होगा तो हम आपको ईमेल "
+                 "भेजेंगे। वेबसाइट की समस्या ठीक करते समय आपके धैर्य के लिए धन्यवाद। यह जानने का सबसे अच्छा तरीका है "
+                 "कि ग्राहकों को वास्तव में क्या चाहिए और वे उत्पाद का उपयोग कैसे करते हैं।",
+        "Marathi": "बैठक गुरुवार दुपारपर्यंत पुढे ढकलण्यात आली आहे. कृपया कोणत्याही परताव्यासाठी तुमची पावती जपून "
+                   "ठेवा आणि ऑर्डरबद्दल काही प्रश्न असल्यास आम्हाला कळवा. पॅकेज तयार झाल्यावर आम्ही तुम्हाला ईमेल "
+                   "पाठवू. वेबसाइटची समस्या दुरुस्त करत असताना तुमच्या संयमाबद्दल धन्यवाद. ग्राहकांना खरोखर काय "
+                   "हवे आहे आणि ते उत्पादन कसे वापरतात हे जाणून घेण्याचा हा सर्वोत्तम मार्ग आहे.",
+    },
+    "Arabic": {
+        "Arabic": "تم تأجيل الاجتماع إلى بعد ظهر يوم الخميس. يرجى الاحتفاظ بالإيصال لأي عملية إرجاع وإخبارنا إذا "
+                  "كانت لديك أسئلة حول الطلب. سنرسل لك بريدا إلكترونيا عندما تكون الحزمة جاهزة. شكرا لصبرك بينما "
+                  "نصلح المشكلة في الموقع. هذه هي أفضل طريقة لمعرفة ما يحتاجه العملاء حقا وكيف يستخدمون المنتج.",
+        "Urdu": "میٹنگ کو جمعرات کی دوپہر تک ملتوی کر دیا گیا ہے۔ براہ کرم کسی بھی واپسی کے لیے اپنی رسید سنبھال کر "
+                "رکھیں اور اگر آپ کے پاس آرڈر کے بارے میں کوئی سوال ہو تو ہمیں بتائیں۔ جب پیکج تیار ہوگا تو ہم آپ کو "
+                "ای میل بھیجیں گے۔ ویب سائٹ کا مسئلہ ٹھیک کرنے کے دوران آپ کے صبر کا شکریہ۔",
+    },
+}
+
+_URL = re.compile(r"\b(?:https?://|www\.)\S+|\b[\w.+-]+@[\w-]+\.[\w.-]+\b", re.IGNORECASE)
+# Lines that are code by structure alone, not because they start with a word like "for" or "if"
+_CODE_PATTERNS = [re.compile(pattern) for pattern in (
+    r"^[\s{}\[\]();,]+$",                                               # brackets only
+    r"^\s*(?:if|for|while|switch|catch|function\s+\w+)\s*\(",            # keyword (
+    r"^\s*(?:def|class)\s+\w+\s*[(:]",
+    r"^\s*(?:if|elif|while)\s+.*(?:[=<>!]=?|\w\(|\w\.\w|\w\[).*:\s*$",    # Python condition:
+    r"^\s*for\s+\w+(?:\s*,\s*\w+)*\s+in\s+\S+.*:\s*$",
+    r"^\s*(?:else|try|finally)\s*:\s*$",
+    r"^\s*(?:import\s+[\w.]+(?:\s+as\s+\w+)?(?:\s*,\s*[\w.]+)*|from\s+[\w.]+\s+import\s+[\w*, ]+)\s*;?\s*$",
+    r"^\s*(?:const|let|var)\s+\w+\s*=",
+    r"^\s*#include\s*[<\"]",
+    r"^\s*(?:SELECT|INSERT|UPDATE|DELETE)\b.*\b(?:FROM|INTO|SET|WHERE)\b",
+    r"^\s*[\w.]+\(.*\)\s*[;{]?\s*$",                                     # call(...)
+    r"^.*(?:\w\(|=|->|=>).*[;{}]\s*$",                                    # statement; or block {
+)]
+# Optional [+-*/]= assignment to an identifier, attribute or subscript
+_ASSIGNMENT = re.compile(r"^\s*(?:return\s+|[A-Za-z_][\w.]*(?:\[[^\]]*\])?\s*[+\-*/]?=(?!=)\s*)(.+?)\s*;?\s*$")
+# Words that may stand next to each other in an expression
+_EXPRESSION_WORDS = {"and", "or", "not", "in", "is", "if", "else", "new", "await", "lambda", "typeof", "None",
+                     "True", "False", "null", "true", "false"}
+_STRING = re.compile(r"\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'")
+_ADJACENT = re.compile(r"([\w.]+)\s+(?=([\w.]+))")
+# Share of lines that must be code before a text is returned untranslated
+CODE_SHARE = 0.9
+# Share of the letters that must be in the target language before translation is skipped
+SAME_LANGUAGE_CONFIDENCE = 0.85
+_WORD = re.compile(r"[^\W\d_]+", re.UNICODE)
+_SENTENCE = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+
+def _script_of(char):
+    code = ord(char)
+    for (low, high), language in SCRIPT_LANGUAGES:
+        if low <= code <= high:
+            return language
+    for (low, high), script in SHARED_SCRIPTS:
+        if low <= code <= high:
+            return script
+    if char.isalpha() and code < 0x0250 or 0x1E00 <= code <= 0x1EFF:
+        return "Latin"
+    return None
+
+
+def _trigrams(text):
+    counts = Counter()
+    for word in _WORD.findall(text.lower()):
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            counts[padded[i:i + 3]] += 1
+    return counts
+
+
+def _cosine(a, b, b_norm):
+    dot = sum(count * b.get(gram, 0) for gram, count in a.items())
+    a_norm = math.sqrt(sum(count * count for count in a.values()))
+    return dot / (a_norm * b_norm) if a_norm and b_norm else 0.0
+
+
+class _Profiles:
+    """Trigram and vocabulary profiles per language, built once from SAMPLES"""
+
+    def __init__(self):
+        self.by_script = {}
+        for script, samples in SAMPLES.items():
+            profiles = {}
+            for language, sample in samples.items():
+                trigrams = _trigrams(sample)
+                norm = math.sqrt(sum(count * count for count in trigrams.values()))
+                vocabulary = {word.lower() for word in _WORD.findall(sample)}
+                profiles[language] = (trigrams, norm, vocabulary)
+            self.by_script[script] = profiles
+
+    def scores(self, script, text):
+        """Score each language of a script: trigram cosine plus share of known words"""
+        profiles = self.by_script.get(script, {})
+        trigrams = _trigrams(text)
+        words = [word.lower() for word in _WORD.findall(text)]
+        scores = {}
+        for language, (profile, norm, vocabulary) in profiles.items():
+            known = sum(1 for word in words if word in vocabulary) / len(words) if words else 0.0
+            scores[language] = 0.6 * _cosine(trigrams, profile, norm) + 0.4 * known
+        return scores
+
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+
+def _get_profiles():
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                _profiles = _Profiles()
+    return _profiles
+
+
+def _balanced(line):
+    """True if the parentheses and square brackets of a line pair up"""
+    stack = []
+    for char in _STRING.sub("", line):
+        if char in "([":
+            stack.append(char)
+        elif char in ")]":
+            if not stack or stack.pop() != "([" [")]".index(char)]:
+                return False
+    return not stack
+
+
+def _is_expression(text):
+    """True if text reads as an expression: no two plain words side by side, as in prose"""
+    text = _STRING.sub('""', text)
+    return not any(left not in _EXPRESSION_WORDS and right not in _EXPRESSION_WORDS
+                   for left, right in _ADJACENT.findall(text))
+
+
+def is_code_line(line):
+    """True if a line has the structure of code, with balanced brackets"""
+    if not _balanced(line):
+        return False
+    if any(pattern.match(line) for pattern in _CODE_PATTERNS):
+        return True
+    assignment = _ASSIGNMENT.match(line)
+    return bool(assignment) and _is_expression(assignment.group(1))
+
+
+def is_untranslatable(text):
+    """True for text with no natural language: numbers, URLs, symbols or code"""
+    stripped = _URL.sub(" ", text)
+    letters = sum(1 for char in stripped if char.isalpha())
+    if letters < 2:
+        return True
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    code_lines = sum(1 for line in lines if is_code_line(line))
+    return bool(lines) and code_lines >= CODE_SHARE * len(lines)
+
+
+def _profile_language(script, text):
+    """Best-scoring language of a script for text, or None without a clear margin"""
+    scores = _get_profiles().scores(script, text)
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best, best_score = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+    if best_score < MIN_SCORE or best_score < runner_up * MIN_RATIO:
+        return None
+    return best
+
+
+def _agreement(script, text, language):
+    """
+    Share of the letters, over sentences long enough to identify, in
+    sentences identified as language. Sentences too close to call count
+    against it; 1.0 when no sentence is long enough on its own.
+    """
+    agreeing = total = 0
+    for sentence in _SENTENCE.split(text):
+        letters = sum(1 for char in sentence if _script_of(char) == script)
+        if letters < MIN_LETTERS:
+            continue
+        total += letters
+        if _profile_language(script, sentence) == language:
+            agreeing += letters
+    return agreeing / total if total else 1.0
+
+
+def detect_language(text):
+    """
+    Identify the dominant language of text.
+
+    Returns (language, confidence). For languages told by their script,
+    confidence is the fraction of letters in that script; for languages
+    told apart by profiles, it is further scaled by the share of
+    sentences identified as that language, so a Spanish text with one
+    English sentence is not taken for English. (None, 0.0) when the text
+    is too short or too close between languages to tell.
+    """
+    text = unicodedata.normalize("NFC", _URL.sub(" ", text))
+    scripts = Counter(script for script in map(_script_of, text) if script)
+    if not scripts:
+        return None, 0.0
+    script, count = scripts.most_common(1)[0]
+    share = count / sum(scripts.values())
+
+    if script == "Han":
+        # Kana anywhere means Japanese; Han alone is read as Chinese
+        return ("Japanese", share) if scripts.get("Japanese") else ("Chinese", share)
+    if script == "Arabic":
+        return ("Urdu", share) if any(char in URDU_LETTERS for char in text) else ("Arabic", share)
+    if script not in SAMPLES:
+        return script, share
+    if script == "Cyrillic" and any(char in NON_RUSSIAN_CYRILLIC for char in text.lower()):
+        return None, 0.0
+    if count < MIN_LETTERS:
+        return None, 0.0
+
+    best = _profile_language(script, text)
+    if best is None:
+        return None, 0.0
+    return best, share * _agreement(script, text, best)
+
+
+def needs_translation(text, target_language):
+    """
+    Return (needed, reason). reason explains a skip: "no translatable text" for
+    numbers, URLs and code, or "already <language>".
+    """
+    if is_untranslatable(text):
+        return False, "no translatable text"
+    language, confidence = detect_language(text)
+    if language == target_language and confidence >= SAME_LANGUAGE_CONFIDENCE:
+        return False, f"already {language}"
+    return True, None
+
+
+class SkipCounter:
+    """Counts translations answered locally, per reason"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.skipped = Counter()
+
+    def record(self, reason):
+        with self._lock:
+            self.checked += 1
+            if reason:
+                self.skipped["no text" if reason.startswith("no ") else "same language"] += 1
+
+    def stats(self):
+        with self._lock:
+            skipped = sum(self.skipped.values())
+            return {
+                "checked": self.checked,
+                "skipped": skipped,
+                "skip_rate": skipped / self.checked if self.checked else 0.0,
+                **{f"skipped_{reason.replace(' ', '_')}": count for reason, count in self.skipped.items()},
+            }
+
+
+_skips = SkipCounter()
+
+
+def get_skip_counter():
+    return _skips
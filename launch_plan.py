@@ -0,0 +1,440 @@
+"""
+Dependency-aware launch plans for multi-container stacks.
+
+A plan is a YAML or JSON document naming containers with their image,
+optional env, ports, labels, command, depends_on list and health check:
+
+    containers:
+      db:
+        image: postgres:16
+        env: {POSTGRES_PASSWORD: secret}
+        health: {command: pg_isready -U postgres, interval: 1, timeout: 60}
+      web:
+        image: nginx:latest
+        ports: ["8080:80"]
+        depends_on: [db]
+
+The plan runs as a DAG. Every distinct image is pulled at once, and each
+container starts as soon as its image is present and all its dependencies
+are healthy, so independent branches come up in parallel. A container is
+healthy when it is running and, if it has a health command, when that
+command exits 0 inside it. Each step records where its time went (waiting,
+pulling, creating, health checks) so slow stack startups can be explained.
+"""
+import json
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from command_log import log_command
+from docker_engine import DockerEngineError
+
+DEFAULT_PLAN_PARALLELISM = 8
+DEFAULT_HEALTH_INTERVAL = 1.0
+DEFAULT_HEALTH_TIMEOUT = 60.0
+EXAMPLE_PLAN = """\
+name: demo-stack
+containers:
+  db:
+    image: postgres:16
+    env: {POSTGRES_PASSWORD: example}
+    health: {command: pg_isready -U postgres, interval: 1, timeout: 60}
+  cache:
+    image: redis:7
+    health: {command: redis-cli ping}
+  api:
+    image: python:3.12-slim
+    command: python -m http.server 8000
+    depends_on: [db, cache]
+  web:
+    image: nginx:latest
+    ports: ["8080:80"]
+    depends_on: [api]
+"""
+
+
+class LaunchPlanError(ValueError):
+    """The plan document is malformed or its dependencies cannot be ordered"""
+
+
+def _mapping(name, field, value):
+    """A {str: str} dict from a mapping or a compose-style ["KEY=VALUE", ...] list"""
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return {str(key): "" if item is None else str(item) for key, item in value.items()}
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        pairs = {}
+        for item in value:
+            key, _, item_value = item.partition("=")
+            if not key:
+                raise LaunchPlanError(f"container {name!r}: {field} entry {item!r} has no key")
+            pairs[key] = item_value
+        return pairs
+    raise LaunchPlanError(f"container {name!r}: {field} must be a mapping or a list of KEY=VALUE strings")
+
+
+def _string_list(name, field, value):
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(item, (str, int)) for item in value):
+        raise LaunchPlanError(f"container {name!r}: {field} must be a list of strings")
+    return [str(item) for item in value]
+
+
+def _seconds(name, field, value):
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise LaunchPlanError(f"container {name!r}: health {field} must be a number of seconds, not {value!r}") from None
+    if seconds <= 0:
+        raise LaunchPlanError(f"container {name!r}: health {field} must be positive")
+    return seconds
+
+
+class ContainerSpec:
+    """One container of a plan; malformed fields raise LaunchPlanError"""
+
+    def __init__(self, name, data):
+        if not isinstance(data, dict) or not data.get("image"):
+            raise LaunchPlanError(f"container {name!r} needs an image")
+        self.name = name
+        self.image = str(data["image"])
+        self.env = _mapping(name, "env", data.get("env"))
+        self.ports = _string_list(name, "ports", data.get("ports"))
+        self.labels = _mapping(name, "labels", data.get("labels"))
+        command = data.get("command")
+        if command is not None and not isinstance(command, str):
+            raise LaunchPlanError(f"container {name!r}: command must be a string")
+        self.command = command
+        self.depends_on = _string_list(name, "depends_on", data.get("depends_on"))
+        health = data.get("health")
+        if health is None:
+            health = {}
+        elif isinstance(health, str):
+            # Shorthand: the health command alone
+            health = {"command": health}
+        elif not isinstance(health, dict):
+            raise LaunchPlanError(f"container {name!r}: health must be a command or a mapping")
+        self.health_command = health.get("command")
+        if self.health_command is not None and not isinstance(self.health_command, str):
+            raise LaunchPlanError(f"container {name!r}: health command must be a string")
+        self.health_interval = _seconds(name, "interval", health.get("interval", DEFAULT_HEALTH_INTERVAL))
+        self.health_timeout = _seconds(name, "timeout", health.get("timeout", DEFAULT_HEALTH_TIMEOUT))
+
+    def cli_run(self):
+        """The equivalent `docker run` command line"""
+        parts = ["docker", "run", "-dit", f"--name={self.name}"]
+        for key, value in self.env.items():
+            parts += ["-e", f"{key}={value}"]
+        for port in self.ports:
+            parts += ["-p", port]
+        for key, value in self.labels.items():
+            parts += ["-l", f"{key}={value}"]
+        parts.append(self.image)
+        if self.command:
+            parts += ["sh", "-c", self.command]
+        return shlex.join(parts)
+
+
+class LaunchPlan:
+    """A validated, topologically ordered set of ContainerSpecs"""
+
+    def __init__(self, name, containers):
+        self.name = name
+        self.containers = containers
+        for spec in containers.values():
+            for dependency in spec.depends_on:
+                if dependency not in containers:
+                    raise LaunchPlanError(f"{spec.name} depends on unknown container {dependency!r}")
+        self.order = self._topological_order()
+
+    def _topological_order(self):
+        remaining = {name: set(spec.depends_on) for name, spec in self.containers.items()}
+        order = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                raise LaunchPlanError(f"dependency cycle between {', '.join(sorted(remaining))}")
+            order += ready
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    @property
+    def images(self):
+        return sorted({spec.image for spec in self.containers.values()})
+
+
+def parse_plan(text):
+    """Build a LaunchPlan from YAML or JSON text"""
+    text = text.strip()
+    if not text:
+        raise LaunchPlanError("the plan is empty")
+    if text.startswith("{"):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise LaunchPlanError(f"invalid JSON: {e}") from e
+    else:
+        try:
+            import yaml
+        except ImportError as e:
+            raise LaunchPlanError("YAML plans need PyYAML (pip install pyyaml); JSON plans work without it") from e
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise LaunchPlanError(f"invalid YAML: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("containers"), dict) or not data["containers"]:
+        raise LaunchPlanError("the plan needs a non-empty 'containers' mapping")
+    containers = {str(name): ContainerSpec(str(name), spec) for name, spec in data["containers"].items()}
+    return LaunchPlan(str(data.get("name") or "stack"), containers)
+
+
+class EngineLauncher:
+    """Launch steps through the Docker Engine API"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def has_image(self, image):
+        return self.engine.has_image(image)
+
+    def _logged(self, command, call):
+        # CLI launches are logged by the CLI runner; Engine API steps are logged here
+        start = time.perf_counter()
+        try:
+            call()
+        except DockerEngineError:
+            log_command(self.engine.name, "engine", command, None, time.perf_counter() - start, status="error")
+            raise
+        log_command(self.engine.name, "engine", command, 0, time.perf_counter() - start)
+
+    def pull(self, image):
+        self._logged(f"docker pull {image}", lambda: self.engine.pull(image))
+
+    def remove(self, name):
+        try:
+            self.engine.remove(name)
+        except DockerEngineError as e:
+            if e.status != 404:
+                raise
+
+    def run(self, spec):
+        self._logged(spec.cli_run(), lambda: self.engine.run(spec.name, spec.image, env=spec.env, ports=spec.ports,
+                                                             labels=spec.labels, command=spec.command))
+
+    def is_running(self, name):
+        return self.engine.is_running(name)
+
+    def check(self, name, command):
+        return self.engine.exec_run(name, command) == 0
+
+
+class CliLauncher:
+    """Launch steps through the docker CLI; run(command) returns stdout or raises DockerEngineError"""
+
+    def __init__(self, run):
+        self._run = run
+
+    def has_image(self, image):
+        try:
+            self._run(f"docker image inspect --format '{{{{.Id}}}}' {shlex.quote(image)}")
+            return True
+        except DockerEngineError:
+            return False
+
+    def pull(self, image):
+        self._run(f"docker pull {shlex.quote(image)}")
+
+    def remove(self, name):
+        try:
+            self._run(f"docker rm -f {shlex.quote(name)}")
+        except DockerEngineError as e:
+            if "No such container" not in str(e):
+                raise
+
+    def run(self, spec):
+        self._run(spec.cli_run())
+
+    def is_running(self, name):
+        return self._run(f"docker inspect --format '{{{{.State.Running}}}}' {shlex.quote(name)}").strip() == "true"
+
+    def check(self, name, command):
+        try:
+            self._run(f"docker exec {shlex.quote(name)} sh -c {shlex.quote(command)}")
+            return True
+        except DockerEngineError:
+            return False
+
+
+class StepResult:
+    """Outcome and timing breakdown of one pull or container step"""
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.status = "pending"
+        self.message = ""
+        # Seconds since the launch started
+        self.started = None
+        self.finished = None
+        self.phases = {}
+
+    @property
+    def ok(self):
+        return self.status in ("ok", "cached")
+
+    @property
+    def duration(self):
+        return self.finished - self.started if self.finished is not None and self.started is not None else 0.0
+
+    def row(self):
+        icons = {"ok": "✅ ok", "cached": "📦 cached", "failed": "❌ failed", "skipped": "⏭️ skipped"}
+        return {
+            "Step": self.name, "Kind": self.kind, "Status": icons.get(self.status, self.status),
+            "Start (s)": round(self.started, 2) if self.started is not None else None,
+            "End (s)": round(self.finished, 2) if self.finished is not None else None,
+            **{f"{phase.capitalize()} (s)": round(seconds, 2) for phase, seconds in self.phases.items()},
+            "Message": self.message,
+        }
+
+
+class PlanRun:
+    """Runs a LaunchPlan through a launcher and collects the StepResults"""
+
+    def __init__(self, plan, launcher, max_workers=DEFAULT_PLAN_PARALLELISM, replace=False, on_step=None):
+        self.plan = plan
+        self.launcher = launcher
+        self.max_workers = max_workers
+        self.replace = replace
+        # on_step(result) is called from the calling thread whenever a step finishes
+        self.on_step = on_step
+        self.steps = {}
+        for image in plan.images:
+            self.steps[f"pull {image}"] = StepResult(image, "pull")
+        for name in plan.order:
+            self.steps[name] = StepResult(name, "container")
+        self._origin = None
+        self.elapsed = 0.0
+
+    def _now(self):
+        return time.monotonic() - self._origin
+
+    def _prerequisites(self, key):
+        result = self.steps[key]
+        if result.kind == "pull":
+            return []
+        spec = self.plan.containers[key]
+        return [f"pull {spec.image}"] + spec.depends_on
+
+    def _pull(self, result):
+        result.started = self._now()
+        if self.launcher.has_image(result.name):
+            result.status = "cached"
+        else:
+            self.launcher.pull(result.name)
+            result.status = "ok"
+        result.finished = self._now()
+        result.phases["pull"] = result.duration
+
+    def _launch(self, result):
+        spec = self.plan.containers[result.name]
+        result.started = self._now()
+        # Time between the launch starting and this container's prerequisites being met
+        result.phases["wait"] = result.started
+        mark = time.monotonic()
+        if self.replace:
+            self.launcher.remove(spec.name)
+        self.launcher.run(spec)
+        result.phases["create"] = time.monotonic() - mark
+        mark = time.monotonic()
+        deadline = mark + spec.health_timeout
+        while True:
+            healthy = self.launcher.is_running(spec.name) and (
+                not spec.health_command or self.launcher.check(spec.name, spec.health_command)
+            )
+            if healthy:
+                break
+            if time.monotonic() + spec.health_interval > deadline:
+                result.phases["health"] = time.monotonic() - mark
+                raise DockerEngineError(f"not healthy after {spec.health_timeout:.0f}s")
+            time.sleep(spec.health_interval)
+        result.phases["health"] = time.monotonic() - mark
+        result.status = "ok"
+        result.finished = self._now()
+
+    def _execute(self, key):
+        result = self.steps[key]
+        try:
+            if result.kind == "pull":
+                self._pull(result)
+            else:
+                self._launch(result)
+        except Exception as e:
+            # Any failure must settle the step, or its dependents would wait forever
+            self._fail(result, e)
+        return key
+
+    def _fail(self, result, error):
+        result.status = "failed"
+        result.message = str(error) or type(error).__name__
+        result.finished = self._now()
+
+    def run(self):
+        """Execute every step, each as soon as its prerequisites succeed; returns the StepResults"""
+        self._origin = time.monotonic()
+        waiting = set(self.steps)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            while waiting or running:
+                progressed = False
+                for key in sorted(waiting):
+                    prerequisites = [self.steps[other] for other in self._prerequisites(key)]
+                    if any(other.status in ("failed", "skipped") for other in prerequisites):
+                        failed = [other.name for other in prerequisites if other.status in ("failed", "skipped")]
+                        self.steps[key].status = "skipped"
+                        self.steps[key].message = f"prerequisite failed: {', '.join(failed)}"
+                        waiting.discard(key)
+                        progressed = True
+                        if self.on_step is not None:
+                            self.on_step(self.steps[key])
+                    elif all(other.ok for other in prerequisites):
+                        waiting.discard(key)
+                        progressed = True
+                        running[executor.submit(self._execute, key)] = key
+                if not running:
+                    if progressed:
+                        continue
+                    # Nothing runs and nothing can start: settle the rest instead of spinning
+                    for key in sorted(waiting):
+                        self.steps[key].status = "skipped"
+                        self.steps[key].message = "prerequisites never completed"
+                        if self.on_step is not None:
+                            self.on_step(self.steps[key])
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._fail(self.steps[key], e)
+                    if self.steps[key].status == "pending":
+                        self._fail(self.steps[key], "step ended without a result")
+                    if self.on_step is not None:
+                        self.on_step(self.steps[key])
+        self.elapsed = self._now()
+        return list(self.steps.values())
+
+    def summary(self):
+        """Wall time next to the time the same steps would take one after another"""
+        containers = [result for result in self.steps.values() if result.kind == "container"]
+        return {
+            "containers": len(containers),
+            "healthy": sum(1 for result in containers if result.ok),
+            "elapsed": self.elapsed,
+            "sequential": sum(result.duration for result in self.steps.values()),
+        }
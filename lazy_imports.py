@@ -0,0 +1,50 @@
+"""
+Deferred imports for the dashboard's heavy dependencies.
+
+Modules such as cv2, mediapipe, sklearn, langchain and google.generativeai
+take seconds to import. Instead of paying for all of them on every cold
+start, pages call lazy_import() the first time they actually need one. The
+cost of every import is recorded so it can be shown in the sidebar.
+"""
+import importlib
+import importlib.util
+import threading
+import time
+
+# Process-wide registry of modules imported through lazy_import()
+_modules = {}
+_import_times = {}
+_lock = threading.Lock()
+
+
+def lazy_import(name):
+    """Import a module on first use and remember how long the import took"""
+    module = _modules.get(name)
+    if module is not None:
+        return module
+
+    with _lock:
+        module = _modules.get(name)
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            _import_times[name] = time.perf_counter() - start
+            _modules[name] = module
+    return module
+
+
+def is_available(name):
+    """Check whether a module is installed without importing it"""
+    if name in _modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def import_report():
+    """Return (module, seconds) pairs for every deferred import, slowest first"""
+    with _lock:
+        items = list(_import_times.items())
+    return sorted(items, key=lambda item: item[1], reverse=True)
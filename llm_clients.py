@@ -0,0 +1,165 @@
+"""
+Process-wide pool of Gemini and LangChain clients.
+
+Every browser session used to build its own genai.GenerativeModel and
+ChatGoogleGenerativeAI, each with its own HTTP connection pool. The pool
+below keeps one client bundle per (API key, model name) for the whole
+server process, so sessions using the same key share clients and their
+connections. Bundles that fail several calls in a row with transport or
+authentication errors, or grow too old, are rebuilt; other errors (bad
+requests, quota, safety blocks) say nothing about the client. The number of
+live bundles is capped with least-recently-used eviction.
+
+Note: google.generativeai keeps its API key in process-global configuration,
+so the pool re-applies genai.configure() whenever it builds a bundle.
+
+Setting LLM_BACKEND=fake swaps in the deterministic offline clients from
+fake_llm, so the same code path runs without network access.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from lazy_imports import lazy_import
+
+DEFAULT_MODEL = "gemini-1.5-flash"
+DEFAULT_TEMPERATURE = 0.7
+
+# Pool limits, overridable from the environment
+MAX_CLIENTS = int(os.getenv("LLM_MAX_CLIENTS", "8"))
+MAX_FAILURES = int(os.getenv("LLM_MAX_CLIENT_FAILURES", "3"))
+MAX_CLIENT_AGE = float(os.getenv("LLM_MAX_CLIENT_AGE", "3600"))
+# HTTP statuses and exception names that point at the client: its credentials or its connection
+CLIENT_FAULT_STATUSES = {401, 403}
+CLIENT_FAULT_ERRORS = {"Unauthenticated", "PermissionDenied", "ServiceUnavailable", "DeadlineExceeded",
+                       "TransportError", "ConnectError", "ConnectTimeout", "ReadTimeout", "RemoteProtocolError"}
+
+
+def uses_fake_backend():
+    """True when LLM_BACKEND=fake selects the offline stand-in clients"""
+    return os.getenv("LLM_BACKEND", "gemini").lower() == "fake"
+
+
+def is_client_fault(error):
+    """True for transport and authentication errors, which a rebuilt client may cure"""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if getattr(error, "code", None) in CLIENT_FAULT_STATUSES or \
+            getattr(error, "status_code", None) in CLIENT_FAULT_STATUSES:
+        return True
+    return any(cls.__name__ in CLIENT_FAULT_ERRORS for cls in type(error).__mro__)
+
+
+class ClientBundle:
+    """The Gemini and LangChain clients built for one (API key, model) pair"""
+
+    def __init__(self, key, gemini_model, llm):
+        self.key = key
+        self.gemini_model = gemini_model
+        self.llm = llm
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.failures = 0
+
+    @property
+    def model_name(self):
+        return self.key[1]
+
+
+class ClientPool:
+    """Shares client bundles across sessions with health checks and a size cap"""
+
+    def __init__(self, max_clients=MAX_CLIENTS, max_failures=MAX_FAILURES,
+                 max_age=MAX_CLIENT_AGE):
+        self.max_clients = max_clients
+        self.max_failures = max_failures
+        self.max_age = max_age
+        self._bundles = OrderedDict()
+        self._lock = threading.Lock()
+        self.created_count = 0
+        self.evicted_count = 0
+
+    def get(self, api_key, model_name=DEFAULT_MODEL):
+        """Return the shared bundle for this key and model, building it if needed"""
+        key = (api_key, model_name)
+        with self._lock:
+            bundle = self._take(key)
+            if bundle is not None:
+                return bundle
+        # Built outside the lock: client construction can be slow and must not block other keys
+        built = self._build(key)
+        with self._lock:
+            bundle = self._take(key)
+            if bundle is None:
+                # Nobody built one meanwhile
+                bundle = self._bundles[key] = built
+                self.created_count += 1
+                while len(self._bundles) > self.max_clients:
+                    self._bundles.popitem(last=False)
+                    self.evicted_count += 1
+                bundle.last_used = time.monotonic()
+            return bundle
+
+    def _take(self, key):
+        """The live bundle for key, marked used, or None after evicting an unhealthy one; caller holds the lock"""
+        bundle = self._bundles.get(key)
+        if bundle is not None and not self.is_healthy(bundle):
+            del self._bundles[key]
+            self.evicted_count += 1
+            return None
+        if bundle is not None:
+            self._bundles.move_to_end(key)
+            bundle.last_used = time.monotonic()
+        return bundle
+
+    def is_healthy(self, bundle):
+        """A bundle is healthy until it fails repeatedly or exceeds its max age"""
+        if bundle.failures >= self.max_failures:
+            return False
+        return time.monotonic() - bundle.created < self.max_age
+
+    def report_success(self, bundle):
+        """Record a successful upstream call; failures only count when consecutive"""
+        bundle.failures = 0
+
+    def report_failure(self, bundle, error=None):
+        """Count a failed call against bundle, if error is the client's fault"""
+        if error is None or is_client_fault(error):
+            bundle.failures += 1
+
+    def stats(self):
+        """Return a snapshot of the pool for display"""
+        with self._lock:
+            return {
+                "live_clients": len(self._bundles),
+                "max_clients": self.max_clients,
+                "created": self.created_count,
+                "evicted": self.evicted_count,
+            }
+
+    def _build(self, key):
+        api_key, model_name = key
+        if uses_fake_backend():
+            gemini_model, llm = lazy_import("fake_llm").build_fake_clients(model_name, DEFAULT_TEMPERATURE)
+            return ClientBundle(key, gemini_model, llm)
+
+        genai = lazy_import("google.generativeai")
+        ChatGoogleGenerativeAI = lazy_import("langchain_google_genai").ChatGoogleGenerativeAI
+
+        genai.configure(api_key=api_key)
+        gemini_model = genai.GenerativeModel(model_name)
+        llm = ChatGoogleGenerativeAI(
+            model=model_name,
+            api_key=api_key,
+            temperature=DEFAULT_TEMPERATURE
+        )
+        return ClientBundle(key, gemini_model, llm)
+
+
+_pool = ClientPool()
+
+
+def get_client_pool():
+    """Return the pool shared by every session in this process"""
+    return _pool
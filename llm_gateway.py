@@ -0,0 +1,207 @@
+"""
+Process-wide gateway in front of every upstream LLM call.
+
+Calls pass through a token bucket (requests per second across all
+sessions) and an adaptive concurrency limiter that halves the number of
+in-flight calls on provider throttling (429 / ResourceExhausted) or latency
+spikes and grows it back while calls succeed. Identical prompts that are
+already in flight are coalesced: the first caller makes the upstream call
+and later callers wait for its result, receiving streamed text as it
+arrives.
+"""
+import os
+import threading
+import time
+
+from rate_limit import TokenBucket, AdaptiveConcurrencyLimiter
+
+RATE = float(os.getenv("LLM_RATE_PER_SEC", "5"))
+BURST = float(os.getenv("LLM_RATE_BURST", "10"))
+INITIAL_CONCURRENCY = int(os.getenv("LLM_INITIAL_CONCURRENCY", "4"))
+MIN_CONCURRENCY = int(os.getenv("LLM_MIN_CONCURRENCY", "1"))
+MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+# Longest a call waits for a rate token or a concurrency slot
+QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "60"))
+
+_THROTTLE_MARKERS = ("429", "resource has been exhausted", "resourceexhausted", "rate limit", "quota")
+
+
+class GatewayTimeout(Exception):
+    """Raised when a call waited longer than the queue timeout for capacity"""
+
+
+def is_throttle_error(error):
+    """True for provider rate-limit / quota errors"""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _THROTTLE_MARKERS)
+
+
+class _Abandoned(Exception):
+    """The leading caller stopped without a result (e.g. its session reran)"""
+
+
+class _Flight:
+    """One in-flight call that other callers can wait on"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.done = False
+        self.partial = None
+        self.version = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one call"""
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key, fn, on_progress=None):
+        """
+        Run fn(progress) once per key at a time.
+
+        The leader's fn may call progress(text) with partial output; waiting
+        callers see it through their own on_progress. Returns (result,
+        shared), where shared is True for callers that reused another call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            try:
+                return self._wait(flight, on_progress), True
+            except _Abandoned:
+                return self.do(key, fn, on_progress)
+
+        def progress(text):
+            with flight.condition:
+                flight.partial = text
+                flight.version += 1
+                flight.condition.notify_all()
+            if on_progress is not None:
+                on_progress(text)
+
+        try:
+            flight.result = fn(progress)
+        except Exception as e:
+            flight.error = e
+            raise
+        except BaseException:
+            # Not a failure of the call itself: waiters retry on their own
+            flight.error = _Abandoned()
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            with flight.condition:
+                flight.done = True
+                flight.condition.notify_all()
+        return flight.result, False
+
+    def _wait(self, flight, on_progress):
+        seen = 0
+        with flight.condition:
+            while True:
+                flight.condition.wait_for(lambda: flight.done or flight.version != seen)
+                if flight.done:
+                    break
+                seen = flight.version
+                if on_progress is not None:
+                    # Render outside the lock so the leader never waits on a slow callback
+                    partial = flight.partial
+                    flight.condition.release()
+                    try:
+                        on_progress(partial)
+                    finally:
+                        flight.condition.acquire()
+        if flight.error is not None:
+            raise flight.error
+        if on_progress is not None and flight.version != seen:
+            on_progress(flight.partial)
+        return flight.result
+
+
+class LLMGateway:
+    """Rate limit, adaptive concurrency and coalescing for upstream calls"""
+
+    def __init__(self, rate=RATE, burst=BURST, limiter=None, queue_timeout=QUEUE_TIMEOUT):
+        self.bucket = TokenBucket(rate, burst)
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(
+            INITIAL_CONCURRENCY, MIN_CONCURRENCY, MAX_CONCURRENCY
+        )
+        self.flights = SingleFlight()
+        self.queue_timeout = queue_timeout
+        self.calls = 0
+        self.throttled = 0
+        self.queue_wait = 0.0
+        self._lock = threading.Lock()
+
+    def limited(self, fn):
+        """Run fn() once a rate token and a concurrency slot are available"""
+        start = time.monotonic()
+        if not self.bucket.acquire(timeout=self.queue_timeout):
+            raise GatewayTimeout("Timed out waiting for the LLM rate limit")
+        remaining = max(0.0, self.queue_timeout - (time.monotonic() - start))
+        if not self.limiter.acquire(timeout=remaining):
+            raise GatewayTimeout("Timed out waiting for a free LLM call slot")
+        began = time.monotonic()
+        with self._lock:
+            self.calls += 1
+            self.queue_wait += began - start
+
+        try:
+            result = fn()
+        except Exception as e:
+            throttled = is_throttle_error(e)
+            if throttled:
+                with self._lock:
+                    self.throttled += 1
+            self.limiter.release(throttled=throttled, error=True)
+            raise
+        except BaseException:
+            # A Streamlit rerun/stop mid-stream: return the slot without adapting the limit
+            self.limiter.release(error=True)
+            raise
+        self.limiter.release(latency=time.monotonic() - began)
+        return result
+
+    def coalesce(self, key, fn, on_progress=None):
+        """
+        Rate-limited call shared by concurrent callers with the same key.
+
+        fn receives a progress(text) callback for streamed output. Returns
+        (result, shared).
+        """
+        return self.flights.do(key, lambda progress: self.limited(lambda: fn(progress)), on_progress)
+
+    def stats(self):
+        with self._lock:
+            calls, throttled, queue_wait = self.calls, self.throttled, self.queue_wait
+        return {
+            "upstream_calls": calls,
+            "coalesced": self.flights.shared,
+            "throttled": throttled,
+            "concurrency_limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "limit_decreases": self.limiter.decreases,
+            "average_queue_wait": queue_wait / calls if calls else 0.0,
+        }
+
+
+_gateway = LLMGateway()
+
+
+def get_llm_gateway():
+    """Return the gateway shared by every session in this process"""
+    return _gateway
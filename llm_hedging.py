@@ -0,0 +1,215 @@
+"""
+Hedged LLM requests.
+
+A hedged call starts the primary request and, if it has not produced a
+first token within a threshold, sends a duplicate (to the same or a
+fallback model). Whichever produces a first token first is streamed to the
+caller; the other is cancelled by closing its response stream, which
+also unblocks a reader waiting for its next chunk. The threshold is a
+percentile of the tool's recent time-to-first-token of streaming primary
+requests (blocking calls and calls a hedge won are left out, as their
+first token says nothing about a primary's), so hedges fire on roughly the
+slowest (1 - percentile) share of calls. Hedges only fire when the global
+rate limiter has a token to spare.
+"""
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+from llm_streaming import StreamResult, close_stream
+from llm_metrics import percentile
+
+HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))
+# Threshold used until a tool has enough first-token samples
+HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "3.0"))
+HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.2"))
+HEDGE_MIN_SAMPLES = 20
+# First-token samples kept per tool for the threshold
+HEDGE_MAX_SAMPLES = 1000
+# Optional cheaper/faster model for the duplicate request
+HEDGE_MODEL = os.getenv("LLM_HEDGE_MODEL", "")
+
+PRIMARY, HEDGE = 0, 1
+
+
+class HedgeStats:
+    """Per-tool counts of hedged calls, fired hedges and hedge wins, and primary first-token times"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._first_tokens = {}
+
+    def record(self, tool, fired, hedge_won, skipped=False):
+        with self._lock:
+            counts = self._counts.setdefault(tool, {"calls": 0, "fired": 0, "hedge_won": 0, "skipped": 0})
+            counts["calls"] += 1
+            counts["fired"] += int(fired)
+            counts["hedge_won"] += int(hedge_won)
+            counts["skipped"] += int(skipped)
+
+    def record_first_token(self, tool, seconds):
+        """A streaming primary request's time to first token"""
+        with self._lock:
+            samples = self._first_tokens.get(tool)
+            if samples is None:
+                samples = self._first_tokens[tool] = deque(maxlen=HEDGE_MAX_SAMPLES)
+            samples.append(seconds)
+
+    def first_tokens(self, tool):
+        with self._lock:
+            return list(self._first_tokens.get(tool, ()))
+
+    def summary(self):
+        with self._lock:
+            rows = []
+            for tool, counts in sorted(self._counts.items()):
+                row = {"tool": tool, **counts}
+                row["fire_rate"] = counts["fired"] / counts["calls"] if counts["calls"] else 0.0
+                row["win_rate"] = counts["hedge_won"] / counts["fired"] if counts["fired"] else 0.0
+                rows.append(row)
+            return rows
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._first_tokens.clear()
+
+
+_stats = HedgeStats()
+
+
+def get_hedge_stats():
+    return _stats
+
+
+def hedge_delay(tool):
+    """Seconds to wait for a first token before hedging calls of this tool"""
+    samples = _stats.first_tokens(tool)
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    return max(HEDGE_MIN_DELAY, percentile(samples, HEDGE_PERCENTILE))
+
+
+def record_first_token(tool, seconds):
+    """Feed a plain (unhedged) streaming call's time to first token into the hedge threshold"""
+    _stats.record_first_token(tool, seconds)
+
+
+class _Attempt:
+    """One request of a hedged call, streamed by its own thread and cancellable from another"""
+
+    def __init__(self, index, chunks_fn, events):
+        self.index = index
+        self.chunks_fn = chunks_fn
+        self.events = events
+        self.cancelled = threading.Event()
+        self.chunks = None
+
+    def start(self):
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        """Feed the chunks into the shared queue until done or cancelled"""
+        try:
+            self.chunks = self.chunks_fn()
+            if self.cancelled.is_set():
+                return
+            for text in self.chunks:
+                if self.cancelled.is_set():
+                    return
+                self.events.put((self.index, "chunk", text))
+            self.events.put((self.index, "done", None))
+        except Exception as e:
+            # A cancelled attempt fails when its stream is closed under it; nobody waits for it
+            if not self.cancelled.is_set():
+                self.events.put((self.index, "error", e))
+        finally:
+            if self.cancelled.is_set():
+                close_stream(self.chunks)
+
+    def cancel(self):
+        self.cancelled.set()
+        # Closing the response wakes a pump blocked waiting for the next chunk, and frees its connection
+        if self.chunks is not None:
+            close_stream(self.chunks)
+
+
+def hedged_stream(tool, primary_fn, hedge_fn, on_text=None, delay=None, may_hedge=None, streaming=True):
+    """
+    Stream text from primary_fn(), hedging with hedge_fn() when it is slow.
+
+    Both arguments return iterables of text chunks. may_hedge() is asked
+    before firing (e.g. to take a rate-limit token); returning False skips
+    the hedge. Timings in the result are measured from the primary's start.
+    Pass streaming=False when the attempts are blocking calls wrapped as a
+    single chunk; their timings then stay out of the hedge threshold.
+    """
+    delay = hedge_delay(tool) if delay is None else delay
+    events = queue.Queue()
+    attempts = []
+
+    def start_attempt(chunks_fn):
+        attempt = _Attempt(len(attempts), chunks_fn, events)
+        attempts.append(attempt)
+        attempt.start()
+
+    def cancel_all(keep=None):
+        for attempt in attempts:
+            if attempt.index != keep:
+                attempt.cancel()
+
+    start = time.perf_counter()
+    start_attempt(primary_fn)
+    hedge_pending = True
+    skipped = False
+    winner = None
+    first_token_latency = None
+    failed = set()
+    parts = []
+
+    # Whatever ends the loop (done, an error, or on_text raising on a Streamlit rerun),
+    # no attempt may keep streaming in the background
+    try:
+        while True:
+            timeout = None
+            if winner is None and hedge_pending:
+                timeout = max(0.0, start + delay - time.perf_counter())
+            try:
+                index, kind, payload = events.get(timeout=timeout)
+            except queue.Empty:
+                hedge_pending = False
+                if may_hedge is None or may_hedge():
+                    start_attempt(hedge_fn)
+                else:
+                    skipped = True
+                continue
+
+            if winner is not None and index != winner:
+                continue
+            if kind == "error":
+                failed.add(index)
+                if winner == index or len(failed) == len(attempts):
+                    _stats.record(tool, fired=len(attempts) > 1, hedge_won=False, skipped=skipped)
+                    raise payload
+                continue
+
+            if winner is None:
+                winner = index
+                first_token_latency = time.perf_counter() - start
+                hedge_pending = False
+                cancel_all(keep=winner)
+                if winner == PRIMARY and streaming:
+                    _stats.record_first_token(tool, first_token_latency)
+            if kind == "done":
+                break
+            parts.append(payload)
+            if on_text is not None:
+                on_text("".join(parts))
+    finally:
+        cancel_all()
+
+    _stats.record(tool, fired=len(attempts) > 1, hedge_won=winner == HEDGE, skipped=skipped)
+    return StreamResult("".join(parts), first_token_latency, time.perf_counter() - start)
@@ -0,0 +1,202 @@
+"""
+In-process instrumentation for LLM calls.
+
+Every AI Toolkit call records its latency, time-to-first-token, estimated
+input/output tokens, errors and cache hits. Recent calls are kept per tool
+in bounded deques for percentiles; lifetime totals, including the sums and
+counts of the latency summaries, are kept as counters.
+The store renders a per-tool summary and a Prometheus text exposition.
+"""
+import math
+import threading
+import time
+from collections import deque
+
+MAX_SAMPLES_PER_TOOL = 1000
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token)"""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile of a list of numbers (q in 0..1)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class CallRecord:
+    __slots__ = ("timestamp", "latency", "first_token_latency", "input_tokens",
+                 "output_tokens", "error", "cache_hit")
+
+    def __init__(self, latency, first_token_latency, input_tokens, output_tokens, error, cache_hit):
+        self.timestamp = time.time()
+        self.latency = latency
+        self.first_token_latency = first_token_latency
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.error = error
+        self.cache_hit = cache_hit
+
+
+class MetricsStore:
+    """Bounded per-tool samples plus lifetime counters"""
+
+    def __init__(self, max_samples=MAX_SAMPLES_PER_TOOL):
+        self.max_samples = max_samples
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, tool, latency=0.0, first_token_latency=None, input_tokens=0,
+               output_tokens=0, error=False, cache_hit=False):
+        record = CallRecord(latency, first_token_latency, input_tokens, output_tokens, error, cache_hit)
+        with self._lock:
+            samples = self._samples.get(tool)
+            if samples is None:
+                samples = self._samples[tool] = deque(maxlen=self.max_samples)
+                self._totals[tool] = {
+                    "calls": 0, "errors": 0, "cache_hits": 0,
+                    "input_tokens": 0, "output_tokens": 0, "latency_sum": 0.0,
+                    # Successful upstream calls, the population of the latency summaries
+                    "latency_count": 0, "upstream_latency_sum": 0.0,
+                    "first_token_latency_count": 0, "first_token_latency_sum": 0.0,
+                }
+            samples.append(record)
+            totals = self._totals[tool]
+            totals["calls"] += 1
+            totals["errors"] += int(error)
+            totals["cache_hits"] += int(cache_hit)
+            totals["input_tokens"] += input_tokens
+            totals["output_tokens"] += output_tokens
+            totals["latency_sum"] += latency
+            if not error and not cache_hit:
+                totals["latency_count"] += 1
+                totals["upstream_latency_sum"] += latency
+                if first_token_latency is not None:
+                    totals["first_token_latency_count"] += 1
+                    totals["first_token_latency_sum"] += first_token_latency
+
+    def summary(self):
+        """Return one row per tool with percentiles over the retained samples"""
+        with self._lock:
+            snapshot = {tool: (list(samples), dict(self._totals[tool]))
+                        for tool, samples in self._samples.items()}
+
+        rows = []
+        for tool, (samples, totals) in sorted(snapshot.items()):
+            # Cache hits and errors would skew upstream latency percentiles
+            upstream = [s for s in samples if not s.cache_hit and not s.error]
+            latencies = [s.latency for s in upstream]
+            first_tokens = [s.first_token_latency for s in upstream if s.first_token_latency is not None]
+            row = {
+                "tool": tool,
+                "calls": totals["calls"],
+                "errors": totals["errors"],
+                "cache_hits": totals["cache_hits"],
+                "input_tokens": totals["input_tokens"],
+                "output_tokens": totals["output_tokens"],
+            }
+            for q in QUANTILES:
+                label = f"p{int(q * 100)}"
+                row[f"latency_{label}"] = percentile(latencies, q)
+                row[f"ttft_{label}"] = percentile(first_tokens, q)
+            rows.append(row)
+        return rows
+
+    def prometheus_text(self):
+        """Render the metrics in the Prometheus text exposition format"""
+        with self._lock:
+            snapshot = {tool: (list(samples), dict(self._totals[tool]))
+                        for tool, samples in self._samples.items()}
+
+        lines = []
+
+        def counter(name, help_text, key):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for tool, (_, totals) in sorted(snapshot.items()):
+                lines.append(f'{name}{{tool="{tool}"}} {totals[key]}')
+
+        counter("llm_calls_total", "LLM calls, including cache hits and errors.", "calls")
+        counter("llm_errors_total", "LLM calls that raised an error.", "errors")
+        counter("llm_cache_hits_total", "LLM calls served from a cache.", "cache_hits")
+        counter("llm_input_tokens_total", "Estimated prompt tokens sent.", "input_tokens")
+        counter("llm_output_tokens_total", "Estimated completion tokens received.", "output_tokens")
+
+        # Quantiles cover the retained samples; _sum and _count are lifetime totals, as
+        # Prometheus expects them to only ever grow
+        for name, help_text, attr, sum_key, count_key in (
+            ("llm_request_latency_seconds", "Total latency of upstream LLM calls.", "latency",
+             "upstream_latency_sum", "latency_count"),
+            ("llm_first_token_latency_seconds", "Time to first token of upstream LLM calls.",
+             "first_token_latency", "first_token_latency_sum", "first_token_latency_count"),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for tool, (samples, totals) in sorted(snapshot.items()):
+                values = [getattr(s, attr) for s in samples
+                          if not s.cache_hit and not s.error and getattr(s, attr) is not None]
+                for q in QUANTILES:
+                    value = percentile(values, q)
+                    lines.append(f'{name}{{tool="{tool}",quantile="{q}"}} '
+                                 f'{"NaN" if value is None else f"{value:.6f}"}')
+                lines.append(f'{name}_sum{{tool="{tool}"}} {totals[sum_key]:.6f}')
+                lines.append(f'{name}_count{{tool="{tool}"}} {totals[count_key]}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+_metrics = MetricsStore()
+
+
+def get_metrics():
+    """Return the metrics store shared by every session in this process"""
+    return _metrics
+
+
+def record_result(tool, result, prompt=""):
+    """Record a finished llm_streaming.StreamResult"""
+    _metrics.record(
+        tool,
+        latency=result.total_latency,
+        first_token_latency=result.first_token_latency,
+        input_tokens=estimate_tokens(prompt) if prompt else 0,
+        output_tokens=estimate_tokens(result.text) if result.text else 0,
+    )
+
+
+def measure(tool, func, prompt=""):
+    """Run a blocking call that returns text, recording its latency or its error"""
+    start = time.perf_counter()
+    try:
+        text = func()
+    except Exception:
+        _metrics.record(tool, latency=time.perf_counter() - start, error=True,
+                        input_tokens=estimate_tokens(prompt) if prompt else 0)
+        raise
+    latency = time.perf_counter() - start
+    _metrics.record(
+        tool,
+        latency=latency,
+        first_token_latency=latency,
+        input_tokens=estimate_tokens(prompt) if prompt else 0,
+        output_tokens=estimate_tokens(text) if text else 0,
+    )
+    return text
+
+
+def record_cache_hit(tool):
+    _metrics.record(tool, cache_hit=True)
@@ -0,0 +1,110 @@
+"""
+Streaming helpers for LLM calls.
+
+Turns LangChain and Gemini streaming responses into plain text chunks and
+consumes them while measuring time-to-first-token and total latency. The
+caller passes an on_text callback (typically writing into a Streamlit
+placeholder) so text is shown as it arrives.
+"""
+import time
+
+
+class StreamResult:
+    """Final text of an LLM call plus its timings in seconds"""
+
+    def __init__(self, text, first_token_latency, total_latency, cached=False, similarity=None, skipped=None):
+        self.text = text
+        self.first_token_latency = first_token_latency
+        self.total_latency = total_latency
+        self.cached = cached
+        # Set when a semantic-cache hit answered a reworded prompt
+        self.similarity = similarity
+        # Reason a translation was answered locally without any LLM call
+        self.skipped = skipped
+
+
+def chunk_text(content):
+    """Extract text from a LangChain message chunk's content"""
+    if isinstance(content, str):
+        return content
+    # Newer LangChain versions may return a list of content blocks
+    parts = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+    return "".join(parts)
+
+
+def close_stream(stream):
+    """Best-effort cancel and close of a streaming response, callable from any thread"""
+    for name in ("cancel", "close"):
+        method = getattr(stream, name, None)
+        if method is not None:
+            try:
+                method()
+            except Exception:
+                # e.g. a generator being iterated by another thread cannot be closed
+                pass
+
+
+class TextChunks:
+    """Iterable of the text chunks of a streaming response; close() ends the response itself"""
+
+    def __init__(self, response, extract):
+        self.response = response
+        self._extract = extract
+
+    def __iter__(self):
+        for chunk in self.response:
+            text = self._extract(chunk)
+            if text:
+                yield text
+
+    def close(self):
+        # Gemini responses keep their transport stream in _iterator; closing it unblocks a reader
+        close_stream(getattr(self.response, "_iterator", None) or self.response)
+
+
+def _gemini_text(chunk):
+    try:
+        return chunk.text
+    except ValueError:
+        # Chunks without text parts (e.g. safety metadata) raise on .text
+        return ""
+
+
+def iter_langchain_text(llm, prompt):
+    """Text chunks from a LangChain chat model's stream()"""
+    return TextChunks(llm.stream(prompt), lambda chunk: chunk_text(chunk.content))
+
+
+def iter_gemini_text(response):
+    """Text chunks from a google.generativeai streaming response"""
+    return TextChunks(response, _gemini_text)
+
+
+def stream_text(chunks, on_text=None):
+    """Consume text chunks, calling on_text with the text so far after each one"""
+    start = time.perf_counter()
+    first_token_latency = None
+    parts = []
+    for text in chunks:
+        if first_token_latency is None:
+            first_token_latency = time.perf_counter() - start
+        parts.append(text)
+        if on_text is not None:
+            on_text("".join(parts))
+    total_latency = time.perf_counter() - start
+    if first_token_latency is None:
+        first_token_latency = total_latency
+    return StreamResult("".join(parts), first_token_latency, total_latency)
+
+
+def timed_call(func):
+    """Run a blocking call that returns text; first token arrives with the last"""
+    start = time.perf_counter()
+    text = func()
+    total_latency = time.perf_counter() - start
+    return StreamResult(text, total_latency, total_latency)
@@ -0,0 +1,280 @@
+"""
+Offline load test for the AI Toolkit.
+
+Simulates concurrent users running ideation, full analysis, translation and
+symptom-chat scenarios through the same ai_tasks functions the Streamlit
+page uses, against the deterministic fake model from fake_llm. Needs no API
+key or network access; caches are written to a temporary directory so runs
+do not touch (or benefit from) the app's own cache.
+
+Examples:
+    python load_test.py --users 20 --duration 30
+    python load_test.py --users 50 --iterations 10 --mix ideation=3,translation=1 --prompt-pool 0
+    python load_test.py --users 10 --failure-rate 0.05 --first-token-ms 800 --prometheus
+    python load_test.py --users 10 --stall-rate 0.05 --hedge
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+SCENARIOS = ("ideation", "full_analysis", "translation", "symptom")
+
+SAMPLE_IDEAS = [
+    "A subscription service for refurbished office furniture",
+    "An app that matches home cooks with neighbours who want dinner",
+    "Drone-based inspection for small solar farms",
+    "A marketplace for renting camera gear between hobbyists",
+    "AI tutoring for vocational electrician exams",
+    "Reusable packaging logistics for local grocery delivery",
+    "A booking platform for community sports courts",
+    "Carbon tracking for small restaurant kitchens",
+]
+
+SAMPLE_TEXTS = [
+    "Good morning, how can I help you today?",
+    "The meeting has been moved to Thursday afternoon.",
+    "Please keep your receipt for any returns or exchanges.",
+    "Our office will be closed during the public holiday.",
+    "The train to the airport leaves every fifteen minutes.",
+    "Thank you for your patience while we fix the issue.",
+]
+
+SAMPLE_SYMPTOMS = [
+    "I have had a mild headache since yesterday.",
+    "It gets worse in the evening.",
+    "No fever, but I feel tired.",
+    "I have been sleeping about five hours a night.",
+    "Is there anything I can do at home?",
+]
+
+LANGUAGES = ["Spanish", "French", "German", "Hindi"]
+
+
+def parse_mix(text):
+    """Parse 'ideation=3,translation=1' into scenario weights"""
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline load test for the AI Toolkit")
+    parser.add_argument("--users", type=int, default=10, help="concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run (ignored with --iterations)")
+    parser.add_argument("--iterations", type=int, default=0, help="scenarios per user instead of a duration")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("ideation=2,full_analysis=1,translation=2,symptom=2"),
+                        help="scenario weights, e.g. ideation=2,translation=1")
+    parser.add_argument("--prompt-pool", type=int, default=len(SAMPLE_IDEAS),
+                        help="distinct ideas/texts to draw from; 0 makes every prompt unique (no cache hits)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds a user pauses between scenarios")
+    parser.add_argument("--no-stream", action="store_true", help="use blocking calls instead of streaming")
+    parser.add_argument("--hedge", action="store_true", help="hedge slow calls with a duplicate request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--first-token-ms", type=float, default=400.0, help="fake model median time to first token")
+    parser.add_argument("--sigma", type=float, default=0.5, help="fake model log-normal latency shape")
+    parser.add_argument("--tokens-per-sec", type=float, default=80.0, help="fake model output token rate")
+    parser.add_argument("--output-tokens", type=int, default=120, help="fake model tokens per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of fake calls that fail")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="share of fake calls that stall")
+    parser.add_argument("--stall-ms", type=float, default=5000.0, help="extra delay of a stalled call")
+    parser.add_argument("--prometheus", action="store_true", help="also print the Prometheus exposition")
+    return parser.parse_args(argv)
+
+
+def configure_environment(args):
+    """Point the app at the fake backend and a throwaway cache directory"""
+    os.environ["LLM_BACKEND"] = "fake"
+    os.environ["DASHBOARD_CACHE_DIR"] = tempfile.mkdtemp(prefix="dashboard-load-test-")
+    os.environ["FAKE_LLM_FIRST_TOKEN_MS"] = str(args.first_token_ms)
+    os.environ["FAKE_LLM_SIGMA"] = str(args.sigma)
+    os.environ["FAKE_LLM_TOKENS_PER_SEC"] = str(args.tokens_per_sec)
+    os.environ["FAKE_LLM_OUTPUT_TOKENS"] = str(args.output_tokens)
+    os.environ["FAKE_LLM_FAILURE_RATE"] = str(args.failure_rate)
+    os.environ["FAKE_LLM_STALL_RATE"] = str(args.stall_rate)
+    os.environ["FAKE_LLM_STALL_MS"] = str(args.stall_ms)
+    os.environ["FAKE_LLM_SEED"] = str(args.seed)
+    return os.environ["DASHBOARD_CACHE_DIR"]
+
+
+class ScenarioStats:
+    """End-to-end timings per scenario, as a user would experience them"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {name: [] for name in SCENARIOS}
+        self.first_tokens = {name: [] for name in SCENARIOS}
+        self.errors = {name: 0 for name in SCENARIOS}
+        self.cached = {name: 0 for name in SCENARIOS}
+
+    def record(self, scenario, latency, first_token=None, cached=False, error=False):
+        with self._lock:
+            if error:
+                self.errors[scenario] += 1
+                return
+            self.latencies[scenario].append(latency)
+            if first_token is not None:
+                self.first_tokens[scenario].append(first_token)
+            self.cached[scenario] += int(cached)
+
+
+class SimulatedUser:
+    """One user: picks weighted scenarios and keeps its own symptom conversation"""
+
+    def __init__(self, index, args, clients, stats):
+        self.args = args
+        self.clients = clients
+        self.stats = stats
+        self.rng = random.Random(args.seed * 100003 + index)
+        self.index = index
+        self.counter = 0
+        self.history = []
+        self.context = {"summary": "", "folded": 0}
+        self.names = list(args.mix)
+        self.weights = [args.mix[name] for name in self.names]
+
+    def pick(self, samples):
+        self.counter += 1
+        pool = self.args.prompt_pool
+        if pool <= 0:
+            return f"{self.rng.choice(samples)} (user {self.index}, #{self.counter})"
+        return samples[self.rng.randrange(min(pool, len(samples)))]
+
+    def run_once(self):
+        scenario = self.rng.choices(self.names, weights=self.weights)[0]
+        start = time.perf_counter()
+        try:
+            first_token, cached = getattr(self, f"_{scenario}")()
+        except Exception:
+            self.stats.record(scenario, time.perf_counter() - start, error=True)
+            return
+        self.stats.record(scenario, time.perf_counter() - start, first_token, cached)
+
+    def _ideation(self):
+        title = self.rng.choice(list(ai_tasks.IDEATION_PROMPTS))
+        prompt = ai_tasks.ideation_prompt(title, self.pick(SAMPLE_IDEAS))
+        result = ai_tasks.generate("ideation", self.clients, prompt, stream=not self.args.no_stream, hedge=self.args.hedge)
+        return result.first_token_latency, result.cached
+
+    def _full_analysis(self):
+        start = time.perf_counter()
+        first_section = None
+        all_cached = True
+        for _, _, cached, error in ai_tasks.full_analysis(self.clients, self.pick(SAMPLE_IDEAS)):
+            if error is not None:
+                raise error
+            if first_section is None:
+                first_section = time.perf_counter() - start
+            all_cached = all_cached and cached
+        return first_section, all_cached
+
+    def _translation(self):
+        result = ai_tasks.translate(self.clients, self.pick(SAMPLE_TEXTS), self.rng.choice(LANGUAGES),
+                                    stream=not self.args.no_stream, hedge=self.args.hedge)
+        return result.first_token_latency, result.cached
+
+    def _symptom(self):
+        if len(self.history) >= 2 * len(SAMPLE_SYMPTOMS):
+            self.history = []
+            self.context = {"summary": "", "folded": 0}
+        prompt = SAMPLE_SYMPTOMS[(len(self.history) // 2) % len(SAMPLE_SYMPTOMS)]
+        result, _ = ai_tasks.symptom_reply(self.clients, self.history, self.context, prompt,
+                                           stream=not self.args.no_stream, hedge=self.args.hedge)
+        self.history += [{"role": "user", "content": prompt},
+                         {"role": "assistant", "content": result.text}]
+        return result.first_token_latency, False
+
+    def run(self, deadline):
+        iterations = self.args.iterations
+        done = 0
+        while (done < iterations) if iterations else (time.perf_counter() < deadline):
+            self.run_once()
+            done += 1
+            if self.args.think_time:
+                time.sleep(self.args.think_time)
+
+
+def format_seconds(value):
+    return "-" if value is None else f"{value:.3f}"
+
+
+def report(stats, elapsed, args):
+    percentile = llm_metrics.percentile
+    print(f"\nUsers: {args.users}  Elapsed: {elapsed:.1f}s  "
+          f"Streaming: {'off' if args.no_stream else 'on'}  Prompt pool: {args.prompt_pool or 'unique'}")
+    header = (f"{'scenario':<14}{'ok':>6}{'err':>6}{'cached':>8}{'rps':>8}"
+              f"{'p50':>8}{'p95':>8}{'p99':>8}{'ttft50':>8}{'ttft95':>8}{'ttft99':>8}")
+    print(header)
+    print("-" * len(header))
+    total_ok = total_err = 0
+    all_latencies = []
+    for name in SCENARIOS:
+        latencies = stats.latencies[name]
+        if not latencies and not stats.errors[name]:
+            continue
+        first_tokens = stats.first_tokens[name]
+        total_ok += len(latencies)
+        total_err += stats.errors[name]
+        all_latencies += latencies
+        print(f"{name:<14}{len(latencies):>6}{stats.errors[name]:>6}{stats.cached[name]:>8}"
+              f"{len(latencies) / elapsed:>8.2f}"
+              + "".join(f"{format_seconds(percentile(latencies, q)):>8}" for q in llm_metrics.QUANTILES)
+              + "".join(f"{format_seconds(percentile(first_tokens, q)):>8}" for q in llm_metrics.QUANTILES))
+    print("-" * len(header))
+    print(f"{'total':<14}{total_ok:>6}{total_err:>6}{'':>8}{total_ok / elapsed:>8.2f}"
+          + "".join(f"{format_seconds(percentile(all_latencies, q)):>8}" for q in llm_metrics.QUANTILES))
+
+    cache_stats = response_cache.get_response_cache().stats()
+    print(f"\nResponse cache hit rate: {cache_stats['hit_rate']:.1%}  "
+          f"Translation memory: {translation_memory.get_translation_memory().stats()}")
+    print(f"Gateway: {llm_gateway.get_llm_gateway().stats()}")
+    for row in llm_hedging.get_hedge_stats().summary():
+        print(f"Hedging {row['tool']}: {row['fired']}/{row['calls']} fired ({row['fire_rate']:.1%}), "
+              f"{row['hedge_won']} won ({row['win_rate']:.1%}), {row['skipped']} skipped")
+    if args.prometheus:
+        print()
+        print(llm_metrics.get_metrics().prometheus_text())
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cache_dir = configure_environment(args)
+
+    # Imported after the environment is set: cache paths are read at import time
+    global ai_tasks, llm_gateway, llm_hedging, llm_metrics, response_cache, translation_memory
+    import ai_tasks
+    import llm_gateway
+    import llm_hedging
+    import llm_metrics
+    import response_cache
+    import translation_memory
+    from llm_clients import get_client_pool
+
+    clients = get_client_pool().get("offline")
+    stats = ScenarioStats()
+    users = [SimulatedUser(i, args, clients, stats) for i in range(args.users)]
+
+    print(f"Running {args.users} simulated users "
+          f"({f'{args.iterations} scenarios each' if args.iterations else f'{args.duration:.0f}s'}), "
+          f"cache dir {cache_dir}")
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=user.run, args=(deadline,), daemon=True) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report(stats, time.perf_counter() - start, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Rate limiting and concurrency primitives shared by the LLM call paths.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1.0):
+        """Take tokens if available right now; never blocks"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1.0, timeout=None):
+        """Block until tokens are available; returns False if timeout expires first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps in-flight calls with an AIMD limit.
+
+    Each fast, successful call raises the limit by 1/limit (about +1 per
+    full window of calls). A throttling error, or a latency above
+    spike_factor times the running average, halves it. At most one decrease
+    is applied per cooldown so a burst of failures from the same window
+    does not collapse the limit to the minimum.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=16, spike_factor=3.0, cooldown=2.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.spike_factor = spike_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.average_latency = None
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Wait for a free slot; returns False if timeout expires first"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency=None, throttled=False, error=False):
+        """Free a slot and adapt the limit to how the call went"""
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            spike = (latency is not None and self.average_latency is not None
+                     and latency > self.spike_factor * self.average_latency)
+            if throttled or spike:
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif not error:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            if latency is not None and not error:
+                self.average_latency = (latency if self.average_latency is None
+                                        else 0.9 * self.average_latency + 0.1 * latency)
+            self._condition.notify_all()
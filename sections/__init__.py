@@ -0,0 +1,27 @@
+"""
+Page plugins for the dashboard.
+
+Each sidebar section lives in its own module and is only imported the first
+time it is picked in the navigation selectbox. After that the module stays
+resident in sys.modules, so reruns on the same section skip the import.
+"""
+from lazy_imports import lazy_import
+
+# Sidebar label -> (module, render function)
+SECTIONS = {
+    "🤖 AI Toolkit": ("sections.ai", "render_ai_page"),
+    "🐳 Docker Manager": ("sections.docker", "render_docker_page"),
+    "🐧 Remote Linux Assistant": ("sections.linux", "render_linux_page"),
+    "📈 Machine Learning Models": ("sections.ml", "render_ml_page"),
+    "🛠️ Python Multi-Tool": ("sections.multitool", "render_python_utils"),
+    "🌐 Web Dev": ("sections.webdev", "render_webdev_page"),
+    "📜 Command Log": ("sections.command_history", "render_command_history_page"),
+    "📊 Diagnostics": ("sections.diagnostics", "render_diagnostics_page"),
+}
+
+
+def render_section(label):
+    """Import the section's module on first use and render its page"""
+    module_name, render_name = SECTIONS[label]
+    module = lazy_import(module_name)
+    getattr(module, render_name)()
@@ -0,0 +1,426 @@
+"""
+AI Toolkit section: ideation, translation, shell assistant and symptom checker.
+"""
+import streamlit as st
+import os
+import time
+import io
+import tempfile
+from llm_clients import get_client_pool, uses_fake_backend
+from batch_translate import translate_document, DEFAULT_WORKERS, DEFAULT_SEGMENT_TOKENS
+from rate_limit import TokenBucket
+from translation_memory import get_translation_memory
+from llm_metrics import get_metrics, record_cache_hit
+from shell_agent import get_shell_agent
+from language_detect import get_skip_counter
+from ai_tasks import (
+    IDEATION_PROMPTS, generate, ideation_prompt, full_analysis,
+    translate, segment_translator, symptom_reply
+)
+
+# Translated documents up to this size are spooled in memory, larger ones on disk
+SPOOL_BYTES = 8 * 2 ** 20
+
+TRANSLATOR_LANGUAGES = [
+    "English", "Spanish", "French", "German", "Italian", "Portuguese", 
+    "Russian", "Japanese", "Korean", "Chinese", "Hindi", "Arabic", 
+    "Dutch", "Swedish", "Norwegian", "Danish", "Finnish", "Polish", 
+    "Turkish", "Greek", "Hebrew", "Thai", "Vietnamese", "Indonesian", 
+    "Malay", "Filipino", "Urdu", "Bengali", "Tamil", "Telugu", 
+    "Marathi", "Gujarati", "Kannada", "Malayalam", "Punjabi", "Bhojpuri"
+]
+
+# Initialize AI models
+def initialize_ai_models():
+    """Attach the process-wide shared AI clients to this session"""
+    google_api_key = os.getenv("GOOGLE_API_KEY", "")
+    
+    if uses_fake_backend():
+        # Offline stand-in clients (LLM_BACKEND=fake) need no key
+        google_api_key = google_api_key or "offline"
+    elif not google_api_key or google_api_key == "your_google_api_key_here":
+        st.warning("Google API key not configured. AI features will be limited.")
+        return False
+    
+    try:
+        # Clients are shared across sessions by (API key, model name)
+        clients = get_client_pool().get(google_api_key)
+    except Exception as e:
+        st.error(f"Error initializing AI models: {e}")
+        return False
+    
+    st.session_state.ai_clients = clients
+    st.session_state.gemini_model = clients.gemini_model
+    st.session_state.llm = clients.llm
+    st.session_state.ai_models_initialized = True
+    return True
+
+def report_ai_error(e):
+    """Show an AI call error and count it against the shared client's health"""
+    st.error(f"Error: {e}")
+    if "ai_clients" in st.session_state:
+        get_client_pool().report_failure(st.session_state.ai_clients, e)
+
+def report_ai_success(cached=False):
+    """Reset the shared client's failure count after a call that reached the model"""
+    if not cached and "ai_clients" in st.session_state:
+        get_client_pool().report_success(st.session_state.ai_clients)
+
+def streaming_enabled():
+    return st.session_state.get("ai_streaming", True)
+
+def hedging_enabled():
+    return st.session_state.get("ai_hedging", False)
+
+def stream_into(placeholder):
+    """on_text callback that writes the partial response into a placeholder"""
+    return lambda text: placeholder.markdown(text + "▌")
+
+def show_result(placeholder, result):
+    """Write the final response and its timings"""
+    placeholder.markdown(result.text)
+    if result.similarity is not None:
+        st.caption(f"🧭 Served from the semantic cache (similarity {result.similarity:.2f})")
+    elif result.cached:
+        st.caption("⚡ Served from cache")
+    else:
+        st.caption(f"⏱️ First token {result.first_token_latency:.2f}s · Total {result.total_latency:.2f}s")
+
+def render_generation(title, idea):
+    """Render one ideation section, streaming the response as it arrives"""
+    st.markdown(f"### {title}")
+    placeholder = st.empty()
+    result = generate("ideation", st.session_state.ai_clients, ideation_prompt(title, idea),
+                      on_text=stream_into(placeholder), stream=streaming_enabled(), hedge=hedging_enabled(),
+                      similar=(title, idea))
+    show_result(placeholder, result)
+    report_ai_success(result.cached)
+
+def render_ai_ideation():
+    """Render AI Ideation tool"""
+    st.subheader("🚀 Agentic Ideation")
+    st.write("Transform your startup idea into a refined, market-ready concept.")
+    
+    idea = st.text_area("Enter your startup idea:", height=100, 
+                       placeholder="Describe your startup idea here...")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🔍 Refine Idea", use_container_width=True):
+            if idea and initialize_ai_models():
+                with st.spinner("Refining your idea..."):
+                    try:
+                        render_generation("Refined Idea", idea)
+                    except Exception as e:
+                        report_ai_error(e)
+    
+    with col2:
+        if st.button("📊 Market Research", use_container_width=True):
+            if idea and initialize_ai_models():
+                with st.spinner("Analyzing market..."):
+                    try:
+                        render_generation("Market Research", idea)
+                    except Exception as e:
+                        report_ai_error(e)
+    
+    with col3:
+        if st.button("💼 Business Model", use_container_width=True):
+            if idea and initialize_ai_models():
+                with st.spinner("Creating business model..."):
+                    try:
+                        render_generation("Business Model Canvas", idea)
+                    except Exception as e:
+                        report_ai_error(e)
+    
+    # One-click analysis: all three prompts run concurrently
+    if st.button("🧠 Full Analysis", use_container_width=True, type="primary"):
+        if idea and initialize_ai_models():
+            render_full_analysis(idea)
+
+def render_full_analysis(idea):
+    """Run every ideation prompt in parallel and render each section as it finishes"""
+    # Lay out all sections up front so they fill in place as results arrive
+    placeholders = {}
+    for title in IDEATION_PROMPTS:
+        st.markdown(f"### {title}")
+        placeholders[title] = st.empty()
+        placeholders[title].info("⏳ Working...")
+    
+    start = time.perf_counter()
+    from_cache = 0
+    # Worker threads only call the model; all rendering stays on this thread
+    for title, text, cached, error in full_analysis(st.session_state.ai_clients, idea):
+        if error is not None:
+            placeholders[title].error(f"Error: {error}")
+            get_client_pool().report_failure(st.session_state.ai_clients, error)
+            continue
+        report_ai_success(cached)
+        from_cache += int(cached)
+        placeholders[title].markdown(text)
+    
+    st.caption(f"⏱️ Full analysis finished in {time.perf_counter() - start:.2f}s "
+               f"({len(IDEATION_PROMPTS) - from_cache} parallel calls, {from_cache} from cache)")
+
+def render_ai_translator():
+    """Render Language Translator tool"""
+    st.subheader("🌍 Language Translator")
+    st.write("Translate text between multiple languages using AI.")
+    
+    memory_stats = get_translation_memory().stats()
+    skip_stats = get_skip_counter().stats()
+    st.caption(f"📚 Translation memory: {memory_stats['entries']} segments · "
+               f"{memory_stats['saved_calls']} LLM calls saved · "
+               f"⏭️ {skip_stats['skipped']} requests needed no translation")
+    
+    mode = st.radio("Mode:", ["✍️ Text", "📄 Document"], horizontal=True)
+    if mode == "📄 Document":
+        render_document_translation()
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        source_text = st.text_area("Enter text to translate:", height=150,
+                                  placeholder="Type or paste text here...")
+        
+        target_language = st.selectbox(
+            "Select target language:",
+            TRANSLATOR_LANGUAGES
+        )
+        
+        use_near_matches = st.checkbox("Show near matches from translation memory", value=True)
+        
+        if st.button("🔄 Translate", use_container_width=True):
+            if source_text and target_language and initialize_ai_models():
+                if use_near_matches:
+                    near_matches = [match for match in get_translation_memory().similar(source_text, target_language)
+                                    if match[0] < 1.0]
+                    if near_matches:
+                        with st.expander(f"📚 {len(near_matches)} similar segments in translation memory"):
+                            for score, source, translation in near_matches:
+                                st.markdown(f"**{score:.0%} match:** {source}")
+                                st.text(translation)
+                with st.spinner("Translating..."):
+                    try:
+                        # Stream the translation below the button, then move it to the result box
+                        stream_placeholder = st.empty()
+                        result = translate(st.session_state.ai_clients, source_text, target_language,
+                                           on_text=stream_into(stream_placeholder), stream=streaming_enabled(),
+                                           hedge=hedging_enabled())
+                        stream_placeholder.empty()
+                        
+                        st.session_state.translated_text = result.text
+                        report_ai_success(result.cached)
+                        if result.skipped:
+                            st.info(f"⏭️ Returned unchanged, no translation needed: {result.skipped}")
+                        elif result.cached:
+                            # Identical segment translated before: no LLM call needed
+                            st.success("📚 Served from translation memory")
+                        else:
+                            st.success("Translation completed!")
+                            st.caption(f"⏱️ First token {result.first_token_latency:.2f}s · "
+                                       f"Total {result.total_latency:.2f}s")
+                    except Exception as e:
+                        report_ai_error(e)
+    
+    with col2:
+        if 'translated_text' in st.session_state:
+            st.markdown("### Translation Result")
+            st.text_area("Translated text:", value=st.session_state.translated_text, 
+                        height=150, disabled=True)
+            
+            col2_1, col2_2 = st.columns(2)
+            with col2_1:
+                if st.button("📋 Copy", use_container_width=True):
+                    st.write("Translation copied to clipboard!")
+            with col2_2:
+                if st.button("🔊 Play Audio", use_container_width=True):
+                    st.info("Audio playback feature coming soon!")
+
+def render_document_translation():
+    """Translate an uploaded document segment by segment with a bounded worker pool"""
+    uploaded = st.file_uploader("Upload a document:", type=["txt", "csv", "md"])
+    target_language = st.selectbox("Select target language:", TRANSLATOR_LANGUAGES,
+                                   key="document_target_language")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        max_workers = st.slider("Parallel requests", min_value=1, max_value=16,
+                                value=DEFAULT_WORKERS)
+    with col2:
+        requests_per_minute = st.number_input("Requests per minute", min_value=1,
+                                              max_value=1000, value=60)
+    with col3:
+        segment_tokens = st.number_input("Tokens per segment", min_value=100,
+                                         max_value=4000, value=DEFAULT_SEGMENT_TOKENS, step=100)
+    
+    if st.button("🔄 Translate Document", use_container_width=True):
+        if uploaded and initialize_ai_models():
+            translate_segment, memory, passthrough = segment_translator(st.session_state.ai_clients,
+                                                                        target_language)
+            
+            total_lines = max(1, uploaded.getvalue().count(b"\n") + 1)
+            progress = st.progress(0.0)
+            status = st.empty()
+            
+            def on_progress(stats):
+                progress.progress(min(1.0, stats.lines_done / total_lines))
+                status.caption(f"{stats.segments_done} segments · {stats.lines_done}/{total_lines} lines · "
+                               f"{stats.segments_per_second:.2f} segments/s · {stats.retries} retries · "
+                               f"{stats.memory_hits} from translation memory · "
+                               f"{stats.skipped} needed no translation")
+            
+            # Results are written in order to a spooled temp file (on disk past SPOOL_BYTES,
+            # deleted on close); only the finished translation is kept, for the download button
+            suffix = os.path.splitext(uploaded.name)[1]
+            try:
+                with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES, mode="w+", encoding="utf-8") as out_file:
+                    lines = io.TextIOWrapper(uploaded, encoding="utf-8", errors="replace")
+                    stats = translate_document(
+                        lines, translate_segment, out_file,
+                        max_workers=max_workers,
+                        max_tokens=int(segment_tokens),
+                        rate_limiter=TokenBucket(requests_per_minute / 60.0, capacity=max_workers),
+                        on_progress=on_progress,
+                        memory=memory,
+                        passthrough=passthrough
+                    )
+                    out_file.seek(0)
+                    translated = out_file.read().encode("utf-8")
+            except Exception as e:
+                report_ai_error(e)
+                return
+            
+            st.session_state.translated_document = {
+                "data": translated,
+                "file_name": f"{os.path.splitext(uploaded.name)[0]}_{target_language.lower()}{suffix}"
+            }
+            progress.progress(1.0)
+            from_model = stats.segments_done - stats.memory_hits - stats.skipped - stats.failed_segments
+            report_ai_success(cached=not from_model)
+            st.success(f"Translated {stats.segments_done} segments in {stats.elapsed:.1f}s "
+                       f"({stats.segments_per_second:.2f} segments/s, "
+                       f"{stats.memory_hits} from translation memory, "
+                       f"{stats.skipped} needed no translation)")
+            if stats.failed_segments:
+                st.warning(f"{stats.failed_segments} segments failed after retries and were left untranslated")
+    
+    document = st.session_state.get("translated_document")
+    if document:
+        st.download_button("📥 Download translation", data=document["data"], file_name=document["file_name"],
+                           use_container_width=True)
+
+def render_ai_shell():
+    """Render AI Shell Assistant tool"""
+    st.subheader("💻 AI Shell Assistant")
+    st.write("Execute shell commands using natural language.")
+    
+    query = st.text_area("Describe what you want to do:", height=100,
+                        placeholder="e.g., Check IP configuration, List running processes, etc.")
+    
+    if st.button("🚀 Execute", use_container_width=True):
+        if query and initialize_ai_models():
+            with st.spinner("Processing your request..."):
+                try:
+                    # Built once per client and reused across requests and sessions
+                    agent = get_shell_agent(st.session_state.llm)
+                    start = time.perf_counter()
+                    response, commands, cached = agent.run(query)
+                    report_ai_success(cached)
+                    if cached:
+                        record_cache_hit("shell_agent")
+                    else:
+                        get_metrics().record("shell_agent", latency=time.perf_counter() - start)
+                    st.markdown("### Command Output")
+                    st.code(response, language="bash")
+                    if commands:
+                        with st.expander(f"Commands run ({len(commands)})"):
+                            for command, read_only in commands:
+                                st.code(f"{'📖' if read_only else '✏️'} {command}", language="bash")
+                    agent_stats = agent.stats()
+                    st.caption(
+                        f"{'⚡ Answered from the read-only result cache · ' if cached else ''}"
+                        f"Shell: {agent_stats['shell']} · commands run: {agent_stats['commands_run']} · "
+                        f"cached command hits: {agent_stats['command_cache_hits']} · "
+                        f"cached answers: {agent_stats['answer_cache_hits']}"
+                    )
+                except Exception as e:
+                    report_ai_error(e)
+
+def render_ai_symptom():
+    """Render Symptom Checker tool"""
+    st.subheader("🩺 AI Symptom Checker")
+    st.write("Get AI-powered health guidance (with medical disclaimers).")
+    
+    # Disclaimer
+    st.warning("⚠️ **Disclaimer:** This is an AI assistant and not a medical professional. This is not a substitute for professional medical advice. Please consult a doctor for an accurate diagnosis.")
+    
+    # Initialize chat
+    if "symptom_chat_history" not in st.session_state:
+        st.session_state.symptom_chat_history = []
+    
+    if st.session_state.symptom_chat_history and st.button("🧹 New conversation"):
+        st.session_state.symptom_chat_history = []
+        st.session_state.symptom_context = {"summary": "", "folded": 0}
+    
+    # Display chat history
+    for message in st.session_state.symptom_chat_history:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+    
+    # User input
+    if prompt := st.chat_input("Describe your symptoms..."):
+        if not initialize_ai_models():
+            st.error("Please configure API key in sidebar")
+            return
+        
+        # Add user message
+        st.session_state.symptom_chat_history.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        
+        # Get AI response
+        with st.chat_message("assistant"):
+            with st.spinner("Analyzing symptoms..."):
+                try:
+                    context = st.session_state.setdefault("symptom_context", {"summary": "", "folded": 0})
+                    placeholder = st.empty()
+                    result, context_tokens = symptom_reply(
+                        st.session_state.ai_clients, st.session_state.symptom_chat_history[:-1], context, prompt,
+                        on_text=stream_into(placeholder), stream=streaming_enabled(), hedge=hedging_enabled()
+                    )
+                    show_result(placeholder, result)
+                    report_ai_success(result.cached)
+                    st.session_state.symptom_chat_history.append({"role": "assistant", "content": result.text})
+                    st.caption(f"🧠 Context ≈ {context_tokens} tokens · "
+                               f"{context['folded']} earlier messages summarized")
+                except Exception as e:
+                    report_ai_error(e)
+
+def render_ai_page():
+    """Render the main AI Tools page"""
+    st.markdown('<div class="main-header"><h1>🤖 AI Toolkit</h1><p>Advanced AI-powered tools for ideation, translation, shell assistance, and health guidance</p></div>', unsafe_allow_html=True)
+    
+    # Sub-navigation
+    ai_tool = st.selectbox(
+        "Choose an AI tool:",
+        ["Agentic Ideation", "Language Translator", "AI Shell Tool", "Symptom Checker"]
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        st.toggle("⚡ Stream responses", value=True, key="ai_streaming",
+                  help="Show responses token by token as they arrive")
+    with col2:
+        st.toggle("🛡️ Hedge slow requests", value=os.getenv("LLM_HEDGING", "").lower() in ("1", "true", "yes"),
+                  key="ai_hedging",
+                  help="Send a duplicate request when the first token is slower than usual; uses extra quota")
+    
+    if ai_tool == "Agentic Ideation":
+        render_ai_ideation()
+    elif ai_tool == "Language Translator":
+        render_ai_translator()
+    elif ai_tool == "AI Shell Tool":
+        render_ai_shell()
+    elif ai_tool == "Symptom Checker":
+        render_ai_symptom()
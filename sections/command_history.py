@@ -0,0 +1,83 @@
+"""
+Command Log section: latency histograms, slowest and recent commands per host.
+
+Everything shown here comes from the persistent command log (command_log.py):
+histograms and summaries from its hourly rollup, command lists from indexed
+lookups, so the page stays fast as the log grows.
+"""
+import time
+import streamlit as st
+import pandas as pd
+from command_log import get_command_log, bucket_label
+
+STATUS_ICONS = {"ok": "✅", "error": "❌", "timeout": "⏰", "cancelled": "⏹️"}
+WINDOWS = {"Last hour": 3600, "Last 24 hours": 86400, "Last 7 days": 7 * 86400, "All time": None}
+
+def _frame(rows):
+    """Display frame of command log rows"""
+    frame = pd.DataFrame(rows, columns=["ts", "host", "source", "command", "status", "exit_code",
+                                        "duration", "output_bytes"])
+    frame["ts"] = pd.to_datetime(frame["ts"], unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+    frame["status"] = frame["status"].map(lambda status: f"{STATUS_ICONS.get(status, '⚠️')} {status}")
+    frame["duration"] = frame["duration"].round(3)
+    return frame.rename(columns={"ts": "Time", "host": "Host", "source": "Source", "command": "Command",
+                                 "status": "Status", "exit_code": "Exit code", "duration": "Duration (s)",
+                                 "output_bytes": "Output (bytes)"})
+
+def render_recent_commands(host, limit=5):
+    """The latest commands run on host, newest first"""
+    rows = get_command_log().recent(host, limit)
+    if not rows:
+        st.caption("No commands run yet")
+    for i, row in enumerate(rows):
+        st.text(f"{i+1}. {STATUS_ICONS.get(row['status'], '⚠️')} {row['command']} ({row['duration']:.2f}s)")
+
+def render_command_history_page():
+    """Render the Command Log page"""
+    st.markdown('<div class="main-header"><h1>📜 Command Log</h1><p>Every Docker, SSH and shell command run from the dashboard, with latency statistics per host</p></div>', unsafe_allow_html=True)
+
+    log = get_command_log()
+    col1, col2 = st.columns(2)
+    with col1:
+        window = st.selectbox("Time window:", list(WINDOWS), index=1)
+    with col2:
+        host = st.selectbox("Host:", ["All hosts"] + log.hosts())
+    since = time.time() - WINDOWS[window] if WINDOWS[window] else 0.0
+    host = None if host == "All hosts" else host
+
+    summary = [row for row in log.host_summary(since) if host is None or row["host"] == host]
+    commands = sum(row["commands"] for row in summary)
+    errors = sum(row["errors"] for row in summary)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Commands", f"{commands:,}")
+    col2.metric("Errors", f"{errors:,}", f"{errors / commands:.1%}" if commands else None, delta_color="inverse")
+    col3.metric("Hosts", len(summary))
+    if not commands:
+        st.info("📭 No commands logged in this window yet")
+        return
+
+    st.subheader("⏱️ Latency Histogram")
+    histogram = log.histogram(host, since)
+    st.bar_chart(pd.DataFrame({"Commands": list(histogram.values())},
+                              index=[bucket_label(bucket) for bucket in histogram]))
+    st.caption("Buckets double in width; hour granularity for the time window")
+
+    st.subheader("🖥️ Hosts")
+    st.dataframe(pd.DataFrame(summary).rename(columns={
+        "host": "Host", "commands": "Commands", "errors": "Errors", "mean_s": "Mean (s)",
+        "p50_s": "p50 ≤ (s)", "p95_s": "p95 ≤ (s)",
+    }), hide_index=True, use_container_width=True)
+
+    st.subheader("🐢 Slowest Commands")
+    limit = st.slider("Commands per host", min_value=1, max_value=50, value=5)
+    hosts = [host] if host else [row["host"] for row in summary]
+    slowest = [row for name in hosts for row in log.slowest(name, since, limit)]
+    st.dataframe(_frame(slowest), hide_index=True, use_container_width=True)
+
+    st.subheader("🕒 Recent Commands")
+    st.dataframe(_frame(log.recent(host, 50)), hide_index=True, use_container_width=True)
+
+    stats = log.stats()
+    if stats["error"]:
+        st.warning(f"⚠️ Command log write failed, {stats['pending']:,} entries queued: {stats['error']}")
+    st.caption(f"{stats['rows']:,} commands logged in {stats['path']} · kept {stats['retention_days']:g} days")
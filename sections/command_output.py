@@ -0,0 +1,50 @@
+"""
+Live output panel for streaming commands, shared by the Docker and Linux pages.
+
+A CommandStream is kept in session state while it runs. The panel is a
+fragment that re-renders itself twice a second, so new lines appear and the
+Cancel button works without re-running the whole page script.
+"""
+import streamlit as st
+
+STATUS_ICONS = {"running": "⏳", "succeeded": "✅", "cancelled": "⏹️", "timed out": "⏰"}
+
+def start_command_stream(key, stream):
+    """Start stream under key, cancelling a command still running there"""
+    previous = st.session_state.get(key)
+    if previous is not None and previous.running:
+        previous.cancel()
+    st.session_state[key] = stream.start()
+
+def show_command_stream(stream):
+    icon = STATUS_ICONS.get(stream.status, "❌")
+    dropped = f" ({stream.dropped_lines} older lines not shown)" if stream.dropped_lines else ""
+    st.caption(f"{icon} `{stream.label}` · {stream.status} · {stream.elapsed:.1f}s · "
+               f"{stream.total_lines} lines{dropped}")
+    st.code(stream.text() or "(waiting for output...)", language="bash")
+
+@st.fragment(run_every=0.5)
+def live_command_stream(key):
+    stream = st.session_state.get(key)
+    if stream is None:
+        return
+    if not stream.running:
+        # Re-run the page once so the finished output is drawn without polling
+        st.rerun()
+    show_command_stream(stream)
+    if st.button("⏹️ Cancel", key=f"{key}_cancel", use_container_width=True):
+        stream.cancel()
+        st.rerun()
+
+def render_command_stream(key):
+    """Show the command stored under key: live while running, static when done"""
+    stream = st.session_state.get(key)
+    if stream is None:
+        return
+    if stream.running:
+        live_command_stream(key)
+        return
+    show_command_stream(stream)
+    if st.button("🧹 Clear output", key=f"{key}_clear", use_container_width=True):
+        del st.session_state[key]
+        st.rerun()
@@ -0,0 +1,137 @@
+"""
+Diagnostics section: LLM call metrics, shared client pool and cache state.
+"""
+import streamlit as st
+import pandas as pd
+from llm_metrics import get_metrics, QUANTILES
+from llm_clients import get_client_pool
+from response_cache import get_response_cache
+from llm_gateway import get_llm_gateway
+from llm_hedging import get_hedge_stats, HEDGE_PERCENTILE
+from ssh_pool import get_ssh_pool
+from docker_engine import engine_stats
+from docker_inventory import inventory_stats
+from container_stats import monitor_stats
+
+def render_llm_metrics():
+    """Render per-tool latency percentiles and counters"""
+    st.subheader("🤖 LLM Calls")
+    rows = get_metrics().summary()
+    if not rows:
+        st.info("No AI Toolkit calls recorded yet in this server process.")
+        return
+    
+    df = pd.DataFrame(rows).set_index("tool")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Calls", int(df["calls"].sum()))
+    col2.metric("Errors", int(df["errors"].sum()))
+    col3.metric("Cache hits", int(df["cache_hits"].sum()))
+    col4.metric("Tokens (in / out)", f"{int(df['input_tokens'].sum())} / {int(df['output_tokens'].sum())}")
+    
+    labels = [f"p{int(q * 100)}" for q in QUANTILES]
+    st.write("**Latency (s)**")
+    st.dataframe(df[[f"latency_{label}" for label in labels]].rename(columns=lambda c: c.split("_")[1]).round(3),
+                 use_container_width=True)
+    st.write("**Time to first token (s)**")
+    st.dataframe(df[[f"ttft_{label}" for label in labels]].rename(columns=lambda c: c.split("_")[1]).round(3),
+                 use_container_width=True)
+    st.write("**Counters**")
+    st.dataframe(df[["calls", "errors", "cache_hits", "input_tokens", "output_tokens"]],
+                 use_container_width=True)
+    st.caption("Token counts are estimated at about four characters per token. "
+               "Percentiles cover the most recent calls per tool and exclude cache hits and errors.")
+
+def render_hedge_stats():
+    """Render how often hedged requests fired and won"""
+    st.subheader("🛡️ Hedged Requests")
+    rows = get_hedge_stats().summary()
+    if not rows:
+        st.caption("No hedged calls yet. Enable \"Hedge slow requests\" on the AI Toolkit page.")
+        return
+    df = pd.DataFrame(rows).set_index("tool")
+    df["fire_rate"] = (df["fire_rate"] * 100).round(1)
+    df["win_rate"] = (df["win_rate"] * 100).round(1)
+    st.dataframe(df.rename(columns={"fire_rate": "fired %", "win_rate": "hedge won %"}),
+                 use_container_width=True)
+    st.caption(f"A hedge fires when the first token is slower than the tool's recent "
+               f"p{int(HEDGE_PERCENTILE * 100)}; each fired hedge is one extra upstream request. "
+               f"Skipped hedges were blocked by the rate limiter.")
+
+def render_ssh_pool():
+    """Pooled SSH master connections used by the Docker and Linux pages"""
+    st.subheader("🔐 SSH Connections")
+    pool_stats = get_ssh_pool().stats()
+    if not pool_stats["multiplexing"]:
+        st.caption("Connection multiplexing is off: every command opens its own SSH connection")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Open connections", f"{pool_stats['open_connections']} / {pool_stats['max_hosts']}")
+    col2.metric("Commands", pool_stats["commands"])
+    col3.metric("Reused connection", pool_stats["reused"])
+    if pool_stats["hosts"]:
+        st.dataframe(pd.DataFrame(pool_stats["hosts"]), hide_index=True, use_container_width=True)
+    engines = engine_stats()
+    if engines:
+        st.caption("Docker Engine API clients (requests share kept-alive connections)")
+        st.dataframe(pd.DataFrame(engines), hide_index=True, use_container_width=True)
+    inventories = inventory_stats()
+    if inventories:
+        st.caption("Cached container inventories")
+        st.dataframe(pd.DataFrame(inventories), hide_index=True, use_container_width=True)
+    monitors = monitor_stats()
+    if monitors:
+        st.caption("Container resource monitors (ring buffers of fixed size)")
+        st.dataframe(pd.DataFrame(monitors), hide_index=True, use_container_width=True)
+    if st.button("🔌 Close SSH connections", use_container_width=True):
+        get_ssh_pool().close()
+        st.rerun()
+
+def render_prometheus_export():
+    """Render the Prometheus text exposition with a download button"""
+    st.subheader("📤 Prometheus Export")
+    text = get_metrics().prometheus_text()
+    st.download_button("📥 Download metrics", data=text, file_name="llm_metrics.prom",
+                       mime="text/plain", use_container_width=True)
+    with st.expander("Show exposition text"):
+        st.code(text, language="text")
+
+def render_diagnostics_page():
+    """Render the Diagnostics page"""
+    st.markdown('<div class="main-header"><h1>📊 Diagnostics</h1><p>Latency, token usage, errors and cache hits for the AI Toolkit</p></div>', unsafe_allow_html=True)
+    
+    render_llm_metrics()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("🔌 Shared Clients")
+        pool_stats = get_client_pool().stats()
+        st.metric("Live clients", f"{pool_stats['live_clients']} / {pool_stats['max_clients']}")
+        st.caption(f"Created: {pool_stats['created']} · Evicted: {pool_stats['evicted']}")
+    with col2:
+        st.subheader("🗄️ Response Cache")
+        cache_stats = get_response_cache().stats()
+        st.metric("Hit rate", f"{cache_stats['hit_rate']:.0%}")
+        st.caption(f"Memory hits: {cache_stats['memory_hits']} · Disk hits: {cache_stats['disk_hits']} · "
+                   f"Misses: {cache_stats['misses']}")
+    
+    st.subheader("🚦 Rate Limiter")
+    gateway_stats = get_llm_gateway().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Concurrency limit", gateway_stats["concurrency_limit"])
+    col2.metric("In flight", gateway_stats["in_flight"])
+    col3.metric("Coalesced calls", gateway_stats["coalesced"])
+    col4.metric("Throttled (429)", gateway_stats["throttled"])
+    st.caption(f"Upstream calls: {gateway_stats['upstream_calls']} · "
+               f"Limit decreases: {gateway_stats['limit_decreases']} · "
+               f"Average queue wait: {gateway_stats['average_queue_wait']:.3f}s")
+    
+    render_hedge_stats()
+    
+    render_ssh_pool()
+    
+    render_prometheus_export()
+    
+    if st.button("🧹 Reset metrics", use_container_width=True):
+        get_metrics().reset()
+        get_hedge_stats().reset()
+        st.rerun()
@@ -0,0 +1,610 @@
+"""
+Docker Manager section: local, SSH-based and fleet-wide container management.
+"""
+import streamlit as st
+import pandas as pd
+import functools
+import subprocess
+import shlex
+import time
+from command_stream import CommandStream
+from sections.command_output import start_command_stream, render_command_stream
+from sections.command_history import render_recent_commands
+from ssh_pool import get_ssh_pool
+from command_log import log_command
+from docker_engine import get_engine, DockerEngineError
+from docker_inventory import get_docker_inventory, cli_runner, filter_frame
+from container_stats import get_stats_monitor, STATS_COMMAND
+from launch_plan import parse_plan, PlanRun, EngineLauncher, CliLauncher, LaunchPlanError, EXAMPLE_PLAN, \
+    DEFAULT_PLAN_PARALLELISM
+from docker_batch import select_containers, run_batch, ACTIONS, DEFAULT_BATCH_PARALLELISM, DEFAULT_BATCH_TIMEOUT
+from fleet import Host, get_inventory, run_on_hosts, DEFAULT_PARALLELISM, DEFAULT_HOST_TIMEOUT
+
+REMOTE_MODE = "🔗 Remote (SSH)"
+LOCAL_MODE = "🖥️ Local"
+FLEET_MODE = "🌐 Fleet (inventory)"
+ENGINE_BACKEND = "⚙️ Engine API"
+CLI_BACKEND = "⌨️ Docker CLI"
+CLI_CHECK_TTL = 300
+# Chart label -> (stored metric, multiplier to the unit in the label)
+METRIC_CHARTS = {
+    "CPU %": ("cpu_percent", 1),
+    "Memory (MB)": ("memory_bytes", 1e-6),
+    "Net in (KB/s)": ("net_rx", 1e-3),
+    "Net out (KB/s)": ("net_tx", 1e-3),
+    "Disk write (KB/s)": ("block_write", 1e-3),
+}
+
+_cli_check = {"available": None, "checked_at": 0.0}
+
+def execute_remote(username, ip, command):
+    """
+    Executes a command on a remote machine via SSH.
+    """
+    try:
+        # Runs over the pooled connection to this host; only the first command pays the handshake
+        result = get_ssh_pool().run(username, ip, command, timeout=30)
+        
+        if result.returncode == 0:
+            return f"✅ SSH Success:\n{result.stdout}"
+        else:
+            return f"❌ SSH Error:\n{result.stderr}"
+    except subprocess.TimeoutExpired:
+        return "⏰ SSH command timed out"
+    except Exception as e:
+        return f"⚠️ SSH Exception: {str(e)}"
+
+def stream_remote(username, ip, command):
+    """Run a command on a remote machine, streaming its output as it arrives"""
+    return get_ssh_pool().open_stream(username, ip, command)
+
+def stream_docker_command(command):
+    """Run a Docker command locally, streaming its output as it arrives"""
+    return CommandStream(shlex.split(command), label=command)
+
+def execute_docker_command(command):
+    """Execute Docker command locally and return output"""
+    try:
+        # Check if Docker is available; the answer is reused for CLI_CHECK_TTL seconds
+        if _cli_check["available"] is None or time.monotonic() - _cli_check["checked_at"] > CLI_CHECK_TTL:
+            docker_check = subprocess.run(["docker", "--version"], capture_output=True, text=True)
+            _cli_check.update(available=docker_check.returncode == 0, checked_at=time.monotonic())
+        if not _cli_check["available"]:
+            return "❌ Docker is not installed or not available in PATH"
+        
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=30)
+        except subprocess.TimeoutExpired:
+            log_command("local", "shell", command, None, time.perf_counter() - start, status="timeout")
+            raise
+        log_command("local", "shell", command, result.returncode, time.perf_counter() - start,
+                    len(result.stdout) + len(result.stderr))
+        if result.returncode == 0:
+            return f"✅ Success:\n{result.stdout}"
+        else:
+            return f"❌ Error:\n{result.stderr}"
+    except subprocess.TimeoutExpired:
+        return "⏰ Command timed out"
+    except FileNotFoundError:
+        _cli_check.update(available=False, checked_at=time.monotonic())
+        return "❌ Docker command not found. Please ensure Docker is installed and in PATH"
+    except Exception as e:
+        return f"⚠️ Exception: {str(e)}"
+
+def target_engine(target):
+    """The Engine API client for the target, or None to fall back to the CLI"""
+    if target["backend"] != ENGINE_BACKEND or target["mode"] == FLEET_MODE:
+        return None
+    try:
+        engine = get_engine(target["user"], target["ip"]) if target["mode"] == REMOTE_MODE else get_engine()
+    except DockerEngineError as e:
+        st.caption(f"⌨️ Using the Docker CLI: {e}")
+        return None
+    if not engine.is_available():
+        st.caption(f"⌨️ Using the Docker CLI: no Docker daemon answers at {engine.socket_path}")
+        return None
+    return engine
+
+def show_engine_result(result):
+    """Render an Engine API result: a table for listings, a message otherwise"""
+    if isinstance(result, list):
+        st.dataframe(pd.DataFrame([item.row() for item in result]), hide_index=True, use_container_width=True)
+        st.caption(f"{len(result)} rows")
+    else:
+        st.success(result)
+
+def target_inventory(target):
+    """The cached container/image inventory of a local or remote target"""
+    if target["mode"] == REMOTE_MODE:
+        if not (target["user"] and target["ip"]):
+            st.error("Please provide remote username and IP address")
+            return None
+        name = f"{target['user']}@{target['ip']}"
+        cli = cli_runner(target["user"], target["ip"])
+    else:
+        name, cli = "local", cli_runner()
+    engine = target_engine(target)
+    return get_docker_inventory(name, engine=engine, cli=None if engine else cli)
+
+def render_inventory(kind, target):
+    """Searchable, sortable table of containers or images, served from the host's cache"""
+    inventory = target_inventory(target)
+    if inventory is None:
+        return
+    refresh = st.button("🔄 Refresh", use_container_width=True, key=f"refresh_{kind}")
+    try:
+        frame = inventory.containers(refresh) if kind == "containers" else inventory.images(refresh)
+    except (DockerEngineError, OSError, subprocess.SubprocessError, ValueError) as e:
+        st.error(f"❌ Could not list {kind}: {e}")
+        return
+    
+    search = st.text_input("🔍 Search:", key=f"search_{kind}", placeholder="Name, image, ID, label...")
+    states = images = ()
+    if kind == "containers":
+        col1, col2 = st.columns(2)
+        with col1:
+            states = st.multiselect("State:", sorted(frame["State"].dropna().unique()))
+        with col2:
+            images = st.multiselect("Image:", sorted(frame["Image"].dropna().unique()))
+    shown = filter_frame(frame, search, states, images)
+    st.dataframe(shown, hide_index=True, use_container_width=True)
+    
+    stats = inventory.stats()
+    freshness = "kept current by docker events" if stats["live_events"] else f"cached up to {inventory.ttl:.0f}s"
+    st.caption(f"{len(shown)} of {len(frame)} {kind} · {inventory.name} via {stats['source']} · {freshness}")
+
+def target_monitor(target):
+    """The shared resource monitor of a local or remote target"""
+    if target["mode"] == REMOTE_MODE:
+        if not (target["user"] and target["ip"]):
+            st.error("Please provide remote username and IP address")
+            return None
+        name = f"{target['user']}@{target['ip']}"
+        # Opened by the monitor whenever it (re)starts, so the master stays open while it streams
+        open_stream = functools.partial(get_ssh_pool().open_stream, target["user"], target["ip"], STATS_COMMAND)
+        return get_stats_monitor(name, open_stream=open_stream, engine=target_engine(target))
+    return get_stats_monitor("local", cli_args=shlex.split(STATS_COMMAND), engine=target_engine(target))
+
+@st.fragment(run_every=1)
+def live_resource_monitor(monitor, metric, selected, top):
+    """Latest usage per container and rolling charts, redrawn every second on their own"""
+    monitor.touch()
+    latest = monitor.store.latest()
+    stats = monitor.stats()
+    st.caption(f"{stats['containers']} containers · {monitor.name} via {stats['source']} · "
+               f"{stats['samples']} samples · {stats['buffer_mb']} MB of buffers")
+    if monitor.error:
+        st.warning(f"⚠️ {monitor.error}")
+    if latest.empty:
+        st.info("⏳ Waiting for the first samples...")
+        return
+    latest = latest.sort_values("CPU %", ascending=False)
+    st.dataframe(latest.head(top), hide_index=True, use_container_width=True)
+    names = selected or latest["Container"].head(5).tolist()
+    column, scale = METRIC_CHARTS[metric]
+    history = monitor.store.history(names, column)
+    if not history.empty:
+        st.line_chart(history * scale, height=250)
+
+def render_resource_monitor(target):
+    monitor = target_monitor(target)
+    if monitor is None:
+        return
+    monitor.touch()
+    metric = st.radio("Chart:", list(METRIC_CHARTS), horizontal=True)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.multiselect("Containers to chart (default: top 5 by CPU):", monitor.store.names())
+    with col2:
+        top = st.number_input("Table rows:", min_value=5, max_value=500, value=20, step=5)
+    live_resource_monitor(monitor, metric, selected, int(top))
+
+def render_batch_actions(target):
+    """Pick containers by name, pattern, label or state and act on all of them concurrently"""
+    inventory = target_inventory(target)
+    if inventory is None:
+        return
+    try:
+        frame = inventory.containers()
+    except (DockerEngineError, OSError, subprocess.SubprocessError, ValueError) as e:
+        st.error(f"❌ Could not list containers: {e}")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        pattern = st.text_input("Name pattern:", placeholder="test-*")
+    with col2:
+        label = st.text_input("Label:", placeholder="env=test")
+    with col3:
+        states = st.multiselect("State:", sorted(frame["State"].dropna().unique()), key="batch_states")
+    picked = st.multiselect("Or pick containers:", sorted(frame["Name"].dropna().unique()))
+    
+    matched = select_containers(frame, pattern, label, states) if pattern or label or states else frame.iloc[0:0]
+    names = list(dict.fromkeys(matched["Name"].tolist() + picked))
+    st.caption(f"{len(names)} of {len(frame)} containers selected")
+    if names:
+        with st.expander(f"📋 Selected containers ({len(names)})"):
+            st.dataframe(frame[frame["Name"].isin(names)], hide_index=True, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        action = st.radio("Action:", list(ACTIONS), horizontal=True, key="batch_action")
+    with col2:
+        parallelism = st.slider("Parallel actions", min_value=1, max_value=64, value=DEFAULT_BATCH_PARALLELISM)
+    if not st.button(f"⚡ {action.capitalize()} {len(names)} containers", use_container_width=True,
+                     disabled=not names):
+        return
+    
+    engine = target_engine(target)
+    cli = None
+    if engine is None:
+        cli = (cli_runner(target["user"], target["ip"], timeout=DEFAULT_BATCH_TIMEOUT) if target["mode"] == REMOTE_MODE
+               else cli_runner(timeout=DEFAULT_BATCH_TIMEOUT))
+    progress = st.progress(0.0)
+    status = st.empty()
+    finished = []
+    
+    def on_result(result):
+        finished.append(result)
+        progress.progress(len(finished) / len(names))
+        status.caption(f"{len(finished)}/{len(names)} containers · last: {result.container} ({result.duration:.2f}s)")
+    
+    start = time.perf_counter()
+    results = run_batch(names, action, engine=engine, cli=cli, max_workers=parallelism, on_result=on_result)
+    elapsed = time.perf_counter() - start
+    # Without the event stream the cached listing does not see these changes
+    inventory.invalidate()
+    succeeded = sum(1 for result in results if result.ok)
+    slowest = max(result.duration for result in results)
+    (st.success if succeeded == len(results) else st.warning)(
+        f"{succeeded}/{len(results)} containers {action} succeeded in {elapsed:.2f}s · "
+        f"slowest {slowest:.2f}s · total work {sum(result.duration for result in results):.2f}s"
+    )
+    st.dataframe(pd.DataFrame([result.row() for result in results]), hide_index=True, use_container_width=True)
+
+def render_launch_plan(target):
+    """Launch a multi-container stack from a YAML/JSON plan as a dependency graph"""
+    uploaded = st.file_uploader("Plan file (YAML or JSON):", type=["yaml", "yml", "json"])
+    text = st.text_area("Launch plan:", value=uploaded.getvalue().decode("utf-8") if uploaded else EXAMPLE_PLAN,
+                        height=300)
+    try:
+        plan = parse_plan(text)
+    except LaunchPlanError as e:
+        st.error(f"❌ Invalid plan: {e}")
+        return
+    st.caption(f"📋 {plan.name}: {len(plan.containers)} containers, {len(plan.images)} images · "
+               f"start order {' → '.join(plan.order)}")
+    col1, col2 = st.columns(2)
+    with col1:
+        parallelism = st.slider("Parallel steps", min_value=1, max_value=32, value=DEFAULT_PLAN_PARALLELISM)
+    with col2:
+        replace = st.checkbox("Replace existing containers", help="Remove containers with the same names first")
+    if not st.button("🚀 Launch Stack", use_container_width=True):
+        return
+    if target["mode"] == REMOTE_MODE and not (target["user"] and target["ip"]):
+        st.error("Please provide remote username and IP address")
+        return
+    
+    engine = target_engine(target)
+    if engine is not None:
+        launcher = EngineLauncher(engine)
+    else:
+        launcher = CliLauncher(cli_runner(target["user"], target["ip"], timeout=600) if target["mode"] == REMOTE_MODE
+                               else cli_runner(timeout=600))
+    progress = st.progress(0.0)
+    status = st.empty()
+    finished = []
+    
+    def on_step(result):
+        finished.append(result)
+        progress.progress(len(finished) / len(run.steps))
+        status.caption(f"{len(finished)}/{len(run.steps)} steps · last: {result.kind} {result.name} ({result.status})")
+    
+    run = PlanRun(plan, launcher, max_workers=parallelism, replace=replace, on_step=on_step)
+    results = run.run()
+    summary = run.summary()
+    (st.success if summary["healthy"] == summary["containers"] else st.error)(
+        f"{summary['healthy']}/{summary['containers']} containers healthy in {summary['elapsed']:.2f}s "
+        f"(the same steps one after another: {summary['sequential']:.2f}s)"
+    )
+    st.dataframe(pd.DataFrame([result.row() for result in results]), hide_index=True, use_container_width=True)
+    # Where startup time went, per container
+    phases = pd.DataFrame({result.name: result.phases for result in results if result.kind == "container"}).T
+    if not phases.empty:
+        st.bar_chart(phases.fillna(0.0), horizontal=True)
+
+def run_docker_action(command, target, engine_call=None):
+    """
+    Run a Docker action on the selected target and show the result.
+
+    engine_call(engine) performs the action through the Engine API when a
+    daemon socket is reachable; otherwise the CLI command is run.
+    """
+    if target["mode"] == FLEET_MODE:
+        run_fleet_action(command, target)
+        return
+    if target["mode"] == REMOTE_MODE and not (target["user"] and target["ip"]):
+        st.error("Please provide remote username and IP address")
+        return
+    engine = target_engine(target) if engine_call is not None else None
+    if engine is not None:
+        start = time.perf_counter()
+        try:
+            show_engine_result(engine_call(engine))
+            log_command(engine.name, "engine", command, 0, time.perf_counter() - start)
+        except DockerEngineError as e:
+            log_command(engine.name, "engine", command, None, time.perf_counter() - start, status="error")
+            st.error(f"❌ Docker Engine error: {e}")
+        return
+    if target["stream"]:
+        try:
+            stream = (stream_remote(target["user"], target["ip"], command) if target["mode"] == REMOTE_MODE
+                      else stream_docker_command(command))
+        except subprocess.TimeoutExpired:
+            st.error("⏰ Timed out connecting over SSH")
+            return
+        except FileNotFoundError:
+            st.error("❌ SSH command not found. Please ensure SSH is available")
+            return
+        start_command_stream("docker_stream", stream)
+        return
+    if target["mode"] == REMOTE_MODE:
+        result = execute_remote(target["user"], target["ip"], command)
+    else:
+        result = execute_docker_command(command)
+    st.code(result, language="bash")
+
+def run_fleet_action(command, target):
+    """Fan a Docker command out across the selected inventory hosts"""
+    hosts = target["hosts"]
+    if not hosts:
+        st.error("Please select at least one host from the inventory")
+        return
+    progress = st.progress(0.0)
+    status = st.empty()
+    finished = []
+    
+    def on_result(result):
+        finished.append(result)
+        progress.progress(len(finished) / len(hosts))
+        status.caption(f"{len(finished)}/{len(hosts)} hosts · last: {result.host.name} ({result.latency:.2f}s)")
+    
+    results = run_on_hosts(hosts, command, max_workers=target["parallelism"],
+                           timeout=target["timeout"], on_result=on_result)
+    succeeded = sum(1 for result in results if result.ok)
+    slowest = max(result.latency for result in results)
+    (st.success if succeeded == len(results) else st.warning)(
+        f"{succeeded}/{len(results)} hosts succeeded · slowest host {slowest:.2f}s"
+    )
+    st.dataframe(pd.DataFrame([result.row() for result in results]), hide_index=True,
+                 use_container_width=True)
+    for result in results:
+        with st.expander(f"{result.host.name} ({result.host.target})"):
+            st.code(result.output or "(no output)", language="bash")
+
+def render_host_inventory():
+    """Edit the file-backed host inventory and pick the hosts to target"""
+    inventory = get_inventory()
+    with st.expander(f"🗂️ Host Inventory ({len(inventory.hosts)} hosts)"):
+        st.caption(f"Saved to {inventory.path}. Use address `local` with no user for this machine; "
+                   "tags are comma-separated.")
+        edited = st.data_editor(
+            pd.DataFrame([{**host.to_dict(), "tags": ", ".join(host.tags)} for host in inventory.hosts],
+                         columns=["name", "user", "address", "tags"]),
+            num_rows="dynamic", hide_index=True, use_container_width=True, key="host_inventory_editor"
+        )
+        if st.button("💾 Save inventory", use_container_width=True):
+            rows = edited.fillna("").to_dict("records")
+            try:
+                inventory.save([Host.from_dict(row) for row in rows if row["name"] and row["address"]])
+                st.success("Inventory saved")
+            except (OSError, ValueError) as e:
+                st.error(f"Could not save inventory: {e}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        names = st.multiselect("Hosts:", [host.name for host in inventory.hosts])
+    with col2:
+        tags = st.multiselect("Or every host tagged:", inventory.tags())
+    col1, col2 = st.columns(2)
+    with col1:
+        parallelism = st.slider("Parallel hosts", min_value=1, max_value=64, value=DEFAULT_PARALLELISM)
+    with col2:
+        timeout = st.number_input("Per-host timeout (s)", min_value=1, max_value=600, value=DEFAULT_HOST_TIMEOUT)
+    return {"hosts": inventory.select(names, tags), "parallelism": parallelism, "timeout": int(timeout)}
+
+def render_docker_page():
+    """Render the Docker Manager page with SSH support"""
+    st.markdown('<div class="main-header"><h1>🐳 Docker Remote Management (via SSH)</h1><p>Manage Docker containers, images, and operations on remote servers through SSH</p></div>', unsafe_allow_html=True)
+    
+    # SSH Connection Configuration
+    st.subheader("🔗 SSH Connection Configuration")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        remote_user = st.text_input("Remote Username:", placeholder="Enter username")
+    with col2:
+        remote_ip = st.text_input("Remote IP Address:", placeholder="Enter IP address")
+    
+    # Connection mode selection
+    connection_mode = st.radio(
+        "Select connection mode:",
+        [REMOTE_MODE, LOCAL_MODE, FLEET_MODE],
+        horizontal=True
+    )
+    
+    backend = st.radio("Backend:", [ENGINE_BACKEND, CLI_BACKEND], horizontal=True,
+                       help="The Engine API talks to the Docker socket directly (forwarded over SSH "
+                            "for remote hosts); the CLI runs docker commands")
+    
+    stream_output = st.checkbox("📡 Stream CLI output live", value=True,
+                                help="Show output line by line as it arrives, with a Cancel button")
+    
+    target = {"mode": connection_mode, "user": remote_user, "ip": remote_ip, "backend": backend,
+              "stream": stream_output}
+    if connection_mode == FLEET_MODE:
+        target.update(render_host_inventory())
+    
+    st.markdown("---")
+    
+    # Docker action selection
+    docker_action = st.selectbox(
+        "Select Docker action:",
+        ["Launch new container", "Stop container", "Remove container", "Start container", 
+         "List all images", "List all containers", "Pull image from Hub", "Launch stack from plan",
+         "Batch container actions",
+         "Monitor resources"]
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Configuration")
+        
+        if docker_action == "Launch new container":
+            container_name = st.text_input("Container name:")
+            image_name = st.text_input("Image name (e.g., ubuntu:latest):")
+            
+            if st.button("🚀 Launch Container", use_container_width=True):
+                if container_name and image_name:
+                    command = f"docker run -dit --name={container_name} {image_name}"
+                    
+                    run_docker_action(command, target,
+                                      engine_call=lambda engine: f"🚀 Started {container_name} "
+                                                                 f"({engine.run(container_name, image_name)[:12]})")
+                else:
+                    st.error("Please provide container name and image name")
+        
+        elif docker_action == "Stop container":
+            container_name = st.text_input("Container name to stop:")
+            
+            if st.button("🛑 Stop Container", use_container_width=True):
+                if container_name:
+                    command = f"docker stop {container_name}"
+                    
+                    run_docker_action(command, target,
+                                      engine_call=lambda engine: engine.stop(container_name) or f"🛑 Stopped {container_name}")
+                else:
+                    st.error("Please provide container name")
+        
+        elif docker_action == "Remove container":
+            container_name = st.text_input("Container name to remove:")
+            
+            if st.button("🗑️ Remove Container", use_container_width=True):
+                if container_name:
+                    command = f"docker rm -f {container_name}"
+                    
+                    run_docker_action(command, target,
+                                      engine_call=lambda engine: engine.remove(container_name) or f"🗑️ Removed {container_name}")
+                else:
+                    st.error("Please provide container name")
+        
+        elif docker_action == "Start container":
+            container_name = st.text_input("Container name to start:")
+            
+            if st.button("▶️ Start Container", use_container_width=True):
+                if container_name:
+                    command = f"docker start {container_name}"
+                    
+                    run_docker_action(command, target,
+                                      engine_call=lambda engine: engine.start(container_name) or f"▶️ Started {container_name}")
+                else:
+                    st.error("Please provide container name")
+        
+        elif docker_action == "List all images":
+            if connection_mode != FLEET_MODE:
+                render_inventory("images", target)
+            elif st.button("📋 List Images", use_container_width=True):
+                run_docker_action("docker images", target)
+        
+        elif docker_action == "List all containers":
+            if connection_mode != FLEET_MODE:
+                render_inventory("containers", target)
+            elif st.button("📋 List Containers", use_container_width=True):
+                run_docker_action("docker ps -a", target)
+        
+        elif docker_action == "Pull image from Hub":
+            image_name = st.text_input("Image name to pull:")
+            
+            if st.button("⬇️ Pull Image", use_container_width=True):
+                if image_name:
+                    command = f"docker pull {image_name}"
+                    
+                    run_docker_action(command, target,
+                                      engine_call=lambda engine: engine.pull(image_name))
+                else:
+                    st.error("Please provide image name")
+        
+        elif docker_action == "Launch stack from plan":
+            if connection_mode == FLEET_MODE:
+                st.info("🌐 Launch plans run on one host: switch to Remote or Local mode")
+            else:
+                render_launch_plan(target)
+        
+        elif docker_action == "Batch container actions":
+            if connection_mode == FLEET_MODE:
+                st.info("🌐 Batch actions select containers on one host: switch to Remote or Local mode")
+            else:
+                render_batch_actions(target)
+        
+        elif docker_action == "Monitor resources":
+            if connection_mode == FLEET_MODE:
+                st.info("🌐 Resource monitoring follows one host: switch to Remote or Local mode")
+            else:
+                render_resource_monitor(target)
+        
+        render_command_stream("docker_stream")
+    
+    with col2:
+        st.subheader("📊 Docker Information")
+        
+        # Connection status
+        if connection_mode == REMOTE_MODE:
+            if remote_user and remote_ip:
+                st.success(f"🔗 Connected to: {remote_user}@{remote_ip}")
+            else:
+                st.warning("⚠️ Please provide remote username and IP address")
+        elif connection_mode == FLEET_MODE:
+            if target["hosts"]:
+                st.success(f"🌐 Targeting {len(target['hosts'])} hosts: "
+                           f"{', '.join(host.name for host in target['hosts'])}")
+            else:
+                st.warning("⚠️ Please select hosts or tags from the inventory")
+        else:
+            st.info("🖥️ Using local Docker installation")
+        
+        # Quick help
+        st.subheader("💡 Quick Help")
+        st.markdown("""
+        **🔗 Remote (SSH) Mode:**
+        - Enter remote username and IP address
+        - Commands execute on remote server via SSH
+        - Same functionality as your docker_menu.py
+        
+        **🌐 Fleet Mode:**
+        - Keep hosts in the inventory and select them by name or tag
+        - Every action runs on all selected hosts in parallel
+        
+        **🖥️ Local Mode:**
+        - Commands execute on your local machine
+        - Requires local Docker installation
+        
+        **Available Commands:**
+        - Launch new container (with -dit flags)
+        - Launch whole stacks from a YAML/JSON plan, in dependency order
+        - Stop/Start/Remove containers
+        - Batch stop/start/restart/remove by name pattern or label
+        - List images and containers
+        - Pull images from Docker Hub
+        - Monitor live CPU, memory, network and disk usage
+        """)
+        
+        # Command history, from the persistent command log
+        st.subheader("📝 Recent Commands")
+        if connection_mode == REMOTE_MODE and remote_user and remote_ip:
+            render_recent_commands(f"{remote_user}@{remote_ip}")
+        elif connection_mode == LOCAL_MODE:
+            render_recent_commands("local")
+        else:
+            render_recent_commands(None)
@@ -0,0 +1,134 @@
+"""
+Remote Linux Assistant section: pre-configured commands over SSH.
+"""
+import streamlit as st
+import subprocess
+from ssh_pool import get_ssh_pool
+from sections.command_output import start_command_stream, render_command_stream
+from sections.command_history import render_recent_commands
+
+def execute_remote_command(username, ip, command):
+    """Execute remote command via SSH"""
+    try:
+        if not username or not ip:
+            return "❌ Please provide both username and IP address"
+        
+        # Runs over the pooled connection to this host; only the first command pays the handshake
+        result = get_ssh_pool().run(username, ip, command, timeout=30)
+        if result.returncode == 0:
+            return f"✅ Success:\n{result.stdout}"
+        else:
+            return f"❌ Error:\n{result.stderr}"
+    except subprocess.TimeoutExpired:
+        return "⏰ Command timed out"
+    except FileNotFoundError:
+        return "❌ SSH command not found. Please ensure SSH is available"
+    except Exception as e:
+        return f"⚠️ Exception: {str(e)}"
+
+def stream_remote_command(username, ip, command):
+    """Run a remote command via SSH, streaming its output as it arrives"""
+    return get_ssh_pool().open_stream(username, ip, command)
+
+def render_linux_page():
+    """Render the Linux Remote Operations page"""
+    st.markdown('<div class="main-header"><h1>🐧 Remote Linux Assistant</h1><p>Execute remote Linux commands via SSH with 50+ pre-configured operations</p></div>', unsafe_allow_html=True)
+    
+    # Connection details
+    col1, col2 = st.columns(2)
+    with col1:
+        username = st.text_input("Remote Username:")
+    with col2:
+        ip_address = st.text_input("Remote IP Address:")
+    
+    # Commands dictionary
+    commands = {
+        "Show current date": "date",
+        "Show calendar": "cal",
+        "List files in current directory": "ls -l",
+        "Show current working directory": "pwd",
+        "Display disk usage": "df -h",
+        "Display memory usage": "free -m",
+        "Show currently logged in users": "who",
+        "Show system uptime": "uptime",
+        "Check system hostname": "hostname",
+        "Show running processes": "ps aux",
+        "Show open ports": "ss -tuln",
+        "Display network interfaces": "ip a",
+        "Display routing table": "ip r",
+        "Show kernel version": "uname -r",
+        "Check CPU info": "lscpu",
+        "Show block devices": "lsblk",
+        "List PCI devices": "lspci",
+        "List USB devices": "lsusb",
+        "View system journal (last 20 lines)": "journalctl -n 20",
+        "List all users": "cut -d: -f1 /etc/passwd",
+        "View last login info": "last",
+        "Display active services": "systemctl list-units --type=service",
+        "Check status of sshd service": "systemctl status sshd",
+        "Restart sshd service": "sudo systemctl restart sshd",
+        "Start firewalld service": "sudo systemctl start firewalld",
+        "Stop firewalld service": "sudo systemctl stop firewalld",
+        "Check firewall rules": "sudo firewall-cmd --list-all",
+        "List installed packages": "rpm -qa | less",
+        "Check SELinux status": "sestatus",
+        "Create a new user (useradd testuser)": "sudo useradd testuser",
+        "Delete a user (userdel testuser)": "sudo userdel testuser",
+        "Show disk partitions": "fdisk -l",
+        "Check system boot log": "dmesg | less",
+        "Edit network config (nmcli)": "nmcli",
+        "Ping google.com": "ping -c 4 google.com",
+        "Check DNS resolution": "nslookup google.com",
+        "Test internet connection (curl)": "curl -I http://google.com",
+        "Show crontab jobs": "crontab -l",
+        "Edit crontab": "crontab -e",
+        "Archive a directory (tar)": "tar -czf archive.tar.gz /etc",
+        "Extract archive (tar)": "tar -xzf archive.tar.gz",
+        "Find files (example: /etc)": "find /etc -name '*.conf'",
+        "Search text in files (grep)": "grep -r 'root' /etc",
+        "Monitor real-time CPU/memory usage": "top -n 1",
+        "Interactive system monitor": "htop",
+        "Check environment variables": "printenv",
+        "Update package cache (dnf)": "sudo dnf makecache",
+        "Install a package (wget)": "sudo dnf install -y wget",
+        "Remove a package (wget)": "sudo dnf remove -y wget",
+        "Reboot the system": "sudo reboot",
+        "Run custom command": "custom"
+    }
+    
+    # Command selection
+    selected_command = st.selectbox("Select command:", list(commands.keys()))
+    
+    # Custom command input
+    custom_command = ""
+    if selected_command == "Run custom command":
+        custom_command = st.text_input("Enter custom command:")
+    
+    stream_output = st.checkbox("📡 Stream output live", value=True,
+                                help="Show output line by line as it arrives, with a Cancel button")
+    
+    # Execute button
+    if st.button("🚀 Execute Command", use_container_width=True):
+        if username and ip_address:
+            command_to_execute = custom_command if selected_command == "Run custom command" else commands[selected_command]
+            
+            if stream_output:
+                try:
+                    start_command_stream("linux_stream", stream_remote_command(username, ip_address,
+                                                                               command_to_execute))
+                except subprocess.TimeoutExpired:
+                    st.error("⏰ Timed out connecting over SSH")
+                except FileNotFoundError:
+                    st.error("❌ SSH command not found. Please ensure SSH is available")
+            else:
+                with st.spinner(f"Executing: {selected_command}"):
+                    result = execute_remote_command(username, ip_address, command_to_execute)
+                    st.code(result, language="bash")
+        else:
+            st.error("Please provide username and IP address")
+    
+    render_command_stream("linux_stream")
+    
+    if username and ip_address:
+        st.subheader("📝 Recent Commands")
+        render_recent_commands(f"{username}@{ip_address}", limit=10)
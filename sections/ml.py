@@ -0,0 +1,213 @@
+"""
+Machine Learning Models section: construction cost, marks and salary predictors.
+"""
+import streamlit as st
+import os
+import pandas as pd
+from lazy_imports import lazy_import
+
+# Load ML models
+def load_ml_models():
+    """Load pre-trained ML models"""
+    if not st.session_state.ml_models_loaded:
+        try:
+            joblib = lazy_import("joblib")
+
+            # Load marks prediction model
+            marks_model_path = "my_marks_model.pkl"
+            if os.path.exists(marks_model_path):
+                st.session_state.marks_model = joblib.load(marks_model_path)
+            else:
+                st.session_state.marks_model = None
+                st.warning("Marks prediction model not found. Some features may be limited.")
+            
+            # Load salary prediction model
+            salary_model_path = "my_salary_model.pkl"
+            if os.path.exists(salary_model_path):
+                st.session_state.salary_model = joblib.load(salary_model_path)
+            else:
+                st.session_state.salary_model = None
+                st.warning("Salary prediction model not found. Some features may be limited.")
+            
+            # Construction cost model will be created on-demand
+            st.session_state.construction_model = None
+            
+            st.session_state.ml_models_loaded = True
+            return True
+        except Exception as e:
+            st.error(f"Error loading ML models: {e}")
+            return False
+    return True
+
+def render_construction_cost():
+    """Render Construction Cost Predictor"""
+    st.subheader("🏗️ Construction Cost Predictor")
+    st.write("Predict construction costs based on project specifications and materials.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Project Details**")
+        project_size = st.number_input("Project Size (sq ft)", min_value=100, max_value=10000, value=1500)
+        floors = st.number_input("Number of Floors", min_value=1, max_value=10, value=1)
+        location = st.selectbox("Location", ["Delhi", "Mumbai", "Chennai", "Bangalore", "Hyderabad"])
+        construction_type = st.selectbox("Construction Type", ["Residential", "Commercial", "Industrial"])
+        
+        st.write("**Materials**")
+        brick_quality = st.selectbox("Brick Quality", ["Fly ash", "Clay", "Concrete"])
+        wood_type = st.selectbox("Wood Type", ["Teak", "Engineered", "Pine"])
+        cement_grade = st.selectbox("Cement Grade", ["OPC 43", "PPC", "OPC 53"])
+        steel_grade = st.selectbox("Steel Grade", ["Fe415", "Fe500", "TMT"])
+        finish_quality = st.selectbox("Finish Quality", ["Basic", "Standard", "Premium"])
+    
+    with col2:
+        st.write("**Additional Parameters**")
+        labor_index = st.slider("Labor Index", min_value=50, max_value=150, value=85)
+        year = st.number_input("Construction Year", min_value=2020, max_value=2030, value=2024)
+        duration = st.number_input("Duration (months)", min_value=1, max_value=60, value=12)
+        
+        if st.button("💰 Predict Cost", use_container_width=True):
+            try:
+                # Validate inputs
+                if project_size <= 0:
+                    st.error("Project size must be greater than 0")
+                    return
+                if floors <= 0:
+                    st.error("Number of floors must be greater than 0")
+                    return
+                if labor_index <= 0:
+                    st.error("Labor index must be greater than 0")
+                    return
+                if duration <= 0:
+                    st.error("Duration must be greater than 0")
+                    return
+                
+                # Create input data
+                input_data = pd.DataFrame({
+                    'ProjectSize': [project_size],
+                    'Floors': [floors],
+                    'Location': [location],
+                    'BrickQuality': [brick_quality],
+                    'WoodType': [wood_type],
+                    'CementGrade': [cement_grade],
+                    'SteelGrade': [steel_grade],
+                    'FinishQuality': [finish_quality],
+                    'LaborIndex': [labor_index],
+                    'ConstructionType': [construction_type],
+                    'Year': [year],
+                    'Duration': [duration]
+                })
+                
+                # Create and train model (simplified version)
+                ensemble = lazy_import("sklearn.ensemble")
+                preprocessing = lazy_import("sklearn.preprocessing")
+                ColumnTransformer = lazy_import("sklearn.compose").ColumnTransformer
+                Pipeline = lazy_import("sklearn.pipeline").Pipeline
+
+                categorical_cols = ['Location', 'BrickQuality', 'WoodType', 'CementGrade',
+                                  'SteelGrade', 'FinishQuality', 'ConstructionType']
+                numerical_cols = ['ProjectSize', 'Floors', 'LaborIndex', 'Year', 'Duration']
+                
+                preprocessor = ColumnTransformer([
+                    ('cat', preprocessing.OneHotEncoder(handle_unknown='ignore'), categorical_cols),
+                    ('num', preprocessing.StandardScaler(), numerical_cols)
+                ])
+                
+                model = Pipeline(steps=[
+                    ('preprocessor', preprocessor),
+                    ('regressor', ensemble.RandomForestRegressor(n_estimators=100, random_state=42))
+                ])
+                
+                # Create training data
+                training_data = pd.DataFrame({
+                    'ProjectSize': [1500, 2500, 1800],
+                    'Floors': [1, 2, 1],
+                    'Location': ['Delhi', 'Mumbai', 'Chennai'],
+                    'BrickQuality': ['Fly ash', 'Clay', 'Concrete'],
+                    'WoodType': ['Teak', 'Engineered', 'Pine'],
+                    'CementGrade': ['OPC 43', 'PPC', 'OPC 53'],
+                    'SteelGrade': ['Fe415', 'Fe500', 'TMT'],
+                    'FinishQuality': ['Basic', 'Premium', 'Standard'],
+                    'LaborIndex': [85, 95, 88],
+                    'ConstructionType': ['Residential', 'Commercial', 'Residential'],
+                    'Year': [2020, 2022, 2021],
+                    'Duration': [10, 14, 12],
+                    'Cost': [1200000, 2100000, 1500000]
+                })
+                
+                X_train = training_data.drop('Cost', axis=1)
+                y_train = training_data['Cost']
+                
+                model.fit(X_train, y_train)
+                prediction = model.predict(input_data)[0]
+                
+                st.success(f"**Predicted Construction Cost: ₹{prediction:,.2f}**")
+                
+            except Exception as e:
+                st.error(f"Error predicting construction cost: {e}")
+                st.info("Please check your input values and try again")
+
+def render_marks_prediction():
+    """Render Student Marks Predictor"""
+    st.subheader("📚 Student Marks Predictor")
+    st.write("Predict pass/fail based on student marks.")
+    
+    marks = st.slider("Enter your marks:", min_value=0, max_value=100, value=75)
+    
+    if st.button("🎯 Predict Result", use_container_width=True):
+        if load_ml_models() and st.session_state.marks_model:
+            try:
+                # Validate input
+                if marks < 0 or marks > 100:
+                    st.error("Marks must be between 0 and 100")
+                    return
+                    
+                prediction = st.session_state.marks_model.predict([[marks]])
+                if prediction[0] == 1:
+                    st.success("🎉 **Result: PASS**")
+                else:
+                    st.error("❌ **Result: FAIL**")
+            except Exception as e:
+                st.error(f"Error predicting result: {e}")
+                st.info("Please try again with different marks")
+        else:
+            st.error("Model not available. Please check if the model file exists.")
+
+def render_salary_prediction():
+    """Render Salary Predictor"""
+    st.subheader("💼 Salary Predictor")
+    st.write("Predict salary based on years of experience.")
+    
+    years_experience = st.slider("Years of Experience:", min_value=0.0, max_value=60.0, value=5.0, step=0.1)
+    
+    if st.button("💰 Predict Salary", use_container_width=True):
+        if load_ml_models() and st.session_state.salary_model:
+            try:
+                # Validate input
+                if years_experience < 0:
+                    st.error("Years of experience cannot be negative")
+                    return
+                    
+                prediction = st.session_state.salary_model.predict([[years_experience]])
+                st.success(f"**Predicted Salary: ₹{prediction[0][0]:,.2f}**")
+            except Exception as e:
+                st.error(f"Error predicting salary: {e}")
+                st.info("Please try again with different experience")
+        else:
+            st.error("Model not available. Please check if the model file exists.")
+
+def render_ml_page():
+    """Render the main ML Models page"""
+    st.markdown('<div class="main-header"><h1>📈 Machine Learning Models</h1><p>Predict construction costs, student marks, and salary using trained ML models</p></div>', unsafe_allow_html=True)
+    
+    # Create tabs for different models
+    tab1, tab2, tab3 = st.tabs(["🏗️ Construction Cost", "📚 Student Marks", "💼 Salary"])
+    
+    with tab1:
+        render_construction_cost()
+    
+    with tab2:
+        render_marks_prediction()
+    
+    with tab3:
+        render_salary_prediction()
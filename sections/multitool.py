@@ -0,0 +1,211 @@
+"""
+Python Multi-Tool section backed by multitool_tasks.
+"""
+import streamlit as st
+import os
+import numpy as np
+from lazy_imports import lazy_import
+
+def render_python_utils():
+    """Render Python Utilities page using the actual multitool_tasks functions"""
+    st.markdown('<div class="main-header"><h1>🛠️ Python Multi-Tool</h1><p>System monitoring, messaging, web tools, and utility functions</p></div>', unsafe_allow_html=True)
+    
+    # Import the actual functions from multitool_tasks
+    try:
+        from multitool_tasks import (
+            monitor_ram, send_whatsapp_message_pywhatkit, send_email_gmail, 
+            send_whatsapp_twilio, send_sms, make_call, google_search, 
+            download_basic_website, send_anonymous_email, list_vs_tuple_comparison, 
+            capture_image, swap_faces
+        )
+        FUNCTIONS_LOADED = True
+    except Exception as e:
+        st.error(f"Error loading multitool functions: {e}")
+        FUNCTIONS_LOADED = False
+        return
+    
+    # Tool selection
+    tool_option = st.selectbox(
+        "Select a tool:",
+        [
+            "Monitor RAM",
+            "Send WhatsApp Message (PyWhatKit)",
+            "Send Email (Gmail)",
+            "Send WhatsApp Message (Twilio)",
+            "Send SMS (Twilio)",
+            "Make a Call (Twilio)",
+            "Google Search",
+            "Download Website HTML",
+            "Send Anonymous Email (Mailgun)",
+            "List vs Tuple Comparison",
+            "Capture Image",
+            "Swap Faces in 2 Images"
+        ]
+    )
+    
+    # Input fields with conditional rendering
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Initialize variables
+        phone_input = None
+        message_input = None
+        email_input = None
+        subject_input = None
+        body_input = None
+        search_input = None
+        url_input = None
+        
+        # Show relevant inputs based on tool selection
+        if tool_option in ["Send WhatsApp Message (PyWhatKit)", "Send WhatsApp Message (Twilio)", "Send SMS (Twilio)", "Make a Call (Twilio)"]:
+            phone_input = st.text_input("Phone Number", key="phone_input")
+            
+        if tool_option in ["Send WhatsApp Message (PyWhatKit)", "Send WhatsApp Message (Twilio)", "Send SMS (Twilio)"]:
+            message_input = st.text_area("Message", key="message_input")
+            
+        if tool_option in ["Send Email (Gmail)", "Send Anonymous Email (Mailgun)"]:
+            email_input = st.text_input("Recipient Email", key="email_input")
+            subject_input = st.text_input("Subject", key="subject_input")
+            body_input = st.text_area("Body", key="body_input")
+            
+        if tool_option == "Google Search":
+            search_input = st.text_input("Search Query", key="search_input")
+            
+        if tool_option == "Download Website HTML":
+            url_input = st.text_input("Website URL", key="url_input")
+    
+    with col2:
+        # Image upload for face swap
+        img1_input = None
+        img2_input = None
+        
+        if tool_option == "Swap Faces in 2 Images":
+            img1_input = st.file_uploader("Face 1", type=['jpg', 'jpeg', 'png'], key="img1")
+            img2_input = st.file_uploader("Face 2", type=['jpg', 'jpeg', 'png'], key="img2")
+            
+            if img1_input:
+                st.image(img1_input, caption="Face 1", use_column_width=True)
+            if img2_input:
+                st.image(img2_input, caption="Face 2", use_column_width=True)
+    
+    # Output area
+    output_area = st.empty()
+    
+    # Run button
+    if st.button("🚀 Run Task", use_container_width=True):
+        if not FUNCTIONS_LOADED:
+            st.error("Functions not loaded properly")
+            return
+            
+        try:
+            if tool_option == "Monitor RAM":
+                result = monitor_ram()
+                st.success(result)
+                
+            elif tool_option == "Send WhatsApp Message (PyWhatKit)":
+                if phone_input and message_input:
+                    result = send_whatsapp_message_pywhatkit(phone_input, message_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide phone number and message")
+                    
+            elif tool_option == "Send Email (Gmail)":
+                if email_input and subject_input and body_input:
+                    result = send_email_gmail(email_input, subject_input, body_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide email, subject, and body")
+                    
+            elif tool_option == "Send WhatsApp Message (Twilio)":
+                if phone_input and message_input:
+                    result = send_whatsapp_twilio(phone_input, message_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide phone number and message")
+                    
+            elif tool_option == "Send SMS (Twilio)":
+                if phone_input and message_input:
+                    result = send_sms(phone_input, message_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide phone number and message")
+                    
+            elif tool_option == "Make a Call (Twilio)":
+                if phone_input:
+                    result = make_call(phone_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide phone number")
+                    
+            elif tool_option == "Google Search":
+                if search_input:
+                    results = google_search(search_input)
+                    if isinstance(results, list) and results:
+                        formatted = "\n\n".join([
+                            f"{i+1}. {r['title']}\n🔗 {r['link']}\n📝 {r['snippet']}" 
+                            for i, r in enumerate(results)
+                        ])
+                        st.success("Search Results:")
+                        st.text(formatted)
+                    else:
+                        st.warning("No results found or API key not configured")
+                else:
+                    st.error("Please provide search query")
+                    
+            elif tool_option == "Download Website HTML":
+                if url_input:
+                    result = download_basic_website(url_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide website URL")
+                    
+            elif tool_option == "Send Anonymous Email (Mailgun)":
+                if email_input and subject_input and body_input:
+                    result = send_anonymous_email(email_input, subject_input, body_input)
+                    st.info(result)
+                else:
+                    st.error("Please provide email, subject, and body")
+                    
+            elif tool_option == "List vs Tuple Comparison":
+                result = list_vs_tuple_comparison()
+                st.success("Performance Analysis Results:")
+                st.code(result, language="text")
+                
+            elif tool_option == "Capture Image":
+                result = capture_image()
+                st.info(result)
+                # Try to display the captured image
+                try:
+                    if os.path.exists("digital_image.jpg"):
+                        st.image("digital_image.jpg", caption="Captured Image", use_column_width=True)
+                except Exception as e:
+                    st.warning(f"Could not display captured image: {e}")
+                    
+            elif tool_option == "Swap Faces in 2 Images":
+                if img1_input and img2_input:
+                    try:
+                        cv2 = lazy_import("cv2")
+                        Image = lazy_import("PIL.Image")
+
+                        # Convert uploaded files to numpy arrays
+                        img1_array = np.array(Image.open(img1_input))
+                        img2_array = np.array(Image.open(img2_input))
+                        
+                        # Convert RGB to BGR for OpenCV
+                        img1_bgr = cv2.cvtColor(img1_array, cv2.COLOR_RGB2BGR)
+                        img2_bgr = cv2.cvtColor(img2_array, cv2.COLOR_RGB2BGR)
+                        
+                        msg, path = swap_faces(img1_bgr, img2_bgr)
+                        st.info(msg)
+                        
+                        if path and os.path.exists(path):
+                            st.image(path, caption="Swapped Result", use_column_width=True)
+                    except Exception as e:
+                        st.error(f"Error in face swap: {e}")
+                        st.info("Make sure both images contain clear faces and are in supported formats")
+                else:
+                    st.error("Please upload both images")
+                    
+        except Exception as e:
+            st.error(f"Error executing task: {e}")
+            st.error("Make sure you have configured the necessary API keys in your .env file")
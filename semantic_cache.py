@@ -0,0 +1,308 @@
+"""
+Semantic tier of the LLM response cache.
+
+Prompts that differ only in phrasing ("A marketplace for renting camera
+gear." vs "marketplace for renting camera gear among hobbyists") miss the
+exact-hash response cache. This tier embeds the variable part of a prompt
+locally with signed feature hashing of content words and character
+trigrams (no embedding service), and finds the most similar earlier prompt
+in the same scope (tool, section, model) by cosine similarity over an
+in-memory NumPy matrix. A hit above the threshold returns that prompt's
+completion. The vectors are lexical: they match rewordings and typos, not
+synonyms, which keeps false hits rare at the default threshold. Prompts
+whose numbers or negations differ never match, however similar: "transfer
+500 euros" and "do not transfer 900 euros" are not interchangeable.
+
+Entries persist in SQLite together with their vectors, so the index is
+rebuilt at startup without re-embedding. The index is bounded; the least
+recently used entries are evicted first.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+from lazy_imports import lazy_import
+from response_cache import CACHE_DIR
+from text_similarity import normalize_text
+
+SEMANTIC_CACHE_PATH = os.path.join(CACHE_DIR, "semantic_cache.sqlite3")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+NEGATIONS = frozenset(("not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without",
+                       "cannot"))
+DEFAULT_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "20000"))
+DEFAULT_DIM = 256
+ENABLED = os.getenv("SEMANTIC_CACHE", "1").lower() not in ("0", "false", "no")
+
+# Trigrams tolerate typos and inflections; content words carry the meaning
+TRIGRAM_WEIGHT = 0.25
+STOP_WORDS = frozenset(
+    "a an the and or but of for to in on at by with from into about between among "
+    "is are was were be been it its this that these those as our my your their".split()
+)
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def critical_tokens(text):
+    """Numbers and negation words, which change a prompt's meaning however small the edit"""
+    text = normalize_text(text).lower().replace("\u2019", "'")
+    negations = {word for word in _WORD.findall(text) if word in NEGATIONS or word.endswith("n't")}
+    return sorted(_NUMBER.findall(text)), negations
+
+
+class HashingVectorizer:
+    """Maps text to a unit vector of signed, hashed content words and trigrams"""
+
+    def __init__(self, dim=DEFAULT_DIM, trigram_weight=TRIGRAM_WEIGHT):
+        self.dim = dim
+        self.trigram_weight = trigram_weight
+
+    def features(self, text):
+        """Return (features, weights): content words at 1.0, character trigrams lighter"""
+        text = " ".join(_PUNCTUATION.sub(" ", normalize_text(text).lower()).split())
+        padded = f" {text} "
+        grams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+        words = [f"w:{word}" for word in text.split() if word not in STOP_WORDS]
+        return grams + words, [self.trigram_weight] * len(grams) + [1.0] * len(words)
+
+    def transform(self, text):
+        np = lazy_import("numpy")
+        vector = np.zeros(self.dim, dtype=np.float32)
+        features, weights = self.features(text)
+        if not features:
+            return vector
+        # crc32 is stable across processes, unlike hash(), so stored vectors stay valid
+        hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features), dtype=np.uint32,
+                             count=len(features))
+        signed = np.asarray(weights, dtype=np.float32) * np.where(hashes & 0x80000000, -1.0, 1.0)
+        np.add.at(vector, (hashes % self.dim).astype(np.intp), signed.astype(np.float32))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """Bounded nearest-neighbour cache of completions keyed by prompt meaning"""
+
+    def __init__(self, path=SEMANTIC_CACHE_PATH, threshold=DEFAULT_THRESHOLD,
+                 max_entries=DEFAULT_MAX_ENTRIES, dim=DEFAULT_DIM):
+        np = lazy_import("numpy")
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.vectorizer = HashingVectorizer(dim)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Near matches turned down because their numbers or negations differ
+        self.rejected = 0
+
+        # Row i of _vectors belongs to entry _ids[i]; rows [0, _count) are live
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._scopes = np.zeros(0, dtype=np.int32)
+        self._last_access = np.zeros(0, dtype=np.float64)
+        self._count = 0
+        self._rows = {}
+        self._scope_codes = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " id INTEGER PRIMARY KEY, scope TEXT NOT NULL, prompt TEXT NOT NULL,"
+            " response TEXT NOT NULL, vector BLOB NOT NULL,"
+            " created REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_scope_prompt ON entries (scope, prompt)")
+        self._db.commit()
+        self._load()
+
+    def _load(self):
+        np = self._np()
+        # Rows beyond the size bound (e.g. after lowering it) are dropped
+        self._db.execute(
+            "DELETE FROM entries WHERE id NOT IN"
+            " (SELECT id FROM entries ORDER BY last_access DESC LIMIT ?)", (self.max_entries,)
+        )
+        self._db.commit()
+        rows = [row for row in self._db.execute("SELECT id, scope, vector, last_access FROM entries")
+                if len(row[2]) == self.vectorizer.dim * 4]
+        if not rows:
+            return
+        self._reserve(len(rows))
+        count = len(rows)
+        self._vectors[:count] = np.frombuffer(b"".join(row[2] for row in rows),
+                                              dtype=np.float32).reshape(count, self.vectorizer.dim)
+        self._ids[:count] = [row[0] for row in rows]
+        self._scopes[:count] = [self._scope_code(row[1]) for row in rows]
+        self._last_access[:count] = [row[3] for row in rows]
+        self._rows = {row[0]: index for index, row in enumerate(rows)}
+        self._count = count
+
+    @staticmethod
+    def _np():
+        return lazy_import("numpy")
+
+    def _reserve(self, size):
+        np = self._np()
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2, 64)
+        vectors = np.zeros((new_capacity, self.vectorizer.dim), dtype=np.float32)
+        vectors[:self._count] = self._vectors[:self._count]
+        self._vectors = vectors
+        for name, dtype in (("_ids", np.int64), ("_scopes", np.int32), ("_last_access", np.float64)):
+            grown = np.zeros(new_capacity, dtype=dtype)
+            grown[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, grown)
+
+    def _scope_code(self, scope):
+        code = self._scope_codes.get(scope)
+        if code is None:
+            code = self._scope_codes[scope] = len(self._scope_codes)
+        return code
+
+    def _append(self, entry_id, scope, vector, last_access):
+        self._reserve(self._count + 1)
+        row = self._count
+        self._vectors[row] = vector
+        self._ids[row] = entry_id
+        self._scopes[row] = self._scope_code(scope)
+        self._last_access[row] = last_access
+        self._rows[entry_id] = row
+        self._count += 1
+
+    def _remove_row(self, row):
+        # Move the last live row into the hole so live rows stay contiguous
+        last = self._count - 1
+        del self._rows[int(self._ids[row])]
+        if row != last:
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = self._ids[last]
+            self._scopes[row] = self._scopes[last]
+            self._last_access[row] = self._last_access[last]
+            self._rows[int(self._ids[row])] = row
+        self._count -= 1
+
+    def _nearest(self, scope, vector):
+        code = self._scope_codes.get(scope)
+        if code is None or not self._count:
+            return None, 0.0
+        np = self._np()
+        scores = self._vectors[:self._count] @ vector
+        scores[self._scopes[:self._count] != code] = -1.0
+        row = int(np.argmax(scores))
+        return row, float(scores[row])
+
+    def lookup(self, scope, prompt, threshold=None):
+        """Return (similarity, response) for the closest prompt in scope, or None"""
+        threshold = self.threshold if threshold is None else threshold
+        vector = self.vectorizer.transform(prompt)
+        with self._lock:
+            row, score = self._nearest(scope, vector)
+            if row is None or score < threshold:
+                self.misses += 1
+                return None
+            entry_id = int(self._ids[row])
+            found = self._db.execute("SELECT response, prompt FROM entries WHERE id = ?", (entry_id,)).fetchone()
+            if found is None:
+                self._remove_row(row)
+                self.misses += 1
+                return None
+            if critical_tokens(found[1]) != critical_tokens(prompt):
+                self.rejected += 1
+                self.misses += 1
+                return None
+            now = time.time()
+            self._last_access[row] = now
+            self._db.execute("UPDATE entries SET last_access = ? WHERE id = ?", (now, entry_id))
+            self._db.commit()
+            self.hits += 1
+            return score, found[0]
+
+    def put(self, scope, prompt, response):
+        """Add a completion; re-putting the same normalized prompt replaces its response"""
+        vector = self.vectorizer.transform(prompt)
+        normalized = normalize_text(prompt).lower()
+        now = time.time()
+        with self._lock:
+            existing = self._db.execute(
+                "SELECT id FROM entries WHERE scope = ? AND prompt = ?", (scope, normalized)
+            ).fetchone()
+            if existing is not None and existing[0] in self._rows:
+                self._db.execute("UPDATE entries SET response = ?, last_access = ? WHERE id = ?",
+                                 (response, now, existing[0]))
+                self._last_access[self._rows[existing[0]]] = now
+                self._db.commit()
+                return
+            cursor = self._db.execute(
+                "INSERT INTO entries (scope, prompt, response, vector, created, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (scope, normalized, response, vector.tobytes(), now, now)
+            )
+            self._append(cursor.lastrowid, scope, vector, now)
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        np = self._np()
+        # Evict in batches of 1% so eviction is not paid on every insert at capacity
+        excess = max(excess, self.max_entries // 100)
+        oldest = np.argsort(self._last_access[:self._count])[:excess]
+        doomed = [int(self._ids[row]) for row in oldest]
+        for entry_id in doomed:
+            self._remove_row(self._rows[entry_id])
+        self._db.executemany("DELETE FROM entries WHERE id = ?", [(entry_id,) for entry_id in doomed])
+
+    def clear(self):
+        with self._lock:
+            self._count = 0
+            self._rows.clear()
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+
+    def __len__(self):
+        return self._count
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._count,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "rejected": self.rejected,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "threshold": self.threshold,
+                "index_bytes": int(self._vectors.nbytes),
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_cache():
+    """Return the semantic cache shared by every session in this process"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SemanticCache()
+    return _cache
+
+
+def peek_semantic_cache():
+    """The shared semantic cache if something has created it, else None; never loads the index"""
+    return _cache
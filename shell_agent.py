@@ -0,0 +1,296 @@
+"""
+AI Shell Assistant: a reusable ReAct agent with a cached command tool.
+
+The agent and its run_cmd tool are built once per LLM client and reused by
+every request. Commands run through a cross-platform executor (PowerShell
+on Windows, pwsh or a POSIX shell elsewhere). Results of commands that are
+classified as read-only ("ps", "ip addr", "Get-Process", ...) are cached
+for a short TTL, and so are whole answers to questions that only needed
+read-only commands, so repeated questions skip both the subprocess and the
+agent's reasoning steps.
+"""
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+
+from lazy_imports import lazy_import
+from llm_gateway import get_llm_gateway
+from text_similarity import normalize_text
+
+COMMAND_TIMEOUT = float(os.getenv("SHELL_AGENT_TIMEOUT", "10"))
+CACHE_TTL = float(os.getenv("SHELL_AGENT_CACHE_TTL", "30"))
+CACHE_ENTRIES = int(os.getenv("SHELL_AGENT_CACHE_ENTRIES", "256"))
+MAX_AGENTS = 4
+
+# First words of commands that only inspect the system
+READ_ONLY_POSIX = {
+    "ls", "ps", "df", "du", "free", "uptime", "whoami", "hostname", "id", "who", "w",
+    "uname", "date", "pwd", "cat", "head", "tail", "wc", "grep", "egrep", "sort", "uniq",
+    "cut", "lsblk", "lscpu", "lsusb", "lspci", "lsof", "netstat", "ss", "ifconfig",
+    "which", "printenv", "echo", "stat", "file", "nproc", "vmstat", "iostat",
+    "top", "dig", "nslookup", "getent", "last", "findmnt", "dmesg",
+}
+READ_ONLY_POWERSHELL = {
+    "ipconfig", "tasklist", "systeminfo", "hostname", "whoami", "dir", "ls", "type",
+    "netstat", "ver", "where", "echo", "select-object", "where-object", "sort-object",
+    "format-table", "format-list", "measure-object", "select-string", "out-string",
+}
+# Subcommands that keep an otherwise mutating tool read-only
+READ_ONLY_SUBCOMMANDS = {
+    "ip": {"a", "addr", "address", "r", "route", "link", "neigh", "-br", "-4", "-6"},
+    "systemctl": {"status", "list-units", "list-unit-files", "is-active", "is-enabled", "show"},
+    "docker": {"ps", "images", "info", "version", "inspect", "stats", "logs"},
+    "git": {"status", "log", "diff", "show", "branch"},
+}
+# Words that turn one of those subcommands into a change ("ip link set", "ip route add")
+MUTATING_WORDS = {"set", "add", "del", "delete", "flush", "change", "replace", "append", "save", "restore"}
+# Flags that make an allowlisted command (or "command subcommand") mutate state;
+# "--flag=value" is matched by its "--flag" part
+WRITE_FLAGS = {
+    "ipconfig": {"/release", "/renew", "/flushdns", "/registerdns"},
+    "date": {"-s", "--set"},
+    "dmesg": {"-c", "-C", "--clear", "--read-clear"},
+    "sort": {"-o"},
+    "hostname": {"-b", "--boot", "-F", "--file"},
+    "git branch": {"-d", "-D", "--delete", "-m", "-M", "--move", "-c", "-C", "--copy", "-f", "--force",
+                   "-u", "--set-upstream-to", "--unset-upstream", "--edit-description"},
+}
+# Commands that only read when given no positional arguments ("hostname NAME" renames the host)
+BARE_ONLY = {"hostname", "ifconfig"}
+# "git branch NAME" creates a branch unless one of these makes it a listing
+GIT_BRANCH_LIST_FLAGS = {"-l", "--list", "-a", "--all", "-r", "--remotes", "--contains", "--no-contains",
+                         "--merged", "--no-merged", "--points-at", "--format", "--sort"}
+
+_SEPARATORS = re.compile(r"\|\||&&|[|;\n]")
+_UNSAFE = re.compile(r">|<|`|\$\(|\b(tee|xargs)\b")
+
+
+def is_read_only(command):
+    """True when every stage of a command line only inspects the system"""
+    command = command.strip()
+    if not command or _UNSAFE.search(command):
+        return False
+    for stage in _SEPARATORS.split(command):
+        words = stage.strip().split()
+        if not words:
+            continue
+        name = words[0].lower()
+        if name.endswith(".exe"):
+            name = name[:-4]
+        if name in READ_ONLY_SUBCOMMANDS:
+            if len(words) < 2 or words[1].lower() not in READ_ONLY_SUBCOMMANDS[name]:
+                return False
+            if any(word.lower() in MUTATING_WORDS for word in words[2:]):
+                return False
+        elif name.startswith("get-") or name.startswith("test-"):
+            # PowerShell verbs that only read
+            continue
+        elif name not in READ_ONLY_POSIX and name not in READ_ONLY_POWERSHELL:
+            return False
+        # Windows "/switch" flags are case-insensitive, "-f" and "-F" usually are not
+        flags = {word.split("=", 1)[0] for word in words[1:] if word.startswith("-")}
+        flags |= {word.lower() for word in words[1:] if word.startswith("/")}
+        positional = [word for word in words[1:] if not word.startswith("-")]
+        if name in BARE_ONLY and positional:
+            return False
+        write_flags = set(WRITE_FLAGS.get(name, ()))
+        if len(words) > 1:
+            write_flags |= WRITE_FLAGS.get(f"{name} {words[1].lower()}", set())
+        if flags & write_flags or any(flag.startswith("--output") for flag in flags):
+            return False
+        if name == "git" and words[1].lower() == "branch" and positional[1:] \
+                and not flags & GIT_BRANCH_LIST_FLAGS:
+            return False
+    return True
+
+
+class ShellExecutor:
+    """Runs a command line in the shell available on this host"""
+
+    def __init__(self, shell=None, timeout=COMMAND_TIMEOUT):
+        self.shell = shell or os.getenv("SHELL_AGENT_SHELL") or self.detect_shell()
+        self.timeout = timeout
+
+    @staticmethod
+    def detect_shell():
+        if os.name == "nt":
+            return "powershell"
+        for candidate in ("bash", "sh"):
+            if shutil.which(candidate):
+                return candidate
+        return "pwsh"
+
+    @property
+    def is_powershell(self):
+        return self.shell in ("powershell", "pwsh")
+
+    @property
+    def description(self):
+        if self.is_powershell:
+            return "a PowerShell command on Windows" if os.name == "nt" else "a PowerShell (pwsh) command"
+        return f"a {self.shell} shell command on Linux/Unix"
+
+    def argv(self, command):
+        if self.is_powershell:
+            # -NoProfile skips loading user profiles, which dominates PowerShell startup
+            return [self.shell, "-NoProfile", "-NonInteractive", "-Command", command]
+        return [self.shell, "-c", command]
+
+    def run(self, command):
+        """Run command and return the output in the tool's display format"""
+        try:
+            result = subprocess.run(self.argv(command), capture_output=True, text=True, timeout=self.timeout)
+            if result.returncode == 0:
+                return f"✅ Output:\n{result.stdout.strip()}"
+            else:
+                return f"❌ Error:\n{result.stderr.strip()}"
+        except Exception as e:
+            return f"⚠️ Exception: {str(e)}"
+
+
+class TTLCache:
+    """Small thread-safe LRU whose entries expire after ttl seconds"""
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ShellAgent:
+    """One ReAct agent plus its run_cmd tool, shared by every request"""
+
+    def __init__(self, llm, executor=None, ttl=CACHE_TTL):
+        self.llm = llm
+        self.executor = executor or ShellExecutor()
+        self.command_cache = TTLCache(ttl)
+        self.answer_cache = TTLCache(ttl)
+        self.commands_run = 0
+        self._lock = threading.Lock()
+        # Commands issued by the agent run on the current thread
+        self._run_state = threading.local()
+
+        tools = lazy_import("langchain.tools")
+        agents = lazy_import("langchain.agents")
+        self.tool = tools.Tool(
+            name="run_cmd",
+            func=self.run_command,
+            description=f"Runs {self.executor.description} and returns the output."
+        )
+        self.agent = agents.initialize_agent(
+            tools=[self.tool],
+            llm=llm,
+            agent=agents.AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+            verbose=False
+        )
+
+    def run_command(self, command):
+        """run_cmd tool body: serve read-only commands from the cache"""
+        command = command.strip().strip("`").strip()
+        read_only = is_read_only(command)
+        log = getattr(self._run_state, "commands", None)
+        if log is not None:
+            log.append((command, read_only))
+
+        key = (self.executor.shell, command)
+        if read_only:
+            cached = self.command_cache.get(key)
+            if cached is not None:
+                return cached
+        output = self.executor.run(command)
+        # The agent may call the tool from several threads
+        with self._lock:
+            self.commands_run += 1
+        if read_only and output.startswith("✅"):
+            self.command_cache.put(key, output)
+        return output
+
+    def run(self, query):
+        """
+        Answer a natural-language request.
+
+        Returns (answer, commands, cached): the commands the agent issued as
+        (command, read_only) pairs, and whether the answer came from the cache.
+        """
+        key = normalize_text(query).lower()
+        cached = self.answer_cache.get(key)
+        if cached is not None:
+            answer, commands = cached
+            return answer, commands, True
+
+        self._run_state.commands = []
+        try:
+            # One gateway slot covers the whole ReAct loop
+            answer = get_llm_gateway().limited(lambda: self.agent.run(query))
+            commands = self._run_state.commands
+        finally:
+            self._run_state.commands = None
+        # Only answers that never changed anything are safe to replay
+        if commands and all(read_only for _, read_only in commands):
+            self.answer_cache.put(key, (answer, commands))
+        return answer, commands, False
+
+    def stats(self):
+        return {
+            "shell": self.executor.shell,
+            "commands_run": self.commands_run,
+            "command_cache_hits": self.command_cache.hits,
+            "answer_cache_hits": self.answer_cache.hits,
+            "cached_commands": len(self.command_cache),
+            "cached_answers": len(self.answer_cache),
+        }
+
+    def clear_cache(self):
+        self.command_cache.clear()
+        self.answer_cache.clear()
+
+
+_agents = OrderedDict()
+_agents_lock = threading.Lock()
+
+
+def get_shell_agent(llm):
+    """Return the shell agent built for this LLM client, building it once"""
+    # Keyed by identity: the pool hands out the same client object until it
+    # rebuilds the bundle; the entry keeps llm alive so ids are not reused
+    with _agents_lock:
+        agent = _agents.get(id(llm))
+        if agent is None or agent.llm is not llm:
+            agent = _agents[id(llm)] = ShellAgent(llm)
+            while len(_agents) > MAX_AGENTS:
+                _agents.popitem(last=False)
+        _agents.move_to_end(id(llm))
+        return agent
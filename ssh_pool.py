@@ -0,0 +1,342 @@
+"""
+Pooled, multiplexed SSH connections.
+
+Every remote command used to start a fresh `ssh user@host "cmd"` and pay
+for TCP setup, key exchange and authentication. The pool keeps one OpenSSH
+ControlMaster connection per (user, host) and runs each command as a new
+channel over that master socket, so only the first command to a host pays
+the handshake. Masters send keepalives, are closed after SSH_IDLE_TIMEOUT
+seconds without use (by OpenSSH's ControlPersist and by the pool's own
+sweep), and at most SSH_POOL_MAX_HOSTS are kept open (least recently used
+closed first). A master with a command or stream running over it is never
+closed by the pool. SSH_MAX_SESSIONS caps concurrent commands per host,
+below sshd's default MaxSessions of 10.
+
+Commands are passed to ssh as one argument, never through a local shell.
+Platforms without ControlMaster support (Windows) fall back to one
+connection per command.
+"""
+import glob
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from command_log import log_command
+from command_stream import CommandStream
+
+SSH_BINARY = os.getenv("SSH_BINARY", "ssh")
+IDLE_TIMEOUT = int(os.getenv("SSH_IDLE_TIMEOUT", "300"))
+KEEPALIVE_INTERVAL = int(os.getenv("SSH_KEEPALIVE_INTERVAL", "15"))
+MAX_SESSIONS = int(os.getenv("SSH_MAX_SESSIONS", "8"))
+MAX_HOSTS = int(os.getenv("SSH_POOL_MAX_HOSTS", "32"))
+CONNECT_TIMEOUT = int(os.getenv("SSH_CONNECT_TIMEOUT", "10"))
+DEFAULT_TIMEOUT = 30
+MULTIPLEXING = os.name != "nt" and os.getenv("SSH_MULTIPLEXING", "1").lower() not in ("0", "false", "no")
+
+
+class RemoteResult:
+    """Exit status, output and wall time of one remote command"""
+
+    def __init__(self, returncode, stdout, stderr, duration, reused):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        # True when the command ran over an already open master connection
+        self.reused = reused
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+class _Master:
+    """One ControlMaster connection and the per-host session limit"""
+
+    def __init__(self, target, control_path):
+        self.target = target
+        self.control_path = control_path
+        self.sessions = threading.BoundedSemaphore(MAX_SESSIONS)
+        self.lock = threading.Lock()
+        self.started = False
+        self.last_used = time.monotonic()
+        self.commands = 0
+        # Commands between _get_master() and _release(), and open_stream() streams still running
+        self.active = 0
+        self.streams = set()
+
+    @property
+    def busy(self):
+        return self.active > 0 or bool(self.streams)
+
+
+class SSHPool:
+    """Process-wide pool of multiplexed SSH connections keyed by (user, host)"""
+
+    def __init__(self, control_dir=None, idle_timeout=IDLE_TIMEOUT, max_hosts=MAX_HOSTS,
+                 multiplexing=MULTIPLEXING):
+        # Unix socket paths are limited to ~100 bytes, so keep the directory short
+        self.control_dir = control_dir or os.path.join(tempfile.gettempdir(), f"dash-ssh-{os.getuid()}"
+                                                       if hasattr(os, "getuid") else "dash-ssh")
+        self.idle_timeout = idle_timeout
+        self.max_hosts = max_hosts
+        self.multiplexing = multiplexing
+        self._masters = OrderedDict()
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.commands = 0
+        self.reused = 0
+        if multiplexing:
+            os.makedirs(self.control_dir, mode=0o700, exist_ok=True)
+
+    def _options(self, control_path=None, batch=True):
+        # Only pooled connections are non-interactive; a direct one may still prompt
+        options = ["-o", "BatchMode=yes"] if batch else []
+        options += [
+            "-o", f"ConnectTimeout={CONNECT_TIMEOUT}",
+            "-o", f"ServerAliveInterval={KEEPALIVE_INTERVAL}",
+            "-o", "ServerAliveCountMax=3",
+        ]
+        if control_path:
+            options += ["-o", f"ControlPath={control_path}"]
+        return options
+
+    def _get_master(self, username, host):
+        """The master for username@host, held until _release() so it is not closed meanwhile"""
+        target = f"{username}@{host}"
+        with self._lock:
+            closing = self._sweep_locked()
+            master = self._masters.get(target)
+            if master is None:
+                digest = hashlib.sha1(target.encode("utf-8")).hexdigest()[:16]
+                master = _Master(target, os.path.join(self.control_dir, digest))
+                self._masters[target] = master
+            self._masters.move_to_end(target)
+            master.last_used = time.monotonic()
+            master.active += 1
+            # Least recently used idle masters make room; busy ones may keep the pool over its cap
+            for name, oldest in list(self._masters.items()):
+                if len(self._masters) <= self.max_hosts:
+                    break
+                if oldest is not master and not oldest.busy:
+                    del self._masters[name]
+                    closing.append(oldest)
+        # `ssh -O exit` can take seconds; never while holding the pool lock
+        for victim in closing:
+            self._close_master(victim)
+        return master
+
+    def _release(self, master):
+        with self._lock:
+            master.active -= 1
+            master.last_used = time.monotonic()
+
+    def _ensure_started(self, master):
+        """Open the master connection unless a live one exists; returns True if reused"""
+        with master.lock:
+            # A master that died removes its socket; a stale one makes ssh connect directly
+            if master.started and os.path.exists(master.control_path):
+                return True
+            # The backgrounded master must not inherit our pipes, or run() would wait on it
+            subprocess.run(
+                [SSH_BINARY, *self._options(master.control_path),
+                 "-o", "ControlMaster=yes", "-o", f"ControlPersist={self.idle_timeout}",
+                 "-M", "-N", "-f", master.target],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=CONNECT_TIMEOUT + 5, check=True
+            )
+            master.started = True
+            with self._lock:
+                self.connections_opened += 1
+            return False
+
+    def _close_master(self, master):
+        """Close a master already removed from the pool; called without the pool lock"""
+        with master.lock:
+            if not master.started:
+                return
+            try:
+                subprocess.run([SSH_BINARY, *self._options(master.control_path), "-O", "exit", master.target],
+                               stdin=subprocess.DEVNULL, capture_output=True, timeout=CONNECT_TIMEOUT)
+            except (OSError, subprocess.SubprocessError):
+                pass
+            # Forwarded sockets are not unlinked by ssh itself
+            for path in glob.glob(f"{master.control_path}.*"):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            master.started = False
+        with self._lock:
+            self.connections_closed += 1
+
+    def _sweep_locked(self):
+        """Remove idle masters from the pool and return them for closing"""
+        now = time.monotonic()
+        closing = []
+        for target, master in list(self._masters.items()):
+            if not master.busy and now - master.last_used > self.idle_timeout:
+                del self._masters[target]
+                closing.append(master)
+        return closing
+
+    def _direct_args(self, target, command):
+        return [SSH_BINARY, *self._options(batch=False), target, command]
+
+    def _pooled_args(self, master, command):
+        return [SSH_BINARY, *self._options(master.control_path), "-o", "ControlMaster=no",
+                master.target, command]
+
+    def command_args(self, username, host, command):
+        """
+        argv for running command over the pooled connection in a process the
+        caller manages. Such processes do not count against SSH_MAX_SESSIONS,
+        and nothing keeps the master open for them: prefer open_stream().
+
+        Raises subprocess.TimeoutExpired when the master connection cannot be
+        set up in time and FileNotFoundError when the ssh client is missing.
+        """
+        if not self.multiplexing:
+            return self._direct_args(f"{username}@{host}", command)
+        master = self._get_master(username, host)
+        try:
+            return self._master_args(master, command)
+        finally:
+            self._release(master)
+
+    def _master_args(self, master, command):
+        try:
+            self._ensure_started(master)
+        except subprocess.CalledProcessError:
+            return self._direct_args(master.target, command)
+        return self._pooled_args(master, command)
+
+    def open_stream(self, username, host, command, **options):
+        """
+        An unstarted CommandStream running command over the pooled connection;
+        its master stays open until the stream ends. options are passed on to
+        CommandStream. Raises like command_args().
+        """
+        target = f"{username}@{host}"
+        options = {"label": f"{target}: {command}", "host": target, "command": command, **options}
+        if not self.multiplexing:
+            return CommandStream(self._direct_args(target, command), **options)
+        master = self._get_master(username, host)
+        try:
+            args = self._master_args(master, command)
+            stream = CommandStream(args, on_exit=lambda finished: self._end_stream(master, finished), **options)
+            with self._lock:
+                master.streams.add(stream)
+        finally:
+            self._release(master)
+        return stream
+
+    def _end_stream(self, master, stream):
+        with self._lock:
+            master.streams.discard(stream)
+            master.last_used = time.monotonic()
+
+    def run(self, username, host, command, timeout=DEFAULT_TIMEOUT):
+        """
+        Run command on username@host and return a RemoteResult.
+
+        Raises subprocess.TimeoutExpired on timeout and FileNotFoundError when
+        the ssh client is missing. If the master cannot be opened (e.g. the
+        host needs a password prompt) the command runs on its own connection.
+        """
+        start = time.perf_counter()
+        reused = False
+        try:
+            if not self.multiplexing:
+                args = self._direct_args(f"{username}@{host}", command)
+                completed = subprocess.run(args, capture_output=True, text=True, timeout=timeout)
+            else:
+                master = self._get_master(username, host)
+                try:
+                    with master.sessions:
+                        try:
+                            reused = self._ensure_started(master)
+                            args = self._pooled_args(master, command)
+                        except subprocess.CalledProcessError:
+                            args = self._direct_args(master.target, command)
+                        completed = subprocess.run(args, capture_output=True, text=True, timeout=timeout)
+                        master.commands += 1
+                finally:
+                    self._release(master)
+        except subprocess.TimeoutExpired:
+            log_command(f"{username}@{host}", "ssh", command, None, time.perf_counter() - start, status="timeout")
+            raise
+        duration = time.perf_counter() - start
+        with self._lock:
+            self.commands += 1
+            self.reused += int(reused)
+        log_command(f"{username}@{host}", "ssh", command, completed.returncode, duration,
+                    len(completed.stdout) + len(completed.stderr))
+        return RemoteResult(completed.returncode, completed.stdout, completed.stderr, duration, reused)
+
+    def forward_socket(self, username, host, remote_path):
+        """
+        Forward a unix socket on the host (e.g. the Docker socket) to a local
+        socket over the pooled master connection and return the local path.
+        """
+        if not self.multiplexing:
+            raise RuntimeError("Socket forwarding needs SSH connection multiplexing")
+        master = self._get_master(username, host)
+        try:
+            self._ensure_started(master)
+            local_path = f"{master.control_path}.{hashlib.sha1(remote_path.encode('utf-8')).hexdigest()[:8]}"
+            with master.lock:
+                if not os.path.exists(local_path):
+                    subprocess.run(
+                        [SSH_BINARY, *self._options(master.control_path), "-O", "forward",
+                         "-L", f"{local_path}:{remote_path}", master.target],
+                        stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=CONNECT_TIMEOUT,
+                        check=True
+                    )
+        finally:
+            self._release(master)
+        return local_path
+
+    def close(self, username=None, host=None):
+        """Close one host's master connection, or all of them"""
+        with self._lock:
+            targets = [f"{username}@{host}"] if username and host else list(self._masters)
+            closing = [self._masters.pop(target) for target in targets if target in self._masters]
+        for master in closing:
+            self._close_master(master)
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "multiplexing": self.multiplexing,
+                "open_connections": sum(1 for master in self._masters.values() if master.started),
+                "max_hosts": self.max_hosts,
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "commands": self.commands,
+                "reused": self.reused,
+                "hosts": [
+                    {"host": target, "commands": master.commands, "idle_seconds": round(now - master.last_used, 1)}
+                    for target, master in self._masters.items() if master.started
+                ],
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_ssh_pool():
+    """Return the SSH connection pool shared by every session in this process"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SSHPool()
+    return _pool
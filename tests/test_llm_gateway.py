@@ -0,0 +1,36 @@
+import pytest
+
+from llm_gateway import LLMGateway
+from rate_limit import AdaptiveConcurrencyLimiter
+
+
+class _Interrupted(BaseException):
+    """Stands in for Streamlit's RerunException / StopException"""
+
+
+def test_slot_released_when_fn_raises_base_exception():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=1)
+    gateway = LLMGateway(rate=100, burst=100, limiter=limiter, queue_timeout=1)
+
+    def interrupted():
+        raise _Interrupted()
+
+    with pytest.raises(_Interrupted):
+        gateway.limited(interrupted)
+    assert limiter.in_flight == 0
+    # The freed slot is usable again
+    assert gateway.limited(lambda: "ok") == "ok"
+    assert limiter.in_flight == 0
+
+
+def test_slot_released_and_throttle_counted_on_error():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, minimum=1, maximum=2)
+    gateway = LLMGateway(rate=100, burst=100, limiter=limiter, queue_timeout=1)
+
+    def throttled():
+        raise RuntimeError("429 Resource has been exhausted")
+
+    with pytest.raises(RuntimeError):
+        gateway.limited(throttled)
+    assert limiter.in_flight == 0
+    assert gateway.throttled == 1
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from llm_hedging import hedged_stream
+
+
+class _Stream:
+    """A streaming response that yields chunks after a delay until closed"""
+
+    def __init__(self, first_chunk_after, chunks=5):
+        self.first_chunk_after = first_chunk_after
+        self.chunks = chunks
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        if self.closed.wait(self.first_chunk_after):
+            return
+        for n in range(self.chunks):
+            if self.closed.is_set():
+                return
+            yield f"chunk {n} "
+
+    def close(self):
+        self.closed.set()
+
+
+class _Rerun(BaseException):
+    """Stands in for Streamlit's RerunException raised while rendering"""
+
+
+def test_both_streams_closed_when_on_text_raises():
+    primary, hedge = _Stream(0.2), _Stream(2.0)
+
+    def on_text(text):
+        raise _Rerun()
+
+    with pytest.raises(_Rerun):
+        hedged_stream("test-on-text-raises", lambda: primary, lambda: hedge, on_text=on_text, delay=0.05)
+    assert primary.closed.wait(1)
+    assert hedge.closed.wait(1)
+
+
+def test_loser_closed_after_winner_finishes():
+    primary, hedge = _Stream(2.0), _Stream(0.1)
+
+    result = hedged_stream("test-hedge-wins", lambda: primary, lambda: hedge, delay=0.05)
+    assert result.text.startswith("chunk 0")
+    assert primary.closed.wait(1)
@@ -0,0 +1,52 @@
+import pytest
+
+from shell_agent import is_read_only
+
+
+@pytest.mark.parametrize("command", [
+    "ls -la /tmp",
+    "ps aux | grep python | sort",
+    "ip addr",
+    "git status",
+    "git branch",
+    "git branch -a",
+    "git branch --list 'feature/*'",
+    "git branch --contains HEAD~3",
+    "date",
+    "date +%s",
+    "date -d tomorrow",
+    "hostname",
+    "hostname -f",
+    "hostname -I",
+    "ipconfig /all",
+    "Get-Process | Sort-Object CPU",
+])
+def test_read_only(command):
+    assert is_read_only(command)
+
+
+@pytest.mark.parametrize("command", [
+    "",
+    "rm -rf /tmp/x",
+    "ls > out.txt",
+    "ip link set eth0 down",
+    "git branch -D x",
+    "git branch -d x",
+    "git branch --delete x",
+    "git branch -m a b",
+    "git branch -M a b",
+    "git branch --move a b",
+    "git branch new-feature",
+    "date -s '2020-01-01 00:00'",
+    "date --set='2020-01-01 00:00'",
+    "date --set 2020-01-01",
+    "hostname NAME",
+    "hostname -b NAME",
+    "hostname -F /etc/hostname",
+    "ipconfig /RELEASE",
+    "dmesg -C",
+    "sort -o out.txt in.txt",
+    "ls && touch x",
+])
+def test_mutating(command):
+    assert not is_read_only(command)
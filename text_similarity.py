@@ -0,0 +1,79 @@
+"""
+Local text normalization and near-duplicate search.
+
+NgramIndex is an inverted index over character trigrams. Queries use prefix
+filtering: only the rarest trigrams of the query are looked up, which is
+enough to find every entry that can still reach the similarity threshold.
+Candidates are then scored exactly with the Dice coefficient.
+"""
+import math
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    """Unicode-normalize and collapse whitespace so trivially different copies match"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def char_ngrams(text, n=3):
+    """Return the set of padded character n-grams of a lower-cased text"""
+    padded = f" {text.lower()} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def dice(a, b):
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+class NgramIndex:
+    """Trigram inverted index returning entries above a Dice similarity threshold"""
+
+    def __init__(self, n=3):
+        self.n = n
+        self._grams = {}
+        self._postings = {}
+
+    def __len__(self):
+        return len(self._grams)
+
+    def add(self, key, text):
+        if key in self._grams:
+            self.remove(key)
+        grams = char_ngrams(text, self.n)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key):
+        for gram in self._grams.pop(key, ()):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, text, threshold=0.8, limit=5):
+        """Return up to `limit` (score, key) pairs with Dice >= threshold, best first"""
+        query = char_ngrams(text, self.n)
+        # Any match shares at least threshold*|q|/(2-threshold) grams with the
+        # query, so it must contain one of the |q| - that + 1 rarest grams
+        min_overlap = max(1, math.ceil(threshold * len(query) / (2.0 - threshold)))
+        by_rarity = sorted(query, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set()
+        for gram in by_rarity[:len(query) - min_overlap + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        scored = []
+        for key in candidates:
+            score = dice(query, self._grams[key])
+            if score >= threshold:
+                scored.append((score, key))
+        scored.sort(reverse=True)
+        return scored[:limit]
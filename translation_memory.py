@@ -0,0 +1,162 @@
+"""
+Segment-level translation memory.
+
+Translations are stored in SQLite keyed by (normalized segment, target
+language), so repeated headers, boilerplate and UI strings are served
+without another LLM call and survive restarts. A trigram index per language
+surfaces near-duplicate segments as suggestions. The number of LLM calls
+saved by exact hits is persisted alongside the entries.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from response_cache import CACHE_DIR
+from text_similarity import normalize_text, NgramIndex
+
+MEMORY_PATH = os.path.join(CACHE_DIR, "translation_memory.sqlite3")
+
+
+class TranslationMemory:
+    """Exact-match store with optional near-duplicate lookups"""
+
+    def __init__(self, path=MEMORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._indexes = {}
+        self.exact_hits = 0
+        self.misses = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            " id INTEGER PRIMARY KEY, language TEXT NOT NULL, normalized TEXT NOT NULL,"
+            " translation TEXT NOT NULL, created REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0,"
+            " UNIQUE (language, normalized))"
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._db.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('saved_calls', 0)")
+        self._db.commit()
+
+    def lookup(self, text, language):
+        """Return the stored translation of an identical segment, or None"""
+        normalized = normalize_text(text)
+        if not normalized:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, translation FROM segments WHERE language = ? AND normalized = ?",
+                (language, normalized)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE segments SET hits = hits + 1 WHERE id = ?", (row[0],))
+            self._db.execute("UPDATE meta SET value = value + 1 WHERE key = 'saved_calls'")
+            self._db.commit()
+            self.exact_hits += 1
+            return row[1]
+
+    def lookup_segment(self, text, language):
+        """Look up a multi-line segment whole, or line by line if every line is known"""
+        translation = self.lookup(text, language)
+        if translation is not None or "\n" not in text:
+            return translation
+
+        translated_lines = []
+        with self._lock:
+            for line in text.split("\n"):
+                normalized = normalize_text(line)
+                if not normalized:
+                    translated_lines.append(line)
+                    continue
+                row = self._db.execute(
+                    "SELECT translation FROM segments WHERE language = ? AND normalized = ?",
+                    (language, normalized)
+                ).fetchone()
+                if row is None:
+                    return None
+                translated_lines.append(row[0])
+            # The misses counted by lookup() above turned out to be a hit
+            self.misses -= 1
+            self.exact_hits += 1
+            self._db.execute("UPDATE meta SET value = value + 1 WHERE key = 'saved_calls'")
+            self._db.commit()
+        return "\n".join(translated_lines)
+
+    def put(self, text, language, translation):
+        normalized = normalize_text(text)
+        if not normalized:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO segments (language, normalized, translation, created) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (language, normalized) DO UPDATE SET translation = excluded.translation",
+                (language, normalized, translation, time.time())
+            )
+            self._db.commit()
+            index = self._indexes.get(language)
+            if index is not None:
+                row_id = self._db.execute(
+                    "SELECT id FROM segments WHERE language = ? AND normalized = ?",
+                    (language, normalized)
+                ).fetchone()[0]
+                index.add(row_id, normalized)
+
+    def similar(self, text, language, threshold=0.8, limit=3):
+        """Return (score, source, translation) for near-duplicate stored segments"""
+        normalized = normalize_text(text)
+        if not normalized:
+            return []
+        with self._lock:
+            index = self._index_for(language)
+            matches = index.search(normalized, threshold=threshold, limit=limit)
+            results = []
+            for score, row_id in matches:
+                row = self._db.execute(
+                    "SELECT normalized, translation FROM segments WHERE id = ?", (row_id,)
+                ).fetchone()
+                if row is not None:
+                    results.append((score, row[0], row[1]))
+            return results
+
+    def stats(self):
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+            saved = self._db.execute("SELECT value FROM meta WHERE key = 'saved_calls'").fetchone()[0]
+        return {
+            "entries": entries,
+            "exact_hits": self.exact_hits,
+            "misses": self.misses,
+            "saved_calls": saved,
+        }
+
+    def _index_for(self, language):
+        # Built lazily from the store the first time a language is searched
+        index = self._indexes.get(language)
+        if index is None:
+            index = NgramIndex()
+            for row_id, normalized in self._db.execute(
+                "SELECT id, normalized FROM segments WHERE language = ?", (language,)
+            ):
+                index.add(row_id, normalized)
+            self._indexes[language] = index
+        return index
+
+
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory():
+    """Return the translation memory shared by every session in this process"""
+    global _memory
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                _memory = TranslationMemory()
+    return _memory